@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Build minified, pre-compressed static assets for Axiom Forge PWA
+Copies the deployed hosting tree (see firebase.json) into dist/, minifies
+JS and CSS, and writes max-level .br and .gz siblings for every text asset
+so a host that serves pre-compressed files never compresses on the fly.
+
+Files are processed in parallel, and a manifest of source hashes lets
+unchanged files be skipped. A size report lists before/after bytes per file
+and for the first-load payload (the assets sw.js precaches).
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import brotli
+import rcssmin
+import rjsmin
+
+from build_sw import collect_assets, load_hosting_config, walk_public
+
+# Bump when the minify or compression settings change so every file rebuilds
+PIPELINE_VERSION = 1
+
+# Paths
+DIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'dist')
+MANIFEST_FILE = 'asset-manifest.json'
+
+COMPRESSIBLE = ('.html', '.js', '.css', '.json', '.svg', '.txt', '.md', '.xml', '.webmanifest')
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+def minify(rel_path, data):
+    """Minify JS and CSS; everything else (and *.min.*) passes through"""
+    if '.min.' in rel_path:
+        return data
+    if rel_path.endswith('.js'):
+        return rjsmin.jsmin(data.decode('utf-8')).encode('utf-8')
+    if rel_path.endswith('.css'):
+        return rcssmin.cssmin(data.decode('utf-8')).encode('utf-8')
+    return data
+
+def build_file(public_dir, dist_dir, rel_path):
+    """Worker: write one file (and its .br/.gz siblings) to dist; return its byte counts"""
+    with open(os.path.join(public_dir, rel_path), 'rb') as f:
+        source = f.read()
+    output = minify(rel_path, source)
+    out_path = os.path.join(dist_dir, rel_path)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, 'wb') as f:
+        f.write(output)
+
+    sizes = {'source': len(source), 'minified': len(output)}
+    if rel_path.endswith(COMPRESSIBLE):
+        br = brotli.compress(output, quality=11)
+        # mtime=0 keeps the .gz bytes reproducible
+        gz = gzip.compress(output, compresslevel=9, mtime=0)
+        with open(out_path + '.br', 'wb') as f:
+            f.write(br)
+        with open(out_path + '.gz', 'wb') as f:
+            f.write(gz)
+        sizes.update(br=len(br), gz=len(gz))
+    return sha256(source), sizes
+
+def outputs_exist(dist_dir, rel_path, entry):
+    paths = [rel_path] + ([rel_path + '.br', rel_path + '.gz'] if 'br' in entry['sizes'] else [])
+    return all(os.path.exists(os.path.join(dist_dir, path)) for path in paths)
+
+def remove_outputs(dist_dir, rel_path):
+    for path in (rel_path, rel_path + '.br', rel_path + '.gz'):
+        full_path = os.path.join(dist_dir, path)
+        if os.path.exists(full_path):
+            os.remove(full_path)
+
+def print_size_report(manifest, first_load):
+    """Per-file and first-load bytes: source, minified, gzip and brotli"""
+    print(f"\n{'file':<36} {'source':>9} {'minified':>9} {'gzip':>8} {'brotli':>8}")
+    rows = sorted(((path, entry['sizes']) for path, entry in manifest.items() if 'br' in entry['sizes']),
+                  key=lambda row: -row[1]['source'])
+    for path, sizes in rows:
+        print(f"{path:<36} {sizes['source']:>9,} {sizes['minified']:>9,} {sizes['gz']:>8,} {sizes['br']:>8,}")
+
+    totals = {'source': 0, 'minified': 0, 'gz': 0, 'br': 0}
+    for path in first_load:
+        sizes = manifest[path]['sizes']
+        for key in totals:
+            # Binary assets (icons) go over the wire as they are
+            totals[key] += sizes.get(key, sizes['minified'])
+    print(f"\n📦 First-load payload ({len(first_load)} precached files): "
+          f"{totals['source']:,} source → {totals['minified']:,} minified → "
+          f"{totals['gz']:,} gzip / {totals['br']:,} brotli "
+          f"({1 - totals['br'] / totals['source']:.1%} smaller)")
+
+def build_assets(workers=None, force=False):
+    """Build dist/; return the list of files that were rebuilt"""
+    public_dir, ignore = load_hosting_config()
+    dist_dir = os.path.normpath(DIST_DIR)
+    deployed = walk_public(public_dir, ignore)
+    print(f"🏗️  Building {len(deployed)} files from {public_dir} into {dist_dir}")
+
+    manifest_path = os.path.join(dist_dir, MANIFEST_FILE)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.pop('__version__', None) != PIPELINE_VERSION:
+            manifest = {}
+
+    jobs = []
+    for url in sorted(deployed):
+        rel_path = url.lstrip('/')
+        entry = manifest.get(rel_path)
+        with open(os.path.join(public_dir, rel_path), 'rb') as f:
+            source_hash = sha256(f.read())
+        if (not force and entry and entry['sha256'] == source_hash
+                and outputs_exist(dist_dir, rel_path, entry)):
+            continue
+        jobs.append(rel_path)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {rel_path: pool.submit(build_file, public_dir, dist_dir, rel_path) for rel_path in jobs}
+        for rel_path, future in futures.items():
+            source_hash, sizes = future.result()
+            manifest[rel_path] = {'sha256': source_hash, 'sizes': sizes}
+
+    removed = [rel_path for rel_path in manifest if '/' + rel_path not in deployed]
+    for rel_path in removed:
+        remove_outputs(dist_dir, rel_path)
+        del manifest[rel_path]
+
+    with open(manifest_path, 'w') as f:
+        json.dump({'__version__': PIPELINE_VERSION, **manifest}, f, indent=2, sort_keys=True)
+
+    print(f"✅ Rebuilt {len(jobs)}, skipped {len(deployed) - len(jobs)} unchanged, removed {len(removed)}")
+
+    precache, errors = collect_assets(public_dir, deployed)
+    if errors:
+        for error in errors:
+            print(f"⚠️  {error}")
+    first_load = sorted({'index.html' if url == '/' else url.lstrip('/') for url in precache})
+    print_size_report(manifest, first_load)
+    return jobs
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Build minified, pre-compressed assets into dist/.')
+    parser.add_argument('--workers', type=int, default=None, help='build processes (default: one per CPU)')
+    parser.add_argument('--force', action='store_true', help='rebuild every file, ignoring the manifest')
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args()
+    build_assets(workers=args.workers, force=args.force)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Generate the service worker precache manifest for Axiom Forge PWA
+Walks the hosting public tree, follows every local asset referenced from
+index.html (stylesheets, scripts, icons, ES module imports, workers) and
+rewrites the PRECACHE_MANIFEST block in sw.js with a content-hash revision
+per file, so a deploy only makes clients re-download what changed.
+
+The build fails when a referenced asset is missing or excluded from hosting.
+--check only reports whether sw.js is up to date.
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import posixpath
+import re
+import sys
+
+# Paths
+FIREBASE_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'firebase.json')
+SW_FILE = 'sw.js'
+ENTRY_POINT = '/index.html'
+
+# Precached even though no page references them (install prompt icons)
+EXTRA_ASSETS = ['/', '/assets/icons/icon-192.png', '/assets/icons/icon-512.png']
+
+HTML_REF_RE = re.compile(r'<(?:script|link|img)\b[^>]*?\b(?:src|href)=["\']([^"\']+)["\']', re.I)
+JS_IMPORT_RE = re.compile(r'''\b(?:import|export)\s*(?:[\w*{}\s,$]*?\bfrom\s*)?['"]([^'"]+)['"]''')
+JS_DYNAMIC_IMPORT_RE = re.compile(r'''\bimport\(\s*['"]([^'"]+)['"]\s*\)''')
+JS_WORKER_RE = re.compile(r'''\bnew\s+(?:Shared)?Worker\(\s*[`'"]([^`'"?$]+)''')
+CSS_URL_RE = re.compile(r'''url\(\s*['"]?([^'")]+)['"]?\s*\)''')
+MANIFEST_BLOCK_RE = re.compile(
+    r'(// BEGIN PRECACHE MANIFEST[^\n]*\n).*?(// END PRECACHE MANIFEST)', re.S)
+
+def load_hosting_config(path=FIREBASE_CONFIG):
+    """Return (public dir, ignore globs) from firebase.json"""
+    with open(path) as f:
+        hosting = json.load(f)['hosting']
+    public = os.path.normpath(os.path.join(os.path.dirname(path), hosting['public']))
+    return public, hosting.get('ignore', [])
+
+def is_ignored(rel_path, ignore):
+    """Match firebase's ignore globs, where **/ also matches the top level"""
+    for pattern in ignore:
+        if fnmatch.fnmatch(rel_path, pattern):
+            return True
+        if pattern.startswith('**/') and fnmatch.fnmatch(rel_path, pattern[3:]):
+            return True
+    return False
+
+def walk_public(public_dir, ignore):
+    """Return the set of deployed URL paths ('/js/main.js')"""
+    deployed = set()
+    for root, dirs, files in os.walk(public_dir):
+        for name in files:
+            rel_path = os.path.relpath(os.path.join(root, name), public_dir).replace(os.sep, '/')
+            if not is_ignored(rel_path, ignore):
+                deployed.add('/' + rel_path)
+    return deployed
+
+def is_local(ref):
+    return not re.match(r'^(?:[a-z][a-z0-9+.-]*:|//|#)', ref, re.I)
+
+def resolve(base_url, ref):
+    """Resolve a relative reference against the URL path of the file it appears in"""
+    ref = ref.split('#')[0].split('?')[0]
+    if ref.startswith('/'):
+        return posixpath.normpath(ref)
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base_url), ref))
+
+def find_references(url, text):
+    """Local URL paths referenced by one HTML, JS, CSS or web manifest file"""
+    if url.endswith('.html'):
+        refs = [(url, ref) for ref in HTML_REF_RE.findall(text)]
+    elif url.endswith('.js'):
+        refs = [(url, ref) for ref in JS_IMPORT_RE.findall(text) + JS_DYNAMIC_IMPORT_RE.findall(text)]
+        # Worker scripts resolve against the page, not the module
+        refs += [(ENTRY_POINT, ref) for ref in JS_WORKER_RE.findall(text)]
+    elif url.endswith('.css'):
+        refs = [(url, ref) for ref in CSS_URL_RE.findall(text)]
+    elif url.endswith('manifest.json'):
+        refs = [(url, icon['src']) for icon in json.loads(text).get('icons', [])]
+    else:
+        refs = []
+    return {resolve(base, ref) for base, ref in refs if is_local(ref)}
+
+def collect_assets(public_dir, deployed):
+    """Follow references from the entry point; return (precache paths, errors)
+
+    Icons listed in manifest.json are checked but not precached, since the
+    browser only fetches the ones it needs.
+    """
+    precache = set()
+    errors = []
+    pending = [(ENTRY_POINT, 'entry point', True)] + [(url, 'EXTRA_ASSETS', True) for url in EXTRA_ASSETS]
+    seen = set()
+    while pending:
+        url, referrer, cache = pending.pop()
+        if (url, cache) in seen:
+            continue
+        seen.add((url, cache))
+        if url != '/' and url not in deployed:
+            exists = os.path.exists(os.path.join(public_dir, url.lstrip('/')))
+            reason = 'excluded by the firebase.json ignore rules' if exists else 'missing'
+            errors.append(f"{url} (referenced from {referrer}) is {reason}")
+            continue
+        if cache:
+            precache.add(url)
+        if url == '/' or os.path.splitext(url)[1] not in ('.html', '.js', '.css', '.json'):
+            continue
+        with open(os.path.join(public_dir, url.lstrip('/')), encoding='utf-8') as f:
+            text = f.read()
+        cache_refs = cache and not url.endswith('manifest.json')
+        pending.extend((ref, url, cache_refs) for ref in find_references(url, text))
+    return precache, errors
+
+def file_revision(public_dir, url):
+    """Short content hash; '/' is served the same bytes as /index.html"""
+    path = os.path.join(public_dir, 'index.html' if url == '/' else url.lstrip('/'))
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+def render_manifest(entries):
+    lines = ['const PRECACHE_MANIFEST = [']
+    lines += [f"    {{ url: '{url}', revision: '{revision}' }}," for url, revision in entries]
+    lines.append('];')
+    return '\n'.join(lines) + '\n'
+
+def build_sw(check=False):
+    """Regenerate the precache manifest in sw.js; return a list of errors"""
+    public_dir, ignore = load_hosting_config()
+    deployed = walk_public(public_dir, ignore)
+    print(f"🔎 Scanning {public_dir} ({len(deployed)} deployed files)")
+
+    precache, errors = collect_assets(public_dir, deployed)
+    if errors:
+        return sorted(errors)
+
+    entries = [(url, file_revision(public_dir, url)) for url in sorted(precache)]
+    sw_path = os.path.join(public_dir, SW_FILE)
+    with open(sw_path, encoding='utf-8') as f:
+        sw_source = f.read()
+    if not MANIFEST_BLOCK_RE.search(sw_source):
+        return [f"{SW_FILE} has no PRECACHE MANIFEST block"]
+
+    old_entries = dict(re.findall(r"url: '([^']+)', revision: '([^']+)'", sw_source))
+    updated = MANIFEST_BLOCK_RE.sub(lambda m: m.group(1) + render_manifest(entries) + m.group(2), sw_source)
+    for url, revision in entries:
+        if url not in old_entries:
+            print(f"🆕 {url} {revision}")
+        elif old_entries[url] != revision:
+            print(f"🔄 {url} {old_entries[url]} → {revision}")
+    for url in sorted(set(old_entries) - precache):
+        print(f"🗑️  {url} (no longer referenced)")
+
+    if updated == sw_source:
+        print(f"\n✅ {SW_FILE} is up to date ({len(entries)} precached assets)")
+    elif check:
+        return [f"{SW_FILE} is out of date; run build_sw.py"]
+    else:
+        with open(sw_path, 'w', encoding='utf-8') as f:
+            f.write(updated)
+        print(f"\n✨ Wrote {len(entries)} precached assets to {SW_FILE}")
+    return []
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate the sw.js precache manifest.')
+    parser.add_argument('--check', action='store_true',
+                        help='fail if sw.js is out of date instead of rewriting it')
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args()
+    errors = build_sw(check=args.check)
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        print(f"❌ Build failed: {len(errors)} problem(s)")
+        sys.exit(1)
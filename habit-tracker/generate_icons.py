@@ -2,19 +2,166 @@
 """
 Generate PNG icons from SVG source for Axiom Forge PWA
 Creates all required icon sizes for iOS, Android, and web manifest
+
+The SVG is read and parsed once per render task and rasterised only at a few
+anchor sizes; every other size is downsampled from the smallest anchor at
+least as large. Anchor groups render in parallel, and a manifest of the SVG
+hash, render options and output hashes per size lets unchanged icons be
+skipped. --per-size renders every size straight from the SVG instead, and
+--verify checks the icons against that per-size rendering.
+
+Every PNG is losslessly recompressed (or palette-quantised with --palette),
+WebP variants are written alongside (AVIF with --avif), and a byte report
+shows the saving on the icons sw.js pre-caches.
 """
 
-import cairosvg
+import argparse
+import hashlib
+import io
+import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from cairosvg.parser import Tree
+from cairosvg.surface import PNGSurface
+from PIL import Image, ImageChops, ImageStat, features
 
 # Icon sizes needed for the PWA
 ICON_SIZES = [72, 96, 128, 144, 152, 180, 192, 384, 512]
 
+# Sizes rasterised directly from the SVG; the rest are downsampled from these
+ANCHOR_SIZES = [192, 512]
+
+# Largest mean per-channel difference (0-255) --verify accepts
+MAX_MEAN_DIFF = 2.0
+
+# Icons sw.js pre-caches on install
+PRECACHED_SIZES = [180, 192, 512]
+
 # Paths
 SVG_SOURCE = 'assets/logo-white-back.svg'
 OUTPUT_DIR = 'assets/icons'
+MANIFEST_FILE = f'{OUTPUT_DIR}/icons-manifest.json'
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+def load_svg(data):
+    """Parse SVG bytes once"""
+    return Tree(bytestring=data)
+
+def rasterise(tree, size):
+    """Render a parsed SVG to a size x size RGBA image"""
+    output = io.BytesIO()
+    PNGSurface(tree, output, 96, output_width=size, output_height=size).finish()
+    output.seek(0)
+    return Image.open(output).convert('RGBA')
+
+def anchor_for(size, anchors):
+    """Smallest anchor at least as large as size (the largest if none is)"""
+    return min((a for a in anchors if a >= size), default=max(anchors))
+
+def encode(icon, format, **params):
+    output = io.BytesIO()
+    icon.save(output, format, **params)
+    return output.getvalue()
+
+def encode_variants(icon, size, palette=None, webp=True, avif=False):
+    """Optimisation stage: return (plain PNG bytes, {file name: bytes}) for one icon
+
+    The PNG is recompressed losslessly, or quantised to a palette of that
+    many colours (the logo is flat black and white plus anti-aliased edges).
+    """
+    if palette:
+        png = encode(icon.quantize(colors=palette, method=Image.Quantize.FASTOCTREE,
+                                   dither=Image.Dither.NONE), 'PNG', optimize=True)
+    else:
+        png = encode(icon, 'PNG', optimize=True)
+    files = {f'icon-{size}.png': png}
+    if webp:
+        files[f'icon-{size}.webp'] = encode(icon, 'WEBP', lossless=True, method=6)
+    if avif:
+        files[f'icon-{size}.avif'] = encode(icon, 'AVIF', quality=80)
+    return len(encode(icon, 'PNG')), files
+
+def render_group(svg_data, anchor, sizes, options):
+    """Worker: rasterise one anchor and encode the sizes derived from it
 
-def generate_icons():
+    Returns {size: (plain PNG bytes, {file name: bytes})}.
+    """
+    source = rasterise(load_svg(svg_data), anchor)
+    icons = {}
+    for size in sizes:
+        icon = source if size == anchor else source.resize((size, size), Image.LANCZOS)
+        icons[size] = encode_variants(icon, size, **options)
+    return icons
+
+def load_manifest():
+    if os.path.exists(MANIFEST_FILE):
+        with open(MANIFEST_FILE) as f:
+            return json.load(f)
+    return {}
+
+def is_current(entry, expected):
+    """True if the manifest entry matches the inputs and its outputs are untouched"""
+    if entry is None or any(entry.get(key) != value for key, value in expected.items()):
+        return False
+    for name, digest in entry['outputs'].items():
+        path = f'{OUTPUT_DIR}/{name}'
+        if not os.path.exists(path):
+            return False
+        with open(path, 'rb') as f:
+            if sha256(f.read()) != digest:
+                return False
+    return True
+
+def print_byte_report(manifest, sizes):
+    """Per-icon bytes before and after optimisation, and the sw.js install payload"""
+    print(f"\n{'icon':<10} {'plain png':>10} {'optimised':>10} {'saved':>7}  variants")
+    for size in sizes:
+        entry = manifest.get(str(size))
+        if entry is None or 'bytes' not in entry:
+            continue
+        png = entry['bytes'][f'icon-{size}.png']
+        saved = 1 - png / entry['plain_png_bytes']
+        variants = '  '.join(f"{name.rsplit('.', 1)[1]} {count:,}"
+                             for name, count in sorted(entry['bytes'].items()) if not name.endswith('.png'))
+        print(f"{size:<10} {entry['plain_png_bytes']:>10,} {png:>10,} {saved:>7.1%}  {variants}")
+    # Entries written before byte counts were recorded have no 'bytes'
+    precached = [(size, manifest[str(size)]) for size in PRECACHED_SIZES
+                 if 'bytes' in manifest.get(str(size), {})]
+    before = sum(entry['plain_png_bytes'] for _, entry in precached)
+    after = sum(entry['bytes'][f'icon-{size}.png'] for size, entry in precached)
+    if before:
+        print(f"📦 sw.js install payload ({', '.join(map(str, PRECACHED_SIZES))}): "
+              f"{before:,} → {after:,} bytes ({1 - after / before:.1%} smaller)")
+
+def mean_diff(a, b):
+    """Mean absolute per-channel difference between two RGBA icons as displayed
+
+    Both are composited over grey first, so the colour of fully transparent
+    pixels (which palette quantisation changes freely) doesn't count.
+    """
+    grey = Image.new('RGBA', a.size, (128, 128, 128, 255))
+    a = Image.alpha_composite(grey, a).convert('RGB')
+    b = Image.alpha_composite(grey, b).convert('RGB')
+    return sum(ImageStat.Stat(ImageChops.difference(a, b)).mean) / 3
+
+def verify_icons(tree, sizes=ICON_SIZES, threshold=MAX_MEAN_DIFF):
+    """Compare the written icons with per-size rendering; return the sizes over threshold"""
+    failed = []
+    for size in sizes:
+        with Image.open(f'{OUTPUT_DIR}/icon-{size}.png') as icon:
+            diff = mean_diff(icon.convert('RGBA'), rasterise(tree, size))
+        ok = diff <= threshold
+        print(f"{'✅' if ok else '❌'} {size}x{size}: mean pixel difference {diff:.2f}")
+        if not ok:
+            failed.append(size)
+    return failed
+
+def generate_icons(per_size=False, anchors=ANCHOR_SIZES, verify=False, threshold=MAX_MEAN_DIFF,
+                   workers=None, force=False, palette=None, webp=True, avif=False):
     """Generate all PNG icons from the SVG source"""
 
     # Ensure output directory exists
@@ -23,24 +170,98 @@ def generate_icons():
     print(f"🎨 Generating PNG icons from {SVG_SOURCE}")
     print(f"📁 Output directory: {OUTPUT_DIR}\n")
 
-    # Generate each size
+    with open(SVG_SOURCE, 'rb') as f:
+        svg_data = f.read()
+    svg_hash = sha256(svg_data)
+    if per_size:
+        anchors = ICON_SIZES
+    if avif and not features.check('avif'):
+        print("⚠️  This Pillow build has no AVIF support; skipping AVIF variants")
+        avif = False
+    options = {'palette': palette, 'webp': webp, 'avif': avif}
+
+    # Group the sizes whose SVG hash or render options changed by anchor
+    manifest = {size: entry for size, entry in load_manifest().items() if int(size) in ICON_SIZES}
+    groups = {}
+    skipped = []
+    expected = {}
     for size in ICON_SIZES:
-        output_file = f'{OUTPUT_DIR}/icon-{size}.png'
-
-        try:
-            cairosvg.svg2png(
-                url=SVG_SOURCE,
-                write_to=output_file,
-                output_width=size,
-                output_height=size
-            )
-            print(f"✅ Generated {output_file} ({size}x{size})")
-        except Exception as e:
-            print(f"❌ Failed to generate {output_file}: {e}")
+        anchor = anchor_for(size, anchors)
+        expected[size] = {'svg_sha256': svg_hash, 'anchor': anchor, 'options': options}
+        if not force and is_current(manifest.get(str(size)), expected[size]):
+            skipped.append(size)
+        else:
+            groups.setdefault(anchor, []).append(size)
+
+    generated = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {anchor: pool.submit(render_group, svg_data, anchor, sizes, options)
+                   for anchor, sizes in groups.items()}
+        for anchor, future in futures.items():
+            try:
+                icons = future.result()
+            except Exception as e:
+                print(f"❌ Failed to render sizes {groups[anchor]} from the {anchor}px anchor: {e}")
+                continue
+            for size, (plain_png_bytes, files) in icons.items():
+                for name, data in files.items():
+                    with open(f'{OUTPUT_DIR}/{name}', 'wb') as f:
+                        f.write(data)
+                manifest[str(size)] = {
+                    **expected[size],
+                    'outputs': {name: sha256(data) for name, data in files.items()},
+                    'bytes': {name: len(data) for name, data in files.items()},
+                    'plain_png_bytes': plain_png_bytes,
+                }
+                generated.append(size)
+                source = 'rasterised' if size == anchor else f'from {anchor}px'
+                print(f"✅ Generated {', '.join(files)} ({size}x{size}, {source})")
+
+    with open(MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    print(f"\n📊 Generated {len(generated)}: {sorted(generated) or '-'}")
+    print(f"⏭️  Skipped {len(skipped)} unchanged: {skipped or '-'}")
+    print_byte_report(manifest, ICON_SIZES)
+
+    failed = []
+    if verify and not per_size:
+        print(f"\n🔍 Verifying against per-size rendering (threshold {threshold})")
+        failed = verify_icons(load_svg(svg_data), ICON_SIZES, threshold)
 
     # Also update the base icon.svg to match the new logo
     print(f"\n📝 Note: Remember to manually update {OUTPUT_DIR}/icon.svg with the new logo")
     print(f"✨ Icon generation complete!")
+    return failed
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate PWA PNG icons from the SVG logo.')
+    parser.add_argument('--per-size', action='store_true',
+                        help='rasterise every size straight from the SVG')
+    parser.add_argument('--anchors', default=','.join(map(str, ANCHOR_SIZES)),
+                        help='comma-separated sizes to rasterise; others are downsampled (default: %(default)s)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='render processes (default: one per CPU)')
+    parser.add_argument('--palette', type=int, metavar='COLOURS',
+                        help='quantise PNGs to a palette of this many colours (e.g. 32) instead of '
+                             'lossless recompression')
+    parser.add_argument('--no-webp', dest='webp', action='store_false', help='skip the WebP variants')
+    parser.add_argument('--avif', action='store_true', help='also write AVIF variants')
+    parser.add_argument('--force', action='store_true', help='regenerate every icon, ignoring the manifest')
+    parser.add_argument('--verify', action='store_true',
+                        help='compare the icons with per-size rendering and fail above the threshold')
+    parser.add_argument('--threshold', type=float, default=MAX_MEAN_DIFF,
+                        help='largest accepted mean per-channel difference, 0-255 (default: %(default)s)')
+    return parser.parse_args(argv)
 
 if __name__ == '__main__':
-    generate_icons()
+    args = parse_args()
+    failed = generate_icons(per_size=args.per_size,
+                            anchors=[int(size) for size in args.anchors.split(',')],
+                            verify=args.verify, threshold=args.threshold,
+                            workers=args.workers, force=args.force,
+                            palette=args.palette, webp=args.webp, avif=args.avif)
+    if failed:
+        print(f"❌ Icons differ too much from per-size rendering at sizes {failed}; "
+              f"add anchors or use --per-size")
+        sys.exit(1)
@@ -1,52 +1,78 @@
-const CACHE_NAME = 'habit-tracker-v4';
-const STATIC_ASSETS = [
-    '/',
-    '/index.html',
-    '/manifest.json',
-    '/css/styles.css',
-    // Main entry point
-    '/js/main.js',
-    // Core modules
-    '/js/firebase-init.js',
-    '/js/state.js',
-    '/js/constants.js',
-    '/js/utils.js',
-    '/js/routines-config.js',
-    // Feature modules
-    '/js/auth.js',
-    '/js/profile.js',
-    '/js/habits.js',
-    '/js/entries.js',
-    '/js/schedule.js',
-    '/js/modals.js',
-    '/js/onboarding.js',
-    '/js/dashboard.js',
-    '/js/calendar-picker.js',
-    // UI modules
-    '/js/ui/screens.js',
-    '/js/ui/progress.js',
-    '/js/ui/habits-ui.js',
-    '/js/ui/settings-ui.js',
-    // Assets
-    '/assets/logo-white-back.svg',
-    '/assets/icons/icon-180.png',
-    '/assets/icons/icon-192.png',
-    '/assets/icons/icon-512.png'
+// BEGIN PRECACHE MANIFEST - generated by build_sw.py, do not edit by hand
+const PRECACHE_MANIFEST = [
+    { url: '/', revision: 'd310b2981316' },
+    { url: '/assets/icons/icon-180.png', revision: 'ef4d8c9b3b77' },
+    { url: '/assets/icons/icon-192.png', revision: '2c737a5d00e2' },
+    { url: '/assets/icons/icon-512.png', revision: 'f6e366166dee' },
+    { url: '/assets/logo-white-back.svg', revision: '8e7512824278' },
+    { url: '/css/styles.css', revision: '3d9fba71fc6b' },
+    { url: '/index.html', revision: 'd310b2981316' },
+    { url: '/js/analytics-worker.js', revision: '27c6cfedfaee' },
+    { url: '/js/auth.js', revision: 'e8d4c5f44852' },
+    { url: '/js/calendar-picker.js', revision: '279f81398635' },
+    { url: '/js/constants.js', revision: '4ea3d321ac7d' },
+    { url: '/js/dashboard.js', revision: '0756c92b054f' },
+    { url: '/js/entries.js', revision: '249db00e4bc8' },
+    { url: '/js/firebase-init.js', revision: 'b94bf95bc610' },
+    { url: '/js/habits.js', revision: 'ad823447b438' },
+    { url: '/js/insights-cache.js', revision: '215a8cb90d47' },
+    { url: '/js/insights.js', revision: '9b9512662d76' },
+    { url: '/js/main.js', revision: 'd6ec56b9a472' },
+    { url: '/js/mindset.js', revision: '1695ffd4a768' },
+    { url: '/js/modals.js', revision: '6df0d8e75730' },
+    { url: '/js/onboarding.js', revision: 'c627c7de0a71' },
+    { url: '/js/profile.js', revision: '99e9853f50eb' },
+    { url: '/js/routines-config.js', revision: '240426280035' },
+    { url: '/js/schedule.js', revision: '00ae7f6bdc4b' },
+    { url: '/js/state.js', revision: '3361b90e7788' },
+    { url: '/js/ui/habits-ui.js', revision: '226f4032a659' },
+    { url: '/js/ui/insights-ui.js', revision: 'bdb2eaf09da3' },
+    { url: '/js/ui/progress.js', revision: '257706a36883' },
+    { url: '/js/ui/screens.js', revision: 'e82dbd3256dc' },
+    { url: '/js/ui/settings-ui.js', revision: '8db3fb41cc16' },
+    { url: '/js/utils.js', revision: 'eb289acf1c44' },
+    { url: '/manifest.json', revision: '91c9812fd5f9' },
 ];
+// END PRECACHE MANIFEST
+
+// Precached assets are keyed by content revision, so a deploy only
+// re-downloads the files whose revision changed
+const PRECACHE_NAME = 'habit-tracker-precache';
+const RUNTIME_CACHE_NAME = 'habit-tracker-runtime';
+const precacheKey = entry => `${entry.url}?__rev=${entry.revision}`;
+const PRECACHE_KEYS = new Map(PRECACHE_MANIFEST.map(entry => [entry.url, precacheKey(entry)]));
+const requestKey = request => {
+    const url = new URL(request.url);
+    return url.pathname + url.search;
+};
 
 // External resources to cache
 const EXTERNAL_ASSETS = [
     'https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.min.js'
 ];
 
-// Install event - cache static assets
+// Install event - cache new or changed static assets
 self.addEventListener('install', event => {
     event.waitUntil(
-        caches.open(CACHE_NAME)
+        caches.open(PRECACHE_NAME)
             .then(cache => {
-                console.log('Caching static assets');
-                // Cache static assets
-                return cache.addAll(STATIC_ASSETS)
+                return cache.keys()
+                    .then(requests => {
+                        const cached = new Set(requests.map(requestKey));
+                        const missing = PRECACHE_MANIFEST.filter(entry => !cached.has(precacheKey(entry)));
+                        console.log(`Caching ${missing.length} of ${PRECACHE_MANIFEST.length} static assets`);
+                        return Promise.all(
+                            missing.map(entry =>
+                                fetch(entry.url, { cache: 'reload' })
+                                    .then(response => {
+                                        if (!response.ok) {
+                                            throw new Error(`${response.status} ${entry.url}`);
+                                        }
+                                        return cache.put(precacheKey(entry), response);
+                                    })
+                            )
+                        );
+                    })
                     .catch(err => {
                         console.log('Error caching static assets:', err);
                         // Continue even if some assets fail to cache
@@ -55,7 +81,7 @@ self.addEventListener('install', event => {
             })
             .then(() => {
                 // Try to cache external assets separately
-                return caches.open(CACHE_NAME)
+                return caches.open(RUNTIME_CACHE_NAME)
                     .then(cache => {
                         return Promise.all(
                             EXTERNAL_ASSETS.map(url =>
@@ -70,17 +96,27 @@ self.addEventListener('install', event => {
     );
 });
 
-// Activate event - clean up old caches
+// Activate event - clean up old caches and superseded revisions
 self.addEventListener('activate', event => {
+    const currentKeys = new Set(PRECACHE_KEYS.values());
     event.waitUntil(
         caches.keys()
             .then(cacheNames => {
                 return Promise.all(
                     cacheNames
-                        .filter(name => name !== CACHE_NAME)
+                        .filter(name => name !== PRECACHE_NAME && name !== RUNTIME_CACHE_NAME)
                         .map(name => caches.delete(name))
                 );
             })
+            .then(() => caches.open(PRECACHE_NAME))
+            .then(cache => {
+                return cache.keys()
+                    .then(requests => Promise.all(
+                        requests
+                            .filter(request => !currentKeys.has(requestKey(request)))
+                            .map(request => cache.delete(request))
+                    ));
+            })
             .then(() => self.clients.claim())
     );
 });
@@ -103,6 +139,18 @@ self.addEventListener('fetch', event => {
         return;
     }
 
+    // Precached assets are served by revision; query strings such as
+    // ?v= cache busters don't change the content
+    const key = url.origin === self.location.origin && PRECACHE_KEYS.get(url.pathname);
+    if (key) {
+        event.respondWith(
+            caches.open(PRECACHE_NAME)
+                .then(cache => cache.match(key))
+                .then(cachedResponse => cachedResponse || fetch(request))
+        );
+        return;
+    }
+
     event.respondWith(
         caches.match(request)
             .then(cachedResponse => {
@@ -112,7 +160,7 @@ self.addEventListener('fetch', event => {
                         fetch(request)
                             .then(networkResponse => {
                                 if (networkResponse && networkResponse.status === 200) {
-                                    caches.open(CACHE_NAME)
+                                    caches.open(RUNTIME_CACHE_NAME)
                                         .then(cache => cache.put(request, networkResponse));
                                 }
                             })
@@ -127,7 +175,7 @@ self.addEventListener('fetch', event => {
                         // Cache successful responses
                         if (networkResponse && networkResponse.status === 200) {
                             const responseToCache = networkResponse.clone();
-                            caches.open(CACHE_NAME)
+                            caches.open(RUNTIME_CACHE_NAME)
                                 .then(cache => cache.put(request, responseToCache));
                         }
                         return networkResponse;
@@ -135,7 +183,7 @@ self.addEventListener('fetch', event => {
                     .catch(() => {
                         // Return offline fallback for navigation requests
                         if (request.mode === 'navigate') {
-                            return caches.match('/index.html');
+                            return caches.match(PRECACHE_KEYS.get('/index.html'));
                         }
                         return new Response('Offline', { status: 503 });
                     });
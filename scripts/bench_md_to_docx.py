@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Benchmarks for md_to_docx.
+
+Usage:
+    python bench_md_to_docx.py table [--rows 500]
+    python bench_md_to_docx.py stream [--mb 50]
+    python bench_md_to_docx.py corpus [--scales 1,4,16] [--output bench.json]
+    python bench_md_to_docx.py corpus --compare bench.json
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import md_to_docx  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CORPUS = [REPO_ROOT / 'routine-content-trend-research.md',
+          *sorted((REPO_ROOT / 'habit-tracker/docs/books/summaries').glob('*.md'))]
+DEFAULT_SCALES = [1, 4, 16]
+
+
+def synthetic_table(rows, cols=6):
+    """Return Markdown for a comparison table with inline formatting and symbols."""
+    lines = ['| ' + ' | '.join(f'Feature {c}' for c in range(cols)) + ' |',
+             '|' + '---|' * cols]
+    for r in range(rows):
+        cells = [f'**Row {r}**', '✅ yes', '❌ no', '`code_{r}`', '*partial* ⚠️', f'[link](https://example.com/{r})']
+        lines.append('| ' + ' | '.join(cells[:cols]) + ' |')
+    return lines
+
+
+def legacy_render_table(doc, header, rows):
+    """The previous per-cell python-docx table path, kept for comparison."""
+    table = doc.add_table(rows=1 + len(rows), cols=len(header))
+    table.style = 'Light Grid Accent 1'
+    for j, cell_inlines in enumerate(header):
+        cell = table.rows[0].cells[j]
+        cell.text = md_to_docx.inline_text(cell_inlines)
+        for paragraph in cell.paragraphs:
+            for run in paragraph.runs:
+                run.bold = True
+    for row_idx, row_data in enumerate(rows):
+        for col_idx, cell_inlines in enumerate(row_data):
+            table.rows[row_idx + 1].cells[col_idx].text = md_to_docx.inline_text(cell_inlines)
+
+
+def bench_table(rows):
+    """Time the bulk w:tbl path against the legacy per-cell path."""
+    (_, header, data), = md_to_docx.parse_blocks(synthetic_table(rows))
+
+    doc = md_to_docx.new_document()
+    started = time.perf_counter()
+    legacy_render_table(doc, header, data)
+    legacy = time.perf_counter() - started
+
+    doc = md_to_docx.new_document()
+    started = time.perf_counter()
+    md_to_docx.DocxRenderer(doc).render_table(header, data)
+    bulk = time.perf_counter() - started
+
+    return {
+        "benchmark": "table",
+        "rows": rows,
+        "legacy_s": round(legacy, 4),
+        "bulk_s": round(bulk, 4),
+        "speedup": round(legacy / bulk, 1) if bulk else None,
+    }
+
+
+SECTION_TEMPLATE = """## Section {n}: Routine research notes
+
+Morning routines with **bright light exposure** and *consistent wake times* improve sleep quality [source](https://example.com/{n}).
+
+- Habit stacking with `cue -> routine -> reward`
+- Track streaks **weekly**, not daily
+1. Wake at the same time
+2. Get outside within 30 minutes
+
+> Small habits compound.
+
+| Habit | Evidence | Status |
+|---|---|---|
+| Sunlight | Strong | ✅ |
+| Cold shower | Mixed | ⚠️ |
+
+```
+streak = completed_days / scheduled_days
+```
+
+"""
+
+
+def write_synthetic_markdown(path, target_mb):
+    """Write roughly target_mb of Markdown built from a repeating research section."""
+    target = int(target_mb * 1024 * 1024)
+    written = 0
+    n = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('# Synthetic research dump\n\n')
+        while written < target:
+            chunk = SECTION_TEMPLATE.format(n=n)
+            f.write(chunk)
+            written += len(chunk.encode('utf-8'))
+            n += 1
+    return path
+
+
+def run_convert(md_file, docx_file, streaming):
+    """Convert in this process and report wall time and peak RSS."""
+    started = time.perf_counter()
+    md_to_docx.convert_md_to_docx(md_file, docx_file, streaming=streaming)
+    return {
+        "streaming": streaming,
+        "wall_s": round(time.perf_counter() - started, 3),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "output_bytes": Path(docx_file).stat().st_size,
+    }
+
+
+def bench_stream(target_mb):
+    """Compare peak RSS of the in-memory and streaming modes, each in a fresh process."""
+    results = {"benchmark": "stream", "input_mb": target_mb, "runs": []}
+    with tempfile.TemporaryDirectory(prefix="bench_md_to_docx_") as tmp:
+        md_file = write_synthetic_markdown(Path(tmp) / "synthetic.md", target_mb)
+        for streaming in (False, True):
+            proc = subprocess.run(
+                [sys.executable, __file__, "_convert", str(md_file), str(Path(tmp) / "out.docx")]
+                + (["--stream"] if streaming else []),
+                capture_output=True, text=True, check=True,
+            )
+            results["runs"].append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def bench_corpus(scales, repeat=3):
+    """Profile conversion of each corpus file repeated scale times.
+
+    Each case runs repeat times and the fastest run is reported, which keeps
+    sub-second cases comparable across commits.
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_md_to_docx_") as tmp:
+        for source in CORPUS:
+            text = source.read_text(encoding='utf-8').rstrip('\n') + '\n\n'
+            for scale in scales:
+                md_file = Path(tmp) / f"{source.stem}-x{scale}.md"
+                md_file.write_text(text * scale, encoding='utf-8')
+                docx_file = md_file.with_suffix('.docx')
+                best = None
+                for _ in range(repeat):
+                    gc.collect()
+                    started = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        run_profile = md_to_docx.convert_md_to_docx(md_file, docx_file, profile=True)
+                    elapsed = time.perf_counter() - started
+                    if best is None or elapsed < best:
+                        best, profile = elapsed, run_profile
+                result = {
+                    "source": source.name,
+                    "scale": scale,
+                    "input_bytes": md_file.stat().st_size,
+                    "wall_s": round(best, 4),
+                    "output_bytes": docx_file.stat().st_size,
+                    "profile": {phase: {"count": entry["count"], "seconds": round(entry["seconds"], 4)}
+                                for phase, entry in sorted(profile.items())},
+                }
+                results.append(result)
+                print(f"  {source.name:<40} x{scale:<4} {result['wall_s']:>8.3f}s", file=sys.stderr)
+    return {"benchmark": "corpus", "converter_version": md_to_docx.CONVERTER_VERSION, "results": results}
+
+
+def compare(results, baseline, threshold):
+    """Return regression messages for corpus cases slower than baseline by more than threshold."""
+    baseline_by_case = {(r["source"], r["scale"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results["results"]:
+        case = (result["source"], result["scale"])
+        base = baseline_by_case.get(case)
+        if base and base["wall_s"] and result["wall_s"] > base["wall_s"] * (1 + threshold):
+            change = result["wall_s"] / base["wall_s"] - 1
+            regressions.append(f"{case[0]} x{case[1]}: wall_s {base['wall_s']} -> {result['wall_s']} (+{change:.0%})")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark md_to_docx.")
+    sub = parser.add_subparsers(dest="benchmark", required=True)
+    table = sub.add_parser("table", help="bulk table construction vs per-cell access")
+    table.add_argument("--rows", type=int, default=500)
+    stream = sub.add_parser("stream", help="peak memory of in-memory vs streaming conversion")
+    stream.add_argument("--mb", type=float, default=50, help="size of the synthetic Markdown file")
+    corpus = sub.add_parser("corpus", help="profile the research and book-summary corpus at several scales")
+    corpus.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)),
+                        help="comma-separated repeat counts (default: %(default)s)")
+    corpus.add_argument("--repeat", type=int, default=3, help="runs per case; the fastest is reported")
+    corpus.add_argument("--output", help="write JSON results to this file")
+    corpus.add_argument("--compare", metavar="BASELINE", help="flag regressions against a stored baseline JSON")
+    corpus.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown that counts as a regression (default: 0.2)")
+    convert = sub.add_parser("_convert")
+    convert.add_argument("md_file")
+    convert.add_argument("docx_file")
+    convert.add_argument("--stream", action="store_true")
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.benchmark == "table":
+        print(json.dumps(bench_table(args.rows), indent=2))
+    elif args.benchmark == "stream":
+        print(json.dumps(bench_stream(args.mb), indent=2))
+    elif args.benchmark == "corpus":
+        results = bench_corpus([int(n) for n in args.scales.split(",")], args.repeat)
+        output = json.dumps(results, indent=2)
+        if args.output:
+            Path(args.output).write_text(output)
+        else:
+            print(output)
+        if args.compare:
+            regressions = compare(results, json.loads(Path(args.compare).read_text()), args.threshold)
+            for message in regressions:
+                print(f"REGRESSION: {message}", file=sys.stderr)
+            if regressions:
+                sys.exit(1)
+            print("No regressions against baseline", file=sys.stderr)
+    elif args.benchmark == "_convert":
+        print(json.dumps(run_convert(args.md_file, args.docx_file, args.stream)))
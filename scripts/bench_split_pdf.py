@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Benchmark split_pdf on locally generated synthetic PDFs.
+
+Generates text-only, image-heavy and shared-font PDFs, times serial, parallel
+and size-targeted splitting, and reports wall time, peak RSS of the splitting
+process and of its largest worker, and output bytes as JSON. Each case runs --repeat times and the fastest run is reported. With
+--compare, results are checked against a stored baseline and regressions
+are flagged; wall time must also grow by at least --min-delta seconds, so
+noise on millisecond cases isn't reported.
+
+Usage:
+    python bench_split_pdf.py --pages 10,100,1000 --output bench.json
+    python bench_split_pdf.py --compare bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pypdf import PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    NumberObject,
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import split_pdf  # noqa: E402
+
+KINDS = ["text", "images", "shared-fonts"]
+MODES = ["serial", "parallel", "size"]
+DEFAULT_PAGES = [10, 100, 1000]
+IMAGE_SIZE = 64          # px, per-page RGB image for the image-heavy corpus
+FONT_FILE_BYTES = 64 * 1024  # fake embedded font shared by every page
+LINES_PER_PAGE = 40
+
+
+def _stream(data, **entries):
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    for key, value in entries.items():
+        stream[NameObject(f"/{key}")] = value
+    return stream
+
+
+def _page_text(rng, page_num):
+    words = ["habit", "routine", "focus", "sleep", "identity", "system", "cue", "reward"]
+    lines = [f"BT /F1 10 Tf 50 {780 - 18 * i} Td (Page {page_num + 1}: "
+             f"{' '.join(rng.choice(words) for _ in range(10))}) Tj ET"
+             for i in range(LINES_PER_PAGE)]
+    return "\n".join(lines).encode()
+
+
+def generate_pdf(path, kind, pages, seed=0):
+    """Write a synthetic PDF of the given kind and page count."""
+    rng = random.Random(seed)
+    writer = PdfWriter()
+
+    font = DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    })
+    if kind == "shared-fonts":
+        # One embedded font program referenced by every page
+        font_file = writer._add_object(_stream(rng.randbytes(FONT_FILE_BYTES), Length1=NumberObject(FONT_FILE_BYTES)))
+        font[NameObject("/Subtype")] = NameObject("/TrueType")
+        font[NameObject("/FontDescriptor")] = writer._add_object(DictionaryObject({
+            NameObject("/Type"): NameObject("/FontDescriptor"),
+            NameObject("/FontName"): NameObject("/SyntheticSans"),
+            NameObject("/FontFile2"): font_file,
+        }))
+    font_ref = writer._add_object(font)
+
+    for page_num in range(pages):
+        page = writer.add_blank_page(width=612, height=792)
+        resources = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font_ref}),
+        })
+        content = _page_text(rng, page_num)
+        if kind == "images":
+            image = writer._add_object(_stream(
+                rng.randbytes(IMAGE_SIZE * IMAGE_SIZE * 3),
+                Type=NameObject("/XObject"),
+                Subtype=NameObject("/Image"),
+                Width=NumberObject(IMAGE_SIZE),
+                Height=NumberObject(IMAGE_SIZE),
+                ColorSpace=NameObject("/DeviceRGB"),
+                BitsPerComponent=NumberObject(8),
+            ))
+            resources[NameObject("/XObject")] = DictionaryObject({NameObject("/Im0"): image})
+            content += b"\nq 400 0 0 400 100 200 cm /Im0 Do Q"
+        page[NameObject("/Resources")] = resources
+        page[NameObject("/Contents")] = writer._add_object(_stream(content))
+        page[NameObject("/MediaBox")] = ArrayObject([NumberObject(0), NumberObject(0),
+                                                     NumberObject(612), NumberObject(792)])
+
+    with open(path, 'wb') as f:
+        writer.write(f)
+    return path
+
+
+def _peak_rss_kb():
+    """Peak RSS of this process and of its largest reaped child, in KB.
+
+    getrusage only reports the largest single child, not the sum, so with N
+    parallel workers the combined peak can be up to parent + N * child.
+    """
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    largest_child = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return own, largest_child
+
+
+def run_case(pdf_path, mode, pages_per_chunk, workers, max_chunk_mb):
+    """Split one PDF in this process and return its measurements."""
+    pdf_path = Path(pdf_path)
+    for sidecar in (split_pdf.page_index_path(pdf_path), split_pdf.outline_index_path(pdf_path)):
+        sidecar.unlink(missing_ok=True)
+    output_dir = pdf_path.parent / f"{pdf_path.stem}_split"
+    shutil.rmtree(output_dir, ignore_errors=True)
+
+    kwargs = {"pages_per_chunk": pages_per_chunk}
+    if mode == "parallel":
+        kwargs["workers"] = workers
+    elif mode == "size":
+        kwargs["max_chunk_mb"] = max_chunk_mb
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        split_pdf.split_pdf(pdf_path, **kwargs)
+    elapsed = time.perf_counter() - started
+
+    output_bytes = sum(path.stat().st_size for path in output_dir.iterdir())
+    parent_rss_kb, child_rss_kb = _peak_rss_kb()
+    return {
+        "wall_s": round(elapsed, 4),
+        "parent_peak_rss_kb": parent_rss_kb,
+        "largest_child_peak_rss_kb": child_rss_kb,
+        "output_bytes": output_bytes,
+        "chunks": len(list(output_dir.iterdir())),
+    }
+
+
+def run_benchmarks(page_counts, kinds, modes, pages_per_chunk, workers, max_chunk_mb, repeat=3):
+    """Generate the corpus and run every case in a fresh subprocess.
+
+    Each case runs repeat times and the fastest run is reported, which keeps
+    short cases comparable across commits.
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_split_pdf_") as tmp:
+        for kind in kinds:
+            for pages in page_counts:
+                pdf_path = Path(tmp) / f"{kind}-{pages}.pdf"
+                generate_pdf(pdf_path, kind, pages)
+                input_bytes = pdf_path.stat().st_size
+                for mode in modes:
+                    best = None
+                    for _ in range(repeat):
+                        # A fresh interpreter per run keeps peak RSS comparable
+                        proc = subprocess.run(
+                            [sys.executable, __file__, "--run-case", str(pdf_path), mode,
+                             "--pages-per-chunk", str(pages_per_chunk), "--workers", str(workers),
+                             "--max-chunk-mb", str(max_chunk_mb)],
+                            capture_output=True, text=True, check=True,
+                        )
+                        run = json.loads(proc.stdout)
+                        if best is None or run["wall_s"] < best["wall_s"]:
+                            best = run
+                    result = {"kind": kind, "pages": pages, "mode": mode, "input_bytes": input_bytes}
+                    result.update(best)
+                    results.append(result)
+                    child_mb = result['largest_child_peak_rss_kb'] / 1024
+                    print(f"  {kind:>12} {pages:>5} pages  {mode:<8} {result['wall_s']:>8.3f}s  "
+                          f"{result['parent_peak_rss_kb'] / 1024:>7.1f} MB RSS  {result['output_bytes']:>12,} bytes"
+                          + (f"  (largest worker {child_mb:.1f} MB RSS)" if child_mb else ""),
+                          file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, threshold, min_delta_s=0.05):
+    """Return regression messages for results worse than baseline by more than threshold.
+
+    A wall time also has to be at least min_delta_s seconds slower to count.
+    """
+    baseline_by_case = {(r["kind"], r["pages"], r["mode"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        case = (result["kind"], result["pages"], result["mode"])
+        base = baseline_by_case.get(case)
+        if base is None:
+            continue
+        for metric in ("wall_s", "parent_peak_rss_kb", "largest_child_peak_rss_kb", "output_bytes"):
+            if metric not in base:
+                continue  # baseline from an older version of this script
+            if metric == "wall_s" and result[metric] - base[metric] < min_delta_s:
+                continue
+            if base[metric] and result[metric] > base[metric] * (1 + threshold):
+                change = result[metric] / base[metric] - 1
+                regressions.append(f"{case[0]} {case[1]} pages {case[2]}: {metric} "
+                                   f"{base[metric]} -> {result[metric]} (+{change:.0%})")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark split_pdf on synthetic PDFs.")
+    parser.add_argument("--pages", default=",".join(map(str, DEFAULT_PAGES)),
+                        help="comma-separated page counts (default: %(default)s)")
+    parser.add_argument("--kinds", default=",".join(KINDS), help="comma-separated corpus kinds")
+    parser.add_argument("--modes", default=",".join(MODES), help="comma-separated split modes")
+    parser.add_argument("--pages-per-chunk", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-chunk-mb", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per case; the fastest is reported (default: %(default)s)")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against a stored baseline JSON")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown/growth that counts as a regression (default: 0.2)")
+    parser.add_argument("--min-delta", type=float, default=0.05,
+                        help="smallest wall time increase in seconds that counts as a regression "
+                             "(default: %(default)s)")
+    parser.add_argument("--run-case", nargs=2, metavar=("PDF", "MODE"), help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.run_case:
+        pdf_path, mode = args.run_case
+        print(json.dumps(run_case(pdf_path, mode, args.pages_per_chunk, args.workers, args.max_chunk_mb)))
+        sys.exit(0)
+
+    results = run_benchmarks(
+        [int(n) for n in args.pages.split(",")],
+        args.kinds.split(","),
+        args.modes.split(","),
+        args.pages_per_chunk,
+        args.workers,
+        args.max_chunk_mb,
+        args.repeat,
+    )
+    report = {
+        "settings": {"pages_per_chunk": args.pages_per_chunk, "workers": args.workers,
+                     "max_chunk_mb": args.max_chunk_mb, "repeat": args.repeat},
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+    else:
+        print(output)
+
+    if args.compare:
+        regressions = compare(results, json.loads(Path(args.compare).read_text()), args.threshold,
+                              args.min_delta)
+        for message in regressions:
+            print(f"REGRESSION: {message}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline", file=sys.stderr)
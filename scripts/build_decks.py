@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Build the MIT Sandbox pitch decks from the specs in decks/.
+
+Deck modules are discovered in the decks package and each deck is built in
+its own worker process, so the whole set takes about as long as the slowest
+deck. Outputs are written to a temporary file and moved into place, so an
+interrupted build never leaves a truncated .pptx behind.
+
+With --workers 1 the decks build one after another in this process and
+share a ComponentCache: repeated components are cloned instead of rebuilt.
+
+With --incremental, each slide's rendered XML is cached in CACHE_DIR_NAME/
+next to the outputs under a hash of its spec, and only slides whose spec
+changed are rendered again.
+"""
+
+import argparse
+import os
+import stat
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from deck_engine import ComponentCache, SlideCache, build_deck
+from decks import discover_decks, load_deck
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT_DIR = REPO_ROOT / "MIT_Sandbox" / "Pitch Deck"
+CACHE_DIR_NAME = '.deck_cache'
+
+
+def output_mode(path):
+    """Mode for a file written at path: the existing file's, else 0o666 less the umask"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def save_atomic(prs, path):
+    """Save to a temporary file next to path, then rename it over path"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.stem}.', suffix='.tmp')
+    os.close(fd)
+    try:
+        prs.save(tmp_path)
+        # mkstemp creates the file 0600, and the rename would keep that
+        os.chmod(tmp_path, output_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def build_one(module_name, output_dir, cache=None, cache_dir=None):
+    """Worker: build one deck module into output_dir; return its timings"""
+    cache = cache if cache is not None else ComponentCache()
+    slide_cache = SlideCache(cache_dir) if cache_dir else None
+    hits, misses = cache.hits, cache.misses
+    started = time.perf_counter()
+    deck = load_deck(module_name)
+    prs = build_deck(deck, cache, slide_cache)
+    built = time.perf_counter()
+    path = Path(output_dir) / deck['output']
+    save_atomic(prs, path)
+    saved = time.perf_counter()
+    return {
+        'name': deck['name'], 'path': path, 'slides': len(deck['slides']),
+        'reused': slide_cache.hits if slide_cache else 0,
+        'build_s': built - started, 'save_s': saved - built,
+        'cloned': cache.hits - hits, 'rendered': cache.misses - misses,
+    }
+
+
+def print_timings(results, wall_s):
+    print(f"\n{'deck':<32} {'slides':>6} {'reused':>6} {'build':>7} {'save':>7} {'total':>7} "
+          f"{'cloned':>7} {'rendered':>8}")
+    for r in results:
+        print(f"{r['name']:<32} {r['slides']:>6} {r['reused']:>6} {r['build_s']:>6.2f}s {r['save_s']:>6.2f}s "
+              f"{r['build_s'] + r['save_s']:>6.2f}s {r['cloned']:>7} {r['rendered']:>8}")
+    total = sum(r['build_s'] + r['save_s'] for r in results)
+    slowest = max((r['build_s'] + r['save_s'] for r in results), default=0)
+    print(f"\nBuilt {len(results)} deck(s) in {wall_s:.2f}s wall "
+          f"({total:.2f}s summed, slowest deck {slowest:.2f}s)")
+
+
+def build_decks(names=None, output_dir=DEFAULT_OUTPUT_DIR, workers=None, incremental=False):
+    """Build the named decks (default: all) into output_dir; return the written paths
+
+    workers defaults to one process per deck; 1 builds in this process. With
+    incremental=True, unchanged slides come from output_dir/CACHE_DIR_NAME.
+    """
+    available = discover_decks()
+    unknown = set(names or ()) - set(available)
+    if unknown:
+        raise SystemExit(f"Unknown deck(s): {', '.join(sorted(unknown))}")
+    jobs = [module for name, module in available.items() if not names or name in names]
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = output_dir / CACHE_DIR_NAME if incremental else None
+    started = time.perf_counter()
+    if workers == 1 or len(jobs) <= 1:
+        cache = ComponentCache()
+        results = [build_one(module, output_dir, cache, cache_dir) for module in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers or len(jobs), len(jobs))) as pool:
+            futures = [pool.submit(build_one, module, output_dir, None, cache_dir) for module in jobs]
+            results = [future.result() for future in futures]
+
+    print_timings(results, time.perf_counter() - started)
+    return [r['path'] for r in results]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Build the pitch decks defined in decks/.')
+    parser.add_argument('decks', nargs='*', help='deck names to build (default: all)')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR,
+                        help='directory for the .pptx files (default: %(default)s)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='build processes (default: one per deck; 1 builds in this process)')
+    parser.add_argument('--incremental', action='store_true',
+                        help=f'cache rendered slides in {CACHE_DIR_NAME}/ next to the outputs and '
+                             'only re-render slides whose spec changed')
+    parser.add_argument('--list', action='store_true', help='list the deck names and exit')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.list:
+        for name, module in discover_decks().items():
+            print(f"{name:<32} decks/{module}.py")
+    else:
+        build_decks(args.decks, args.output_dir, workers=args.workers, incremental=args.incremental)
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""Declarative slide-deck engine for the MIT Sandbox pitch decks.
+
+A deck is a dict with a name, an output file name and a list of slides; a
+slide is a title plus a list of components. Components are plain dicts built
+by the constructors below (``rich_text``, ``box``, ``logo``, ``connector``,
+``table``) with positions in EMU and colours from the shared palette, so a
+deck module only describes what goes where.
+
+``build_deck`` renders a deck with python-pptx. Rendered shapes are kept in a
+``ComponentCache`` shared by every deck built in the process: a component
+with the same style as one rendered before is cloned from its XML instead of
+being rebuilt through python-pptx.
+
+Slides are laid out on the blank layout, so a slide's XML depends only on
+its spec. With a ``SlideCache`` the rendered XML of each slide is kept on
+disk under a hash of the spec, and a rebuild only renders slides whose spec
+changed.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+import pptx
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.util import Inches, Pt
+
+# Palette
+BG = RGBColor(0, 0, 0)
+BG_SECONDARY = RGBColor(10, 10, 10)
+TEXT_PRIMARY = RGBColor(255, 255, 255)
+TEXT_SECONDARY = RGBColor(192, 192, 192)
+TEXT_MUTED = RGBColor(102, 102, 102)
+ACCENT_PURPLE = RGBColor(167, 139, 250)
+ACCENT_GREEN = RGBColor(204, 255, 0)
+ACCENT_RED = RGBColor(255, 0, 0)
+BORDER_DARK = RGBColor(50, 50, 50)
+GREEN_TINT = RGBColor(20, 25, 0)
+PURPLE_TINT = RGBColor(16, 14, 25)
+
+# Fonts
+FONT_SANS = "Arial Black"
+FONT_BODY = "Arial"
+FONT_MONO = "Consolas"
+
+# Layout constants (16:9)
+SLIDE_W = Inches(13.333)
+SLIDE_H = Inches(7.5)
+MARGIN_X = Inches(0.6)
+MARGIN_TOP = Inches(0.55)
+GAP_COL = Inches(0.6)
+CONTENT_W = SLIDE_W - (MARGIN_X * 2)
+COL_W = (CONTENT_W - GAP_COL) / 2
+
+BLANK_LAYOUT = 6
+
+# Bump when a renderer changes what it writes, so cached slides are re-rendered
+ENGINE_VERSION = 1
+
+SHAPES = {
+    'rectangle': MSO_SHAPE.RECTANGLE,
+    'rounded_rectangle': MSO_SHAPE.ROUNDED_RECTANGLE,
+    'oval': MSO_SHAPE.OVAL,
+    'isosceles_triangle': MSO_SHAPE.ISOSCELES_TRIANGLE,
+}
+ALIGNMENTS = {'left': PP_ALIGN.LEFT, 'center': PP_ALIGN.CENTER, 'right': PP_ALIGN.RIGHT}
+
+# Special value for box fill/line: explicitly none (omitting them keeps the theme default)
+NONE = 'none'
+
+
+# ---------------------------------------------------------------------------
+# Component constructors
+# ---------------------------------------------------------------------------
+
+def _component(kind, **params):
+    return {'type': kind, **{key: value for key, value in params.items() if value is not None}}
+
+
+def para(text, font=None, size=None, bold=None, color=None, align=None, underline=None,
+         space_before=None, space_after=None, level=None, run=True):
+    """One paragraph of text.
+
+    With run=True the style goes on a single run; with run=False the text is
+    set on the paragraph and the style on its default run properties.
+    """
+    spec = _component(None, text=text, font=font, size=size, bold=bold, color=color, align=align,
+                      underline=underline, space_before=space_before, space_after=space_after,
+                      level=level)
+    del spec['type']
+    if not run:
+        spec['run'] = False
+    return spec
+
+
+def rich_text(x, y, w, h, paragraphs, wrap=None):
+    """A text box of para() dicts; a None paragraph is left empty."""
+    return _component('text', x=x, y=y, w=w, h=h, paragraphs=list(paragraphs), wrap=wrap)
+
+
+def box(x, y, w, h, shape=None, fill=None, line=None, line_width=None, rotation=None,
+        paragraphs=None, margin_x=None):
+    """An autoshape (a rectangle unless shape is given), optionally with text.
+
+    fill and line take a colour or NONE; leaving either out keeps the theme
+    default. line_width is in points.
+    """
+    return _component('box', x=x, y=y, w=w, h=h, shape=shape, fill=fill, line=line,
+                      line_width=line_width, rotation=rotation,
+                      paragraphs=list(paragraphs) if paragraphs is not None else None,
+                      margin_x=margin_x)
+
+
+def logo(x, y, size, outline=True):
+    """The Axiom Forge mark drawn with shapes: a white rounded square and three black bars."""
+    return _component('logo', x=x, y=y, size=size, outline=outline)
+
+
+def connector(x1, y1, x2, y2, line, line_width):
+    return _component('connector', x1=x1, y1=y1, x2=x2, y2=y2, line=line, line_width=line_width)
+
+
+def table(x, y, w, h, cells):
+    """A table from rows of cell() dicts."""
+    return _component('table', x=x, y=y, w=w, h=h, cells=[list(row) for row in cells])
+
+
+def cell(text, fill=None, font=None, size=None, bold=None, color=None):
+    """A table cell: text styled on its paragraph, with an optional fill colour."""
+    spec = para(text, font=font, size=size, bold=bold, color=color)
+    if fill is not None:
+        spec['fill'] = fill
+    return spec
+
+
+def slide(title, components, background=BG):
+    return {'title': title, 'background': background, 'components': list(components)}
+
+
+# Text helpers shared by the decks
+
+def textbox(x, y, w, h, text, font=FONT_BODY, size=18, bold=False, color=TEXT_PRIMARY,
+            align='left', wrap=None, underline=None):
+    """Single-run text box, the common case"""
+    return rich_text(x, y, w, h, [para(text, font=font, size=size, bold=bold, color=color,
+                                  align=align, underline=underline)], wrap=wrap)
+
+
+def section_label(text, x, y):
+    return textbox(x, y, Inches(4), Inches(0.3), f"// {text}", font=FONT_MONO, size=14, bold=True,
+                   color=ACCENT_PURPLE)
+
+
+def h1(text, x, y, w):
+    return textbox(x, y, w, Inches(0.9), text, font=FONT_SANS, size=42, bold=True, color=TEXT_PRIMARY)
+
+
+def h3(text, x, y, w, color=TEXT_PRIMARY, size=20, align='left'):
+    return textbox(x, y, w, Inches(0.4), text, font=FONT_SANS, size=size, bold=True, color=color,
+                   align=align)
+
+
+def body(text, x, y, w, h, color=TEXT_SECONDARY, size=18, bold=False):
+    return textbox(x, y, w, h, text, font=FONT_BODY, size=size, bold=bold, color=color)
+
+
+# ---------------------------------------------------------------------------
+# Renderers
+# ---------------------------------------------------------------------------
+
+def _apply_font(font, spec):
+    if 'font' in spec:
+        font.name = spec['font']
+    if 'size' in spec:
+        font.size = Pt(spec['size'])
+    if 'bold' in spec:
+        font.bold = spec['bold']
+    if 'underline' in spec:
+        font.underline = spec['underline']
+    if 'color' in spec:
+        font.color.rgb = spec['color']
+
+
+def _render_paragraphs(text_frame, paragraphs):
+    for i, spec in enumerate(paragraphs):
+        p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
+        if spec is None:
+            continue
+        if spec.get('run', True):
+            run = p.add_run()
+            run.text = spec['text']
+            _apply_font(run.font, spec)
+        else:
+            p.text = spec['text']
+            _apply_font(p.font, spec)
+        if 'level' in spec:
+            p.level = spec['level']
+        if 'align' in spec:
+            p.alignment = ALIGNMENTS[spec['align']]
+        if 'space_before' in spec:
+            p.space_before = Pt(spec['space_before'])
+        if 'space_after' in spec:
+            p.space_after = Pt(spec['space_after'])
+
+
+def render_text(slide, x, y, w, h, paragraphs, wrap=None):
+    shape = slide.shapes.add_textbox(x, y, w, h)
+    if wrap is not None:
+        shape.text_frame.word_wrap = wrap
+    _render_paragraphs(shape.text_frame, paragraphs)
+
+
+def render_box(slide, x, y, w, h, shape='rectangle', fill=None, line=None, line_width=None,
+               rotation=None, paragraphs=(), margin_x=None):
+    sp = slide.shapes.add_shape(SHAPES[shape], x, y, w, h)
+    if fill == NONE:
+        sp.fill.background()
+    elif fill is not None:
+        sp.fill.solid()
+        sp.fill.fore_color.rgb = fill
+    if line not in (None, NONE):
+        sp.line.color.rgb = line
+    if line_width is not None:
+        sp.line.width = Pt(line_width)
+    if line == NONE:
+        sp.line.fill.background()
+    if rotation is not None:
+        sp.rotation = rotation
+    if margin_x is not None:
+        sp.text_frame.margin_left = Pt(margin_x)
+        sp.text_frame.margin_right = Pt(margin_x)
+    _render_paragraphs(sp.text_frame, paragraphs)
+
+
+def render_logo(slide, x, y, size, outline=True):
+    render_box(slide, x, y, size, size, shape='rounded_rectangle', fill=TEXT_PRIMARY,
+               line=TEXT_PRIMARY if outline else None, line_width=1 if outline else None)
+    bar_h = size * 0.16
+    bars = [
+        (x + size * 0.15, y + size * 0.62, size * 0.7),
+        (x + size * 0.28, y + size * 0.42, size * 0.45),
+        (x + size * 0.41, y + size * 0.22, size * 0.18),
+    ]
+    for bx, by, bw in bars:
+        render_box(slide, bx, by, bw, bar_h, fill=BG, line=NONE)
+
+
+def render_connector(slide, x1, y1, x2, y2, line, line_width):
+    shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, x1, y1, x2, y2)
+    shape.line.color.rgb = line
+    shape.line.width = Pt(line_width)
+
+
+def render_table(slide, x, y, w, h, cells):
+    grid = slide.shapes.add_table(len(cells), len(cells[0]), x, y, w, h).table
+    for r, row in enumerate(cells):
+        for c, spec in enumerate(row):
+            cell = grid.cell(r, c)
+            cell.text = spec['text']
+            _apply_font(cell.text_frame.paragraphs[0].font, spec)
+            if 'fill' in spec:
+                cell.fill.solid()
+                cell.fill.fore_color.rgb = spec['fill']
+
+
+RENDERERS = {
+    'text': render_text,
+    'box': render_box,
+    'logo': render_logo,
+    'connector': render_connector,
+    'table': render_table,
+}
+
+# Component types whose shape XML only depends on geometry and strings through
+# p:spPr/a:xfrm and a:t, so one rendering can be cloned and patched
+PATCHABLE = ('text', 'box')
+GEOMETRY = ('x', 'y', 'w', 'h')
+
+
+def _plain(value):
+    """Text python-pptx writes as exactly one a:t (no line breaks or control characters)"""
+    return bool(value) and not any(ch < ' ' for ch in value)
+
+
+class ComponentCache:
+    """Rendered shape XML keyed by component, shared by every deck in the process
+
+    A text box or autoshape whose strings are all plain is keyed on its style
+    alone: a hit clones the cached shape and patches its position, size and
+    strings. Other components are keyed on everything and cloned as they are.
+    Clones get the shape ids and names python-pptx would have given them.
+    """
+
+    def __init__(self):
+        self.shapes = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(component):
+        paragraphs = [p for p in component.get('paragraphs', ()) if p is not None]
+        if component['type'] in PATCHABLE and all(_plain(p['text']) for p in paragraphs):
+            style = {k: v for k, v in component.items() if k not in GEOMETRY}
+            if 'paragraphs' in style:
+                style['paragraphs'] = [p and {k: v for k, v in p.items() if k != 'text'}
+                                       for p in style['paragraphs']]
+            return json.dumps(style, sort_keys=True), True
+        return json.dumps(component, sort_keys=True), False
+
+    def render(self, slide, component):
+        key, patchable = self.key(component)
+        sp_tree = slide.shapes._spTree
+        cached = self.shapes.get(key)
+        if cached is None:
+            self.misses += 1
+            start = len(sp_tree)
+            params = {k: v for k, v in component.items() if k != 'type'}
+            RENDERERS[component['type']](slide, **params)
+            self.shapes[key] = [copy.deepcopy(el) for el in sp_tree[start:]]
+            return
+
+        self.hits += 1
+        for prototype in cached:
+            el = copy.deepcopy(prototype)
+            shape_id = slide.shapes._next_shape_id
+            c_nv_pr = next(el[0].iterchildren(qn('p:cNvPr')))
+            c_nv_pr.set('id', str(shape_id))
+            c_nv_pr.set('name', re.sub(r'\d+$', str(shape_id - 1), c_nv_pr.get('name')))
+            if patchable:
+                xfrm = el.find(f"{qn('p:spPr')}/{qn('a:xfrm')}")
+                xfrm.find(qn('a:off')).set('x', '%d' % component['x'])
+                xfrm.find(qn('a:off')).set('y', '%d' % component['y'])
+                xfrm.find(qn('a:ext')).set('cx', '%d' % component['w'])
+                xfrm.find(qn('a:ext')).set('cy', '%d' % component['h'])
+                strings = [p['text'] for p in component.get('paragraphs', ()) if p is not None]
+                for t, value in zip(el.iter(qn('a:t')), strings):
+                    t.text = value
+            sp_tree.append(el)
+
+
+def render_slide(prs, spec, cache):
+    """Add one slide to prs and render its components"""
+    slide = prs.slides.add_slide(prs.slide_layouts[BLANK_LAYOUT])
+    fill = slide.background.fill
+    fill.solid()
+    fill.fore_color.rgb = spec['background']
+    # Cache the max shape id instead of rescanning the tree for every shape
+    slide.shapes.turbo_add_enabled = True
+    for component in spec['components']:
+        cache.render(slide, component)
+    return slide
+
+
+def slide_key(spec):
+    """Hash of everything a slide's XML depends on: its spec, the engine and python-pptx"""
+    payload = json.dumps([ENGINE_VERSION, pptx.__version__, spec], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class SlideCache:
+    """Rendered slide XML on disk, one <slide_key>.xml file per slide"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        path = self.cache_dir / f'{key}.xml'
+        return path.read_bytes() if path.exists() else None
+
+    def put(self, key, xml):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent workers never read a partial file
+        tmp = self.cache_dir / f'{key}.{os.getpid()}.tmp'
+        tmp.write_bytes(xml)
+        tmp.replace(self.cache_dir / f'{key}.xml')
+
+
+def add_cached_slide(prs, spec, cache, slide_cache):
+    """Add one slide, reusing its cached XML when the spec is unchanged"""
+    key = slide_key(spec)
+    xml = slide_cache.get(key)
+    if xml is None:
+        slide_cache.misses += 1
+        slide = render_slide(prs, spec, cache)
+        slide_cache.put(key, slide.part.blob)
+        return
+    slide_cache.hits += 1
+    # The new slide's only relationship is its layout, which the XML never refers to
+    slide = prs.slides.add_slide(prs.slide_layouts[BLANK_LAYOUT])
+    cached = parse_xml(xml)
+    # Keep the slide's own spTree element, which slide.shapes already holds
+    sp_tree = slide.shapes._spTree
+    sp_tree[:] = cached.cSld.spTree[:]
+    cached.cSld.replace(cached.cSld.spTree, sp_tree)
+    slide._element[:] = cached[:]
+
+
+def new_presentation():
+    prs = Presentation()
+    prs.slide_width = SLIDE_W
+    prs.slide_height = SLIDE_H
+    return prs
+
+
+def build_deck(deck, cache=None, slide_cache=None):
+    """Render a deck spec; return the Presentation
+
+    With a slide_cache, unchanged slides are assembled from their cached XML.
+    """
+    cache = cache if cache is not None else ComponentCache()
+    prs = new_presentation()
+    for spec in deck['slides']:
+        if slide_cache is None:
+            render_slide(prs, spec, cache)
+        else:
+            add_cached_slide(prs, spec, cache, slide_cache)
+    return prs
@@ -0,0 +1,27 @@
+"""Deck definitions for deck_engine, one module per output file.
+
+Every module in this package that defines a module-level DECK is a deck;
+adding a deck means adding a module, nothing here needs to change.
+"""
+
+import importlib
+import pkgutil
+
+
+def deck_modules():
+    """Names of the deck modules in this package, in file-name order"""
+    return [info.name for info in pkgutil.iter_modules(__path__) if not info.name.startswith('_')]
+
+
+def load_deck(module_name):
+    return importlib.import_module(f'{__name__}.{module_name}').DECK
+
+
+def discover_decks():
+    """Map each deck name to the module that defines it"""
+    decks = {}
+    for module_name in deck_modules():
+        module = importlib.import_module(f'{__name__}.{module_name}')
+        if hasattr(module, 'DECK'):
+            decks[module.DECK['name']] = module_name
+    return decks
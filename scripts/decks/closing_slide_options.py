@@ -0,0 +1,279 @@
+"""Closing slide options: five ways to end the pitch."""
+
+from pptx.dml.color import RGBColor
+from pptx.util import Inches, Pt
+
+from deck_engine import (
+    ACCENT_GREEN, ACCENT_PURPLE, BG, BG_SECONDARY, BORDER_DARK, CONTENT_W, FONT_SANS,
+    MARGIN_X, NONE, SLIDE_W, TEXT_MUTED, TEXT_PRIMARY, TEXT_SECONDARY, box, logo, para, slide,
+)
+from deck_engine import textbox as _textbox
+
+FONT_MONO = "Courier New"
+
+CORNER_LOGO = logo(SLIDE_W - Inches(1.0), Inches(0.5), Inches(0.8))
+
+
+def textbox(x, y, w, h, text, **style):
+    return _textbox(x, y, w, h, text, wrap=True, **style)
+
+
+def panel(x, y, w, h, border=None, fill=None, line_width=0):
+    """A rectangle with an optional border; no border or fill means none, not the theme default"""
+    return box(x, y, w, h, line=border or NONE, line_width=line_width if border else None, fill=fill or NONE)
+
+
+def option_tag(text):
+    return textbox(Inches(0.5), Inches(0.3), Inches(3), Inches(0.3), text, size=10, color=TEXT_MUTED)
+
+
+def cta_button(x, y, text, primary=True):
+    return box(x, y, Inches(3.0), Inches(0.8), line=TEXT_PRIMARY, line_width=2,
+               fill=TEXT_PRIMARY if primary else NONE, paragraphs=[
+                   para(text.upper(), font=FONT_MONO, size=16, bold=True,
+                        color=BG if primary else TEXT_PRIMARY, align='center', run=False),
+               ])
+
+
+def mindset_card(x, y, w, h):
+    header_y = y + Inches(0.8)
+    content_y = header_y + Inches(0.4)
+    quote = "Here's the big challenge of life. You can have more than you've got because you can become more than you are."
+    quote2 = "And of course the other side of the coin reads, unless you change how you are, you'll always have what you got."
+    auth_y = y + h - Inches(1.2)
+    av_size = Inches(0.5)
+    return [
+        panel(x, y, w, h, border=TEXT_PRIMARY, fill=BG_SECONDARY, line_width=4),
+        # Header line
+        box(x, header_y, w, Pt(2), fill=BORDER_DARK, line=NONE),
+        textbox(x + Inches(0.3), y + Inches(0.25), w - Inches(0.6), Inches(0.3), "DAILY MENTALITY PILL",
+                font=FONT_SANS, size=10, bold=True, color=ACCENT_GREEN),
+        textbox(x + w - Inches(0.6), y + Inches(0.2), Inches(0.4), Inches(0.4), "💊", size=20),
+        textbox(x + Inches(0.3), content_y, Inches(0.5), Inches(0.5), "\"", font=FONT_SANS, size=60, bold=True,
+                color=ACCENT_GREEN),
+        textbox(x + Inches(0.3), content_y + Inches(0.6), w - Inches(0.6), Inches(1.5), quote.upper(),
+                font=FONT_MONO, size=16, bold=True),
+        textbox(x + Inches(0.3), content_y + Inches(2.0), w - Inches(0.6), Inches(1.0), quote2.upper(),
+                font=FONT_MONO, size=12, color=TEXT_SECONDARY),
+        # Author box, green strip and avatar
+        panel(x + Inches(0.3), auth_y, w - Inches(0.6), Inches(0.9), fill=RGBColor(21, 21, 21)),
+        panel(x + Inches(0.3), auth_y, Inches(0.05), Inches(0.9), fill=ACCENT_GREEN),
+        panel(x + Inches(0.5), auth_y + Inches(0.2), av_size, av_size, border=TEXT_PRIMARY, fill=ACCENT_GREEN, line_width=1),
+        textbox(x + Inches(0.5), auth_y + Inches(0.2), av_size, av_size, "JR", font=FONT_SANS, size=12, bold=True,
+                color=BG, align='center'),
+        textbox(x + Inches(1.2), auth_y + Inches(0.15), Inches(2), Inches(0.3), "JIM ROHN", font=FONT_SANS, size=12, bold=True),
+        textbox(x + Inches(1.2), auth_y + Inches(0.45), Inches(2), Inches(0.3), "ENTREPRENEUR & SPEAKER", size=9,
+                color=TEXT_SECONDARY),
+    ]
+
+
+def split_screen_slide():
+    right_center = SLIDE_W * 0.75
+    return slide("Option 1: Split Screen", [
+        CORNER_LOGO,
+        option_tag("OPTION 1: SPLIT SCREEN"),
+        # Left side
+        textbox(MARGIN_X, Inches(2.0), Inches(5), Inches(0.3), "// END OF PRESENTATION", font=FONT_MONO, size=12,
+                bold=True, color=ACCENT_PURPLE),
+        textbox(MARGIN_X, Inches(2.5), Inches(6), Inches(2), "THANK YOU FOR ARRIVING THIS FAR.", font=FONT_SANS,
+                size=44, bold=True),
+        textbox(MARGIN_X, Inches(4.5), Inches(5.5), Inches(1), "Axiom Forge is ready to use. Experience the system that turns intent into identity.",
+                size=16, color=TEXT_SECONDARY),
+        cta_button(MARGIN_X, Inches(6.0), "TRY THE PROTOTYPE"),
+        # Right side
+        textbox(right_center - Inches(3), Inches(1.5), Inches(6), Inches(0.5), "// SPOILER ALERT: YOUR FIRST MINDSET PILL",
+                font=FONT_MONO, size=10, bold=True, color=ACCENT_GREEN, align='center'),
+        *mindset_card(right_center - Inches(2.5), Inches(2.2), Inches(5), Inches(4.5)),
+    ])
+
+
+def product_context_slide():
+    phone_w = Inches(3.5)
+    phone_h = Inches(6.5)
+    phone_x = Inches(2.0)
+    phone_y = Inches(0.8)
+    screen_margin = Inches(0.15)
+    screen_x = phone_x + screen_margin
+    screen_y = phone_y + screen_margin
+    screen_w = phone_w - (screen_margin * 2)
+    screen_h = phone_h - (screen_margin * 2)
+    notch_w = Inches(1.2)
+    header_y = screen_y + Inches(0.5)
+    pill_y = header_y + Inches(0.6)
+    auth_y = pill_y + Inches(1.8)
+    ref_y = auth_y + Inches(0.8)
+    right_x = SLIDE_W / 2 + Inches(0.5)
+    return slide("Option 2: Product Context", [
+        CORNER_LOGO,
+        option_tag("OPTION 2: PRODUCT CONTEXT"),
+        # Phone body, screen and notch
+        box(phone_x, phone_y, phone_w, phone_h, shape='rounded_rectangle', fill=BG, line=BORDER_DARK, line_width=4),
+        panel(screen_x, screen_y, screen_w, screen_h, fill=BG),
+        panel(phone_x + (phone_w - notch_w) / 2, phone_y, notch_w, Inches(0.3), fill=BORDER_DARK),
+        # Phone content
+        textbox(screen_x, header_y, screen_w, Inches(0.3), "MINDSET", font=FONT_SANS, size=12, bold=True, align='center'),
+        box(screen_x, header_y + Inches(0.4), screen_w, Pt(1), fill=BORDER_DARK),
+        textbox(screen_x + Inches(0.2), pill_y, screen_w, Inches(0.2), "// DAILY PILL", font=FONT_MONO, size=8,
+                bold=True, color=ACCENT_GREEN),
+        textbox(screen_x + Inches(0.2), pill_y + Inches(0.3), screen_w - Inches(0.4), Inches(1.5),
+                "\"You can have more than you've got because you can become more than you are.\"",
+                font=FONT_MONO, size=12, bold=True),
+        panel(screen_x + Inches(0.2), auth_y, screen_w - Inches(0.4), Inches(0.5), fill=RGBColor(20, 20, 20)),
+        panel(screen_x + Inches(0.2), auth_y, Inches(0.05), Inches(0.5), fill=ACCENT_GREEN),
+        textbox(screen_x + Inches(0.6), auth_y + Inches(0.1), Inches(2), Inches(0.3), "JIM ROHN", font=FONT_SANS,
+                size=10, bold=True),
+        panel(screen_x + Inches(0.35), auth_y + Inches(0.12), Inches(0.25), Inches(0.25), fill=ACCENT_GREEN),
+        textbox(screen_x + Inches(0.2), ref_y, screen_w, Inches(0.2), "// REFLECTION", font=FONT_MONO, size=8,
+                bold=True, color=TEXT_MUTED),
+        panel(screen_x + Inches(0.2), ref_y + Inches(0.3), screen_w - Inches(0.4), Inches(0.6), border=BORDER_DARK,
+              fill=BG, line_width=1),
+        textbox(screen_x + Inches(0.3), ref_y + Inches(0.4), screen_w, Inches(0.2), "How does this apply to you?",
+                size=8, color=TEXT_MUTED),
+        textbox(screen_x + Inches(0.2), ref_y + Inches(1.0), screen_w - Inches(0.4), Inches(0.3), "★ ★ ★ ★ ★",
+                size=12, color=BORDER_DARK, align='center'),
+        # Right side
+        textbox(right_x, Inches(2.5), Inches(5), Inches(1.5), "Start building your\nAxiom today.", font=FONT_SANS,
+                size=40, bold=True),
+        textbox(right_x, Inches(4.2), Inches(5), Inches(1), "Join the closed beta to unlock the full system, including daily mindset pills and smart routine tracking.",
+                size=16, color=TEXT_SECONDARY),
+        cta_button(right_x, Inches(5.5), "LAUNCH PROTOTYPE"),
+        # Footer contact
+        box(right_x, Inches(6.5), Inches(5), Pt(1), fill=BORDER_DARK),
+        textbox(right_x, Inches(6.6), Inches(5), Inches(0.8), "Javier Serrano\nMIT Sandbox\njavier@axiomforge.app",
+                size=12, color=TEXT_SECONDARY),
+    ])
+
+
+def philosophy_first_slide():
+    center_x = SLIDE_W / 2
+    corner_size = Inches(0.8)
+    return slide("Option 3: Philosophy First", [
+        option_tag("OPTION 3: PHILOSOPHY FIRST"),
+        textbox(MARGIN_X, Inches(1.5), CONTENT_W, Inches(0.5), "// YOUR FIRST PRINCIPLE", font=FONT_MONO, size=14,
+                bold=True, color=ACCENT_PURPLE, align='center'),
+        # Quote corners: top left, bottom right
+        box(center_x - Inches(4), Inches(2.2), Pt(4), corner_size, fill=ACCENT_GREEN),
+        box(center_x - Inches(4), Inches(2.2), corner_size, Pt(4), fill=ACCENT_GREEN),
+        box(center_x + Inches(4), Inches(4.5) - corner_size, Pt(4), corner_size, fill=ACCENT_GREEN),
+        box(center_x + Inches(4) - corner_size, Inches(4.5), corner_size, Pt(4), fill=ACCENT_GREEN),
+        textbox(center_x - Inches(4), Inches(2.5), Inches(8), Inches(2), "\"UNLESS YOU CHANGE HOW YOU ARE, YOU'LL ALWAYS HAVE WHAT YOU GOT.\"",
+                font=FONT_SANS, size=32, bold=True, align='center'),
+        textbox(center_x - Inches(4), Inches(5.0), Inches(8), Inches(0.5), "—JIM ROHN", size=14, bold=True,
+                color=ACCENT_GREEN, align='center'),
+        textbox(center_x - Inches(4), Inches(6.0), Inches(8), Inches(0.5), "Thank you for your time.", size=18,
+                color=TEXT_SECONDARY, align='center'),
+        cta_button(center_x - Inches(3.2), Inches(6.5), "TRY AXIOM FORGE"),
+        cta_button(center_x + Inches(0.2), Inches(6.5), "CONTACT FOUNDER", primary=False),
+    ])
+
+
+def system_terminal_slide():
+    term_w = Inches(9)
+    term_h = Inches(4.5)
+    term_x = (SLIDE_W - term_w) / 2
+    term_y = Inches(2.0)
+    header_h = Inches(0.4)
+    components = [
+        CORNER_LOGO,
+        option_tag("OPTION 4: SYSTEM TERMINAL"),
+        textbox(MARGIN_X, Inches(1.0), CONTENT_W, Inches(0.8), "SYSTEM INITIALIZATION COMPLETE", font=FONT_SANS,
+                size=36, bold=True, align='center'),
+        # Window body and header
+        panel(term_x, term_y, term_w, term_h, border=BORDER_DARK, fill=BG_SECONDARY, line_width=2),
+        panel(term_x, term_y, term_w, header_h, fill=BORDER_DARK),
+    ]
+    for i, color in enumerate([RGBColor(255, 95, 86), RGBColor(255, 189, 46), RGBColor(39, 201, 63)]):
+        components.append(box(term_x + Inches(0.2) + i * Inches(0.25), term_y + Inches(0.12), Inches(0.15), Inches(0.15),
+                              shape='oval', fill=color, line=NONE))
+    components.append(textbox(term_x + Inches(1.0), term_y + Inches(0.05), Inches(3), Inches(0.3), "axiom-forge -- init",
+                              font=FONT_MONO, size=10, color=TEXT_SECONDARY))
+
+    lines = [
+        ("➜ loading routines... [OK]", TEXT_SECONDARY),
+        ("➜ connecting behavioral_insights... [OK]", TEXT_SECONDARY),
+        ("➜ generating mindset_pill_001... [DONE]", TEXT_SECONDARY),
+        ("", TEXT_PRIMARY),
+        ("OUTPUT RECEIVED:", ACCENT_GREEN),
+    ]
+    current_y = term_y + header_h + Inches(0.2)
+    for text, color in lines:
+        if text:
+            components.append(textbox(term_x + Inches(0.3), current_y, term_w, Inches(0.3), text, font=FONT_MONO,
+                                      size=12, color=color))
+        current_y += Inches(0.25)
+
+    # Output box
+    out_x = term_x + Inches(0.3)
+    out_w = term_w - Inches(0.6)
+    components += [
+        panel(out_x, current_y, Inches(0.05), Inches(1.2), fill=TEXT_PRIMARY),
+        textbox(out_x + Inches(0.2), current_y, out_w, Inches(0.8), "\"Here's the big challenge of life. You can have more than you've got because you can become more than you are.\"",
+                font=FONT_MONO, size=12),
+        textbox(out_x + Inches(0.2), current_y + Inches(0.8), out_w, Inches(0.3), ">> Jim Rohn, Entrepreneur",
+                font=FONT_MONO, size=10, color=ACCENT_PURPLE),
+    ]
+    current_y += Inches(1.5)
+    components += [
+        textbox(term_x + Inches(0.3), current_y, Inches(2), Inches(0.3), "➜ ready for user input_", font=FONT_MONO,
+                size=12, color=TEXT_SECONDARY),
+        # Cursor
+        panel(term_x + Inches(2.6), current_y, Inches(0.12), Inches(0.25), fill=ACCENT_GREEN),
+        cta_button((SLIDE_W - Inches(3)) / 2, term_y + term_h + Inches(0.3), "LAUNCH APPLICATION"),
+    ]
+    return slide("Option 4: System Terminal", components)
+
+
+def card_reveal_slide():
+    stack_center_x = SLIDE_W * 0.75
+    stack_center_y = Inches(3.75)
+    card_w = Inches(4.5)
+    card_h = Inches(2.8)
+    cx = stack_center_x - card_w / 2
+    cy = stack_center_y - card_h / 2
+    cf_y = cy + card_h - Inches(0.6)
+    return slide("Option 5: Card Reveal", [
+        CORNER_LOGO,
+        option_tag("OPTION 5: CARD REVEAL"),
+        # Left side
+        textbox(MARGIN_X, Inches(2.0), Inches(5), Inches(0.3), "// PROTOTYPE READY", font=FONT_MONO, size=12,
+                bold=True, color=ACCENT_GREEN),
+        textbox(MARGIN_X, Inches(2.5), Inches(6), Inches(1.5), "FROM THEORY TO PRACTICE.", font=FONT_SANS, size=44,
+                bold=True),
+        textbox(MARGIN_X, Inches(4.2), Inches(5.5), Inches(1), "We've built the engine. Now we need the fuel.\nThank you for reviewing Axiom Forge.",
+                size=16, color=TEXT_SECONDARY),
+        # Signature
+        box(MARGIN_X, Inches(5.5), Pt(2), Inches(0.8), fill=BORDER_DARK),
+        textbox(MARGIN_X + Inches(0.2), Inches(5.5), Inches(4), Inches(0.8), "Javier Serrano\nMIT Sandbox | Winter 2026",
+                size=12, color=TEXT_SECONDARY),
+        cta_button(MARGIN_X, Inches(6.5), "OPEN PROTOTYPE"),
+        # Right side card stack, bottom to top
+        box(cx + Inches(0.4), cy + Inches(0.2), card_w, card_h, line=BORDER_DARK, line_width=2,
+            fill=RGBColor(20, 20, 20), rotation=-6),
+        box(cx + Inches(0.2), cy + Inches(0.1), card_w, card_h, line=RGBColor(80, 80, 80), line_width=2,
+            fill=RGBColor(30, 30, 30), rotation=-3),
+        panel(cx, cy, card_w, card_h, border=TEXT_PRIMARY, fill=BG, line_width=4),
+        # Label
+        panel(cx + Inches(0.2), cy + Inches(0.15), Inches(1.2), Inches(0.25), fill=ACCENT_GREEN),
+        textbox(cx + Inches(0.25), cy + Inches(0.15), Inches(1.2), Inches(0.25), "MINDSET #001", font=FONT_SANS, size=9,
+                bold=True, color=BG),
+        textbox(cx + Inches(3.8), cy + Inches(0.15), Inches(0.5), Inches(0.3), "•••", color=TEXT_SECONDARY),
+        textbox(cx + Inches(0.3), cy + Inches(0.6), card_w - Inches(0.6), Inches(1.5), "\"YOU CAN HAVE MORE THAN YOU'VE GOT BECAUSE YOU CAN BECOME MORE THAN YOU ARE.\"",
+                font=FONT_MONO, size=14, bold=True),
+        # Footer inside card
+        panel(cx + Inches(0.3), cf_y, Inches(0.3), Inches(0.3), border=TEXT_PRIMARY, line_width=1),
+        textbox(cx + Inches(0.3), cf_y, Inches(0.3), Inches(0.3), "JR", size=8, bold=True, align='center'),
+        textbox(cx + Inches(0.7), cf_y, Inches(2), Inches(0.3), "JIM ROHN", size=10, color=TEXT_SECONDARY),
+    ])
+
+
+DECK = {
+    'name': 'closing-slide-options',
+    'output': 'closing-slide-options.pptx',
+    'slides': [
+        split_screen_slide(),
+        product_context_slide(),
+        philosophy_first_slide(),
+        system_terminal_slide(),
+        card_reveal_slide(),
+    ],
+}
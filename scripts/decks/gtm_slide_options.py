@@ -0,0 +1,366 @@
+"""Go-to-market slide options: five approaches for reaching the first beta users."""
+
+from pptx.util import Inches, Pt
+
+from deck_engine import (
+    ACCENT_GREEN, ACCENT_PURPLE, BORDER_DARK, CONTENT_W, FONT_BODY, FONT_SANS, GREEN_TINT, MARGIN_X,
+    NONE, PURPLE_TINT, SLIDE_W, TEXT_MUTED, TEXT_PRIMARY, TEXT_SECONDARY, box, logo, para, rich_text,
+    slide,
+)
+from deck_engine import textbox as _textbox
+
+FONT_MONO = "Courier New"
+
+LOGO_SIZE = Inches(0.5)
+CORNER_LOGO = logo(SLIDE_W - MARGIN_X - LOGO_SIZE, Inches(0.4), LOGO_SIZE, outline=False)
+
+# Tinted fill behind a box bordered in an accent colour
+TINTS = {ACCENT_GREEN: GREEN_TINT, ACCENT_PURPLE: PURPLE_TINT}
+
+
+def textbox(x, y, w, h, text, **style):
+    return _textbox(x, y, w, h, text, wrap=True, **style)
+
+
+def panel(x, y, w, h, border=None, fill=None, line_width=0):
+    """A rectangle with an optional border; no border or fill means none, not the theme default"""
+    return box(x, y, w, h, line=border or NONE, line_width=line_width if border else None, fill=fill or NONE)
+
+
+def section_label(text, x, y):
+    return textbox(x, y, Inches(6), Inches(0.3), f"// {text.upper()}", font=FONT_MONO, size=14, bold=True,
+                   color=ACCENT_PURPLE)
+
+
+def bullets(x, y, w, h, items, size=14, color=TEXT_SECONDARY):
+    # The first paragraph is left empty; items are added after it
+    return rich_text(x, y, w, h, [None] + [
+        para(item, font=FONT_BODY, size=size, color=color, level=0, space_before=6, run=False)
+        for item in items
+    ], wrap=True)
+
+
+def option_slide(title, label, heading, components, heading_h=Inches(0.8)):
+    return slide(title, [
+        CORNER_LOGO,
+        section_label(label, MARGIN_X, Inches(0.4)),
+        textbox(MARGIN_X, Inches(0.8), CONTENT_W, heading_h, heading, font=FONT_SANS, size=36, bold=True),
+        *components,
+    ])
+
+
+def intro_slide():
+    return slide("Go-to-Market Slide Options", [
+        textbox(MARGIN_X, Inches(2.5), CONTENT_W, Inches(1.5), "Go-to-Market Slide Options", font=FONT_SANS,
+                size=54, bold=True, align='center'),
+        textbox(MARGIN_X, Inches(4.2), CONTENT_W, Inches(0.5), "5 different approaches for reaching your first 40-60 beta users",
+                size=20, color=TEXT_SECONDARY, align='center'),
+        textbox(MARGIN_X, Inches(5.5), CONTENT_W, Inches(0.5), "Navigate through the options", size=14,
+                bold=True, color=ACCENT_GREEN, align='center'),
+    ])
+
+
+def four_channel_slide():
+    grid_y = Inches(2.2)
+    gap = Inches(0.3)
+    col_w = (CONTENT_W - (3 * gap)) / 4
+    box_h = Inches(3.5)
+    channels = [
+        ("01", "MIT Campus", "Target: 15-20 users", ACCENT_GREEN,
+         ["Dorm workshops", "Student group demos", "Campus email blast", "Friend referrals"]),
+        ("02", "Online Communities", "Target: 15-20 users", ACCENT_PURPLE,
+         ["r/productivity", "r/getdisciplined", "Indie Hackers", "Discord servers"]),
+        ("03", "Content Marketing", "Target: 10-15 users", ACCENT_PURPLE,
+         ["2-3 TikToks/week", "Problem-solution posts", "Beta access CTA", "Behind-the-scenes"]),
+        ("04", "Micro-Influencers", "Target: 5-10 users", TEXT_PRIMARY,
+         ["Reach out to 20", "Early access offer", "Feedback partnership", "Organic mentions"]),
+    ]
+    components = []
+    for i, (num, title, target, color, items) in enumerate(channels):
+        x = MARGIN_X + i * (col_w + gap)
+        components += [
+            panel(x, grid_y, col_w, box_h, border=color, fill=TINTS.get(color), line_width=2),
+            textbox(x + Inches(0.2), grid_y + Inches(0.2), col_w, Inches(0.5), num, font=FONT_SANS, size=32,
+                    bold=True, color=ACCENT_GREEN),
+            textbox(x + Inches(0.2), grid_y + Inches(0.8), col_w - Inches(0.4), Inches(0.3), title.upper(),
+                    font=FONT_SANS, size=14, bold=True),
+            textbox(x + Inches(0.2), grid_y + Inches(1.2), col_w - Inches(0.4), Inches(0.3), target, size=11,
+                    bold=True, color=ACCENT_GREEN),
+            bullets(x + Inches(0.1), grid_y + Inches(1.5), col_w - Inches(0.2), Inches(1.5), items, size=11),
+        ]
+    card_y = grid_y + box_h + Inches(0.4)
+    components += [
+        panel(MARGIN_X, card_y, CONTENT_W, Inches(0.8), border=ACCENT_GREEN, fill=GREEN_TINT, line_width=2),
+        textbox(MARGIN_X, card_y + Inches(0.2), CONTENT_W, Inches(0.4), "Parallel execution across 4 channels to reach 50+ beta users in 4-6 weeks",
+                size=14, bold=True, align='center'),
+    ]
+    return option_slide("Option 1: 4-Channel Beta Recruitment", "Go-to-Market / Option 1",
+                        "4-Channel Beta Recruitment Strategy", components, heading_h=Inches(1))
+
+
+def three_phase_slide():
+    tl_y = Inches(2.2)
+    phase_w = CONTENT_W / 3
+    phase_h = Inches(2.8)
+    phases = [
+        ("W1-2", "Warm Network", True,
+         ["MIT friends & classmates", "Personal social media", "Direct outreach", "Target: 15 users"]),
+        ("W3-4", "Community Seeding", False,
+         ["Reddit posts (5-8 subs)", "ProductHunt 'coming soon'", "Discord communities", "Target: 20-25 users"]),
+        ("W5-6", "Content Amplification", False,
+         ["12-15 content pieces", "Micro-influencer outreach", "User testimonials", "Target: 15-20 users"]),
+    ]
+    components = []
+    for i, (num, title, active, items) in enumerate(phases):
+        # Boxes butt against each other like the shared borders in the HTML
+        x = MARGIN_X + i * phase_w
+        components += [
+            panel(x, tl_y, phase_w, phase_h, border=ACCENT_GREEN if active else TEXT_PRIMARY,
+                  fill=GREEN_TINT if active else None, line_width=2),
+            textbox(x + Inches(0.2), tl_y + Inches(0.2), phase_w, Inches(0.6), num, font=FONT_SANS, size=32,
+                    bold=True, color=ACCENT_GREEN if active else TEXT_MUTED),
+            textbox(x + Inches(0.2), tl_y + Inches(0.8), phase_w, Inches(0.3), title.upper(), font=FONT_SANS,
+                    size=14, bold=True),
+            bullets(x + Inches(0.1), tl_y + Inches(1.1), phase_w - Inches(0.2), Inches(1.5), items, size=12),
+        ]
+
+    stat_y = tl_y + phase_h + Inches(0.4)
+    stat_w = (CONTENT_W - Inches(0.4)) / 2
+    stat_h = Inches(1.5)
+    stat2_x = MARGIN_X + stat_w + Inches(0.4)
+    note_y = stat_y + stat_h + Inches(0.2)
+    components += [
+        panel(MARGIN_X, stat_y, stat_w, stat_h, border=ACCENT_GREEN, fill=GREEN_TINT, line_width=2),
+        textbox(MARGIN_X, stat_y + Inches(0.2), stat_w, Inches(0.6), "50-60", font=FONT_SANS, size=36, bold=True,
+                color=ACCENT_GREEN, align='center'),
+        textbox(MARGIN_X, stat_y + Inches(0.8), stat_w, Inches(0.3), "BETA USERS IN 6 WEEKS", size=12,
+                color=TEXT_SECONDARY, align='center'),
+        panel(stat2_x, stat_y, stat_w, stat_h, border=TEXT_PRIMARY, line_width=2),
+        textbox(stat2_x, stat_y + Inches(0.2), stat_w, Inches(0.6), "$200-400", font=FONT_SANS, size=36, bold=True,
+                color=ACCENT_PURPLE, align='center'),
+        textbox(stat2_x, stat_y + Inches(0.8), stat_w, Inches(0.3), "ESTIMATED COST", size=12,
+                color=TEXT_SECONDARY, align='center'),
+        panel(MARGIN_X, note_y, CONTENT_W, Inches(0.6), border=TEXT_PRIMARY, line_width=1),
+        textbox(MARGIN_X + Inches(0.2), note_y + Inches(0.15), CONTENT_W - Inches(0.4), Inches(0.3), "Sequential approach builds momentum and lets you refine messaging between phases.",
+                size=12, color=TEXT_SECONDARY),
+    ]
+    return option_slide("Option 2: 3-Phase Launch", "Go-to-Market / Option 2", "3-Phase Beta Launch Strategy",
+                        components, heading_h=Inches(1))
+
+
+# Two-column layout shared by options 3 and 4
+COL_GAP = Inches(0.6)
+COL_W = (CONTENT_W - COL_GAP) / 2
+LEFT_X = MARGIN_X
+RIGHT_X = MARGIN_X + COL_W + COL_GAP
+
+
+def problem_first_slide():
+    content_y = Inches(2.2)
+    components = [
+        textbox(MARGIN_X, Inches(1.4), CONTENT_W, Inches(0.5), "Lead with pain points, then offer solution access",
+                size=16, color=TEXT_SECONDARY),
+        textbox(LEFT_X, content_y, COL_W, Inches(0.4), "Where Your Users Are Struggling", font=FONT_SANS, size=16,
+                bold=True, color=ACCENT_GREEN),
+    ]
+    problems = [
+        ("r/productivity (3.5M members)", "\"Can't stick to my routine\""),
+        ("r/getdisciplined (1.5M)", "\"Apps don't help me understand why\""),
+        ("r/selfimprovement (1.2M)", "\"Need science-backed approach\""),
+        ("TikTok comments", "\"How do I actually DO this?\""),
+    ]
+    prob_y = content_y + Inches(0.6)
+    for title, sub in problems:
+        components += [
+            textbox(LEFT_X, prob_y, COL_W, Inches(0.3), f"• {title}", size=14, bold=True),
+            textbox(LEFT_X + Inches(0.3), prob_y + Inches(0.3), COL_W, Inches(0.3), sub, size=12, color=TEXT_SECONDARY),
+        ]
+        prob_y += Inches(0.8)
+
+    components.append(textbox(RIGHT_X, content_y, COL_W, Inches(0.4), "Engagement Strategy", font=FONT_SANS, size=16,
+                              bold=True, color=ACCENT_GREEN))
+    cards = [
+        ("Week 1-2: Listen & Engage", "Comment on frustration posts, offer insights, build credibility", ACCENT_PURPLE),
+        ("Week 3-4: Share Solution", "Value-first posts about behavioral science + beta access offer", ACCENT_PURPLE),
+        ("Week 5-6: Amplify", "User testimonials, insights from beta cohort", ACCENT_GREEN),
+    ]
+    card_y = content_y + Inches(0.6)
+    for title, desc, color in cards:
+        components += [
+            panel(RIGHT_X, card_y, COL_W, Inches(1.2), border=color, fill=GREEN_TINT if color == ACCENT_GREEN else None,
+                  line_width=2),
+            textbox(RIGHT_X + Inches(0.2), card_y + Inches(0.15), COL_W - Inches(0.4), Inches(0.3), title, size=13, bold=True),
+            textbox(RIGHT_X + Inches(0.2), card_y + Inches(0.45), COL_W - Inches(0.4), Inches(0.6), desc, size=12,
+                    color=TEXT_SECONDARY),
+        ]
+        card_y += Inches(1.4)
+
+    why_y = Inches(6.5)
+    components += [
+        panel(MARGIN_X, why_y, CONTENT_W, Inches(0.8), border=TEXT_PRIMARY, line_width=1),
+        textbox(MARGIN_X + Inches(0.2), why_y + Inches(0.1), CONTENT_W, Inches(0.3), "Why This Works", size=12, bold=True),
+        textbox(MARGIN_X + Inches(0.2), why_y + Inches(0.35), CONTENT_W - Inches(0.4), Inches(0.4), "You're not selling an app - you're offering a solution to a problem they're already posting about daily.",
+                size=12, color=TEXT_SECONDARY),
+    ]
+    return option_slide("Option 3: Problem-First", "Go-to-Market / Option 3", "Problem-First Community Approach",
+                        components)
+
+
+def influencer_slide():
+    content_y = Inches(2.0)
+    plat_y = content_y + Inches(3.5)
+    components = [
+        # Left: stat block, target profile and platforms
+        panel(LEFT_X, content_y, COL_W, Inches(1.2), border=ACCENT_GREEN, fill=GREEN_TINT, line_width=2),
+        textbox(LEFT_X, content_y + Inches(0.2), COL_W, Inches(0.5), "20", font=FONT_SANS, size=36, bold=True,
+                color=ACCENT_GREEN, align='center'),
+        textbox(LEFT_X, content_y + Inches(0.7), COL_W, Inches(0.3), "MICRO-INFLUENCERS TO REACH", size=10,
+                color=TEXT_SECONDARY, align='center'),
+        textbox(LEFT_X, content_y + Inches(1.5), COL_W, Inches(0.3), "Target Profile", font=FONT_SANS, size=14, bold=True),
+        bullets(LEFT_X, content_y + Inches(1.8), COL_W, Inches(1.5),
+                ["5K-50K followers", "Productivity/wellness niche", "High engagement rate (>3%)", "Creates routine content"]),
+        panel(LEFT_X, plat_y, COL_W, Inches(0.8), border=TEXT_PRIMARY, line_width=1),
+        textbox(LEFT_X + Inches(0.2), plat_y + Inches(0.1), COL_W, Inches(0.2), "Platforms to Target", size=11, bold=True),
+        textbox(LEFT_X + Inches(0.2), plat_y + Inches(0.35), COL_W, Inches(0.3), "TikTok, Instagram, YouTube", size=11,
+                color=TEXT_SECONDARY),
+        # Right: partnership offer
+        textbox(RIGHT_X, content_y, COL_W, Inches(0.4), "Partnership Offer", font=FONT_SANS, size=16, bold=True,
+                color=ACCENT_GREEN),
+    ]
+    offer_cards = [
+        ("Early Access + Co-Creation", "Exclusive beta access + input on routine templates", ACCENT_PURPLE),
+        ("Custom Routine Template", "Feature their routine as a template in the app", ACCENT_PURPLE),
+        ("Lifetime Pro Access", "Free premium when you launch monetization", ACCENT_PURPLE),
+        ("Expected Conversion", "20 outreach -> 5-7 partnerships -> 30-40 beta users", ACCENT_GREEN),
+    ]
+    cy = content_y + Inches(0.5)
+    for title, desc, color in offer_cards:
+        components += [
+            panel(RIGHT_X, cy, COL_W, Inches(0.9), border=color, fill=GREEN_TINT if color == ACCENT_GREEN else None,
+                  line_width=2),
+            textbox(RIGHT_X + Inches(0.15), cy + Inches(0.1), COL_W - Inches(0.3), Inches(0.3), title, size=12, bold=True),
+            textbox(RIGHT_X + Inches(0.15), cy + Inches(0.4), COL_W - Inches(0.3), Inches(0.4), desc, size=10,
+                    color=TEXT_SECONDARY),
+        ]
+        cy += Inches(1.05)
+
+    # Funnel
+    funnel_y = Inches(6.5)
+    stages = [("Reach Out", "20"), ("Respond", "10-12"), ("Partner", "5-7"), ("Beta Users", "30-40")]
+    stage_w = CONTENT_W / 4
+    for i, (label, val) in enumerate(stages):
+        sx = MARGIN_X + i * stage_w
+        highlight = i == 3
+        components += [
+            panel(sx, funnel_y, stage_w, Inches(0.8), border=ACCENT_GREEN if highlight else TEXT_PRIMARY,
+                  fill=GREEN_TINT if highlight else None, line_width=2),
+            textbox(sx + Inches(0.1), funnel_y + Inches(0.25), stage_w / 2, Inches(0.3), label.upper(), size=10, bold=True),
+            textbox(sx + stage_w / 2, funnel_y + Inches(0.15), stage_w / 2 - Inches(0.1), Inches(0.5), val,
+                    font=FONT_SANS, size=20, bold=True, color=ACCENT_GREEN, align='right'),
+        ]
+    return option_slide("Option 4: Influencer Model", "Go-to-Market / Option 4", "Influencer Micro-Partnership Model",
+                        components)
+
+
+def mit_pipeline_slide():
+    gap = Inches(0.4)
+    cw = (CONTENT_W - 2 * gap) / 3
+    cy = Inches(2.2)
+    ch = Inches(3.2)
+    cols = [
+        ("Phase 1: MIT Launch", "Weeks 1-3", ACCENT_GREEN,
+         ["Campus email blast", "Dorm presentations", "Student group demos", "Referral incentive"], "Target: 25-30 users"),
+        ("Phase 2: Campus Expansion", "Weeks 4-5", ACCENT_PURPLE,
+         ["Harvard, BU, Northeastern", "Student ambassador program", "College subreddits", "Uni Discord servers"],
+         "Target: 15-20 users"),
+        ("Phase 3: Online Communities", "Weeks 6+", TEXT_PRIMARY,
+         ["Reddit productivity subs", "ProductHunt launch", "Indie Hackers", "Content marketing"], "Target: 10-15 users"),
+    ]
+    components = [
+        textbox(MARGIN_X, Inches(1.4), CONTENT_W, Inches(0.5), "Validate on campus, then expand with proven model",
+                size=16, color=TEXT_SECONDARY),
+    ]
+    for i, (title, time, color, items, target) in enumerate(cols):
+        cx = MARGIN_X + i * (cw + gap)
+        line_y = cy + ch - Inches(0.6)
+        components += [
+            panel(cx, cy, cw, ch, border=color, fill=TINTS.get(color), line_width=2),
+            textbox(cx + Inches(0.15), cy + Inches(0.2), cw - Inches(0.3), Inches(0.3), title, size=13, bold=True),
+            textbox(cx + Inches(0.15), cy + Inches(0.45), cw - Inches(0.3), Inches(0.2), time, size=11, color=TEXT_SECONDARY),
+            bullets(cx + Inches(0.1), cy + Inches(0.8), cw - Inches(0.2), Inches(1.5), items, size=11),
+            panel(cx + Inches(0.15), line_y, cw - Inches(0.3), Pt(1), fill=BORDER_DARK),
+            textbox(cx + Inches(0.15), line_y + Inches(0.1), cw - Inches(0.3), Inches(0.3), target, size=12, bold=True,
+                    color=color),
+        ]
+    why_y = cy + ch + Inches(0.4)
+    components += [
+        panel(MARGIN_X, why_y, CONTENT_W, Inches(0.8), border=ACCENT_GREEN, fill=GREEN_TINT, line_width=2),
+        textbox(MARGIN_X + Inches(0.2), why_y + Inches(0.1), CONTENT_W, Inches(0.3), "Why Start with MIT", size=12, bold=True),
+        textbox(MARGIN_X + Inches(0.2), why_y + Inches(0.35), CONTENT_W - Inches(0.4), Inches(0.4), "Credibility boost, easy access for interviews, homogeneous cohort for better insights.",
+                size=12, color=TEXT_SECONDARY),
+    ]
+    return option_slide("Option 5: MIT Pipeline", "Go-to-Market / Option 5", "MIT-to-Market Pipeline", components)
+
+
+def summary_slide():
+    ty = Inches(2.0)
+    row_h = Inches(0.6)
+    cols_def = [
+        ("Option", Inches(2.5)),
+        ("Best For", Inches(3.5)),
+        ("Time", Inches(1.5)),
+        ("Budget", Inches(2.0)),
+        ("Risk", Inches(1.5)),
+    ]
+    components = []
+    # Headers; rows are drawn as boxes rather than a table for closer styling
+    current_x = MARGIN_X
+    for name, w in cols_def:
+        components.append(textbox(current_x, ty, w, Inches(0.3), name, size=12, bold=True, color=TEXT_SECONDARY))
+        current_x += w
+
+    rows = [
+        ["4-Channel Funnel", "Maximum reach & speed", "High", "$400-600", "Low"],
+        ["3-Phase Launch", "Controlled growth & learning", "Medium", "$200-400", "Low"],
+        ["Problem-First", "Organic engagement", "Medium", "$0-200", "Medium"],
+        ["Micro-Influencers", "Fast user acquisition via trust", "Low-Medium", "$0 (equity)", "Med-High"],
+        ["MIT-to-Market", "Credibility + Access (Recommended)", "Medium", "$300-500", "Low"],
+    ]
+    ty += Inches(0.4)
+    for i, row in enumerate(rows):
+        is_rec = i == 4
+        components.append(panel(MARGIN_X, ty, CONTENT_W, row_h, fill=GREEN_TINT if is_rec else None))
+        curr_x = MARGIN_X
+        for j, cell_text in enumerate(row):
+            w = cols_def[j][1]
+            components.append(textbox(curr_x, ty + Inches(0.15), w, row_h, cell_text, size=12, bold=j == 0,
+                                      color=ACCENT_GREEN if is_rec and j == 0 else TEXT_PRIMARY))
+            curr_x += w
+        # Row border
+        components.append(panel(MARGIN_X, ty + row_h, CONTENT_W, Pt(1), fill=BORDER_DARK))
+        ty += row_h
+
+    rec_y = ty + Inches(0.4)
+    components += [
+        panel(MARGIN_X, rec_y, CONTENT_W, Inches(1.2), border=ACCENT_GREEN, fill=GREEN_TINT, line_width=2),
+        textbox(MARGIN_X + Inches(0.2), rec_y + Inches(0.2), CONTENT_W, Inches(0.3), "// RECOMMENDATION", font=FONT_MONO,
+                size=12, bold=True, color=ACCENT_GREEN),
+        textbox(MARGIN_X + Inches(0.2), rec_y + Inches(0.5), CONTENT_W - Inches(0.4), Inches(0.6), "Option 5 (MIT-to-Market) offers the best balance of credibility, access, and controlled expansion - while keeping costs within your budget.",
+                size=16, bold=True),
+    ]
+    return option_slide("Summary", "Summary", "Which Strategy Fits Best?", components)
+
+
+DECK = {
+    'name': 'gtm-slide-options',
+    'output': 'gtm-slide-options.pptx',
+    'slides': [
+        intro_slide(),
+        four_channel_slide(),
+        three_phase_slide(),
+        problem_first_slide(),
+        influencer_slide(),
+        mit_pipeline_slide(),
+        summary_slide(),
+    ],
+}
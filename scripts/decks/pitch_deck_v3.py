@@ -0,0 +1,400 @@
+"""Axiom Forge MIT Sandbox pitch deck, v3 (eleven slides)."""
+
+from pptx.dml.color import RGBColor
+from pptx.util import Inches
+
+from deck_engine import (
+    ACCENT_GREEN, ACCENT_PURPLE, ACCENT_RED, BG, BG_SECONDARY, COL_W, CONTENT_W, FONT_BODY,
+    FONT_SANS, GAP_COL, MARGIN_TOP, MARGIN_X, NONE, SLIDE_W, TEXT_MUTED, TEXT_PRIMARY,
+    TEXT_SECONDARY, body, box, cell, connector, h1, h3, logo, para, rich_text, section_label,
+    slide, table, textbox,
+)
+
+CORNER_LOGO = logo(SLIDE_W - Inches(1.2), Inches(0.35), Inches(0.7))
+RIGHT_X = MARGIN_X + COL_W + GAP_COL
+
+
+def bullets(x, y, w, h, items, size=18, color=TEXT_PRIMARY):
+    return rich_text(x, y, w, h, [
+        para(f"- {item}", font=FONT_BODY, size=size, color=color, level=0, align='left',
+             space_after=6, space_before=6, run=False)
+        for item in items
+    ], wrap=True)
+
+
+def stat_block(x, y, w, h, value, label, color=ACCENT_GREEN):
+    return box(x, y, w, h, line=color, fill=BG_SECONDARY, line_width=2.5, paragraphs=[
+        para(value, font=FONT_SANS, size=40, bold=True, color=color, align='center'),
+        para(label, font=FONT_BODY, size=14, color=TEXT_SECONDARY, align='center', run=False),
+    ])
+
+
+def content_slide(title, label, heading, components):
+    """A numbered content slide: corner logo, section label and heading first"""
+    return slide(title, [
+        CORNER_LOGO,
+        section_label(label, MARGIN_X, MARGIN_TOP),
+        h1(heading, MARGIN_X, Inches(0.95), CONTENT_W),
+        *components,
+    ])
+
+
+def title_slide():
+    logo_size = Inches(1.1)
+    components = [
+        logo((SLIDE_W - logo_size) / 2, Inches(1.0), logo_size),
+        textbox(Inches(0.5), Inches(2.1), SLIDE_W - Inches(1.0), Inches(0.8), "Axiom Forge",
+                font=FONT_SANS, size=56, bold=True, align='center'),
+        textbox(Inches(2.0), Inches(3.0), SLIDE_W - Inches(4.0), Inches(0.35), "PRINCIPLES TURNED INTO PRACTICE",
+                size=20, color=TEXT_SECONDARY, align='center'),
+        # Highlight line
+        box(Inches(2.2), Inches(3.45), SLIDE_W - Inches(4.4), Inches(0.45), fill=ACCENT_GREEN, line=NONE),
+        textbox(Inches(2.2), Inches(3.45), SLIDE_W - Inches(4.4), Inches(0.45), "ROUTINES THAT TURN INTENT INTO IDENTITY",
+                bold=True, color=BG, align='center'),
+        section_label("MIT Sandbox Pitch Deck", Inches(4.3), Inches(4.25)),
+    ]
+    # Footer meta boxes
+    meta_text = ["Pitch Deck for Working Prototype", "January 2026", "Javier Serrano"]
+    for mx, meta in zip([Inches(2.1), Inches(5.1), Inches(8.1)], meta_text):
+        components.append(box(mx, Inches(6.3), Inches(3.3), Inches(0.45), line=TEXT_MUTED, fill=BG, line_width=1, paragraphs=[
+            para(meta, font=FONT_BODY, size=12, color=TEXT_SECONDARY, align='center', run=False),
+        ]))
+    return slide("Slide 1: Title", components)
+
+
+def context_slide():
+    left_x = MARGIN_X
+    left_y = Inches(2.0)
+    components = [stat_block(left_x, left_y, COL_W, Inches(1.2), "+50B", "morning routine videos on TikTok")]
+    # Hashtag pills
+    pill_y = left_y + Inches(1.35)
+    for idx, (name, views) in enumerate([("#ThatGirl", "17.4B views"), ("#nightroutine", "11.4B views"), ("#dailyroutine", "8B+ views")]):
+        components.append(box(left_x + (idx % 2) * Inches(2.9), pill_y + (idx // 2) * Inches(0.55), Inches(2.7), Inches(0.4),
+                              line=ACCENT_GREEN, fill=BG, line_width=1, paragraphs=[
+            para(name, font=FONT_BODY, size=12, bold=True, color=ACCENT_GREEN),
+            para(views, font=FONT_BODY, size=11, color=TEXT_SECONDARY, run=False),
+        ]))
+    # Chart container
+    chart_y = pill_y + Inches(1.3)
+    bar1_y = chart_y + Inches(0.55)
+    bar2_y = chart_y + Inches(1.05)
+    components += [
+        box(left_x, chart_y, COL_W, Inches(1.6), line=TEXT_PRIMARY, fill=BG, line_width=2),
+        h3("Engagement vs. Other Content", left_x + Inches(0.2), chart_y + Inches(0.1), COL_W - Inches(0.4), color=ACCENT_GREEN),
+        # Bars
+        textbox(left_x + Inches(0.2), bar1_y, Inches(1.2), Inches(0.3), "Routine", size=12, bold=True),
+        box(left_x + Inches(1.6), bar1_y, Inches(2.8), Inches(0.25), line=TEXT_PRIMARY, fill=BG_SECONDARY, line_width=1),
+        box(left_x + Inches(1.6), bar1_y, Inches(2.8), Inches(0.25), fill=ACCENT_GREEN, line=NONE),
+        textbox(left_x + Inches(4.6), bar1_y, Inches(0.6), Inches(0.3), "6-10x", size=12, bold=True, color=ACCENT_GREEN, align='right'),
+        textbox(left_x + Inches(0.2), bar2_y, Inches(1.2), Inches(0.3), "General Wellness", size=11, bold=True),
+        box(left_x + Inches(1.6), bar2_y, Inches(2.8), Inches(0.25), line=TEXT_PRIMARY, fill=BG_SECONDARY, line_width=1),
+        box(left_x + Inches(1.6), bar2_y, Inches(0.5), Inches(0.25), fill=TEXT_MUTED, line=NONE),
+        textbox(left_x + Inches(4.6), bar2_y, Inches(0.6), Inches(0.3), "1x", size=12, bold=True, align='right'),
+        # Right column influencers
+        h3("Influencers Proving Demand", RIGHT_X, Inches(2.0), COL_W, color=ACCENT_GREEN),
+    ]
+    items = [
+        "Andrew Huberman\n7.3M subs - Neuroscience-backed routines dominate",
+        "Ashton Hall\n3M+ followers - Routine videos avg 1M+ views\n+750 Million views on X",
+        "Ali Abdaal\n6.5M subs - Productivity systems & habit stacking",
+        "James Clear\n25M+ Atomic Habits sold - Created demand for systems",
+    ]
+    for i, item in enumerate(items):
+        title, *rest = item.split("\n")
+        components.append(rich_text(RIGHT_X, Inches(2.55) + Inches(0.85) * i, COL_W, Inches(0.7), [
+            para(title, font=FONT_BODY, size=16, bold=True, color=TEXT_PRIMARY),
+            *[para(line, font=FONT_BODY, size=12, color=ACCENT_GREEN if "views" in line else TEXT_SECONDARY, run=False)
+              for line in rest],
+        ]))
+    components += [
+        # Highlight card
+        box(MARGIN_X, Inches(6.0), CONTENT_W, Inches(0.65), line=ACCENT_GREEN, fill=BG, line_width=2),
+        textbox(MARGIN_X, Inches(6.05), CONTENT_W, Inches(0.5), "Massive audience wants to DO routines, not just WATCH them.",
+                bold=True, align='center'),
+        textbox(MARGIN_X, Inches(6.75), CONTENT_W, Inches(0.3), "Sources: Broadcasting your breakfast: why TikTokers obsess over morning routines - The Guardian; Why We're Obsessed with Other People's Morning Routines - Time",
+                size=12),
+    ]
+    return content_slide("Slide 2: Context", "Context", "Routines are the new obsession", components)
+
+
+def problem_slide():
+    components = []
+    metrics = [("66%", "of Gen Z use digital wellness tools"), ("~4%", "Day 30 retention rate in health & fitness apps (lowest category)"), ("~90%", "of people quit or fail when trying to form new habits")]
+    for i, (val, label) in enumerate(metrics):
+        components.append(box(MARGIN_X, Inches(2.0) + i * Inches(1.25), COL_W, Inches(1.1), line=ACCENT_GREEN, fill=BG, line_width=2, paragraphs=[
+            para(val, font=FONT_SANS, size=36, bold=True, color=ACCENT_GREEN, align='center', run=False),
+            para(label, font=FONT_BODY, size=14, color=TEXT_SECONDARY, align='center', run=False),
+        ]))
+    # Right column - reasons
+    components.append(h3("Why People Fail", RIGHT_X, Inches(2.0), COL_W, color=ACCENT_RED))
+    reasons = [
+        ("No Bridge from Content to Action", "Videos inspire but offer no execution tool"),
+        ("Blank Slate Apps", "\"What do you want to track?\" - Users don't know"),
+        ("No Science, No System", "Self-designed habits lack proven structure"),
+        ("Streak Anxiety", "One miss = total abandonment"),
+    ]
+    for i, (title, desc) in enumerate(reasons):
+        components.append(rich_text(RIGHT_X, Inches(2.5) + Inches(0.75) * i, COL_W, Inches(0.7), [
+            para(title, font=FONT_BODY, size=16, bold=True, color=TEXT_PRIMARY, run=False),
+            para(desc, font=FONT_BODY, size=12, color=TEXT_SECONDARY, run=False),
+        ]))
+    components += [
+        # Opportunity full width
+        box(MARGIN_X, Inches(6.0), CONTENT_W, Inches(0.7), line=ACCENT_GREEN, fill=BG, line_width=2),
+        section_label("The Opportunity", MARGIN_X + Inches(0.2), Inches(6.05)),
+        textbox(MARGIN_X + Inches(0.2), Inches(6.32), CONTENT_W - Inches(0.4), Inches(0.3), 'Users are truly struggling bridging from "routine inspiration" to "routine execution".',
+                size=16, bold=True),
+        textbox(MARGIN_X, Inches(6.75), CONTENT_W, Inches(0.3), "Sources: The $2 trillion global wellness market gets a millennial and Gen Z glow-up - McKinsey & Company; Retention Rates for Mobile Apps by Industry - Plotline; Only 10% of people who try to create a habit achieve their goal - Summa Magazine",
+                size=12),
+    ]
+    return content_slide("Slide 3: Problem", "Problem", "But few people can execute them", components)
+
+
+def solution_slide():
+    card_w = (CONTENT_W - Inches(0.6) * 2) / 3
+    card_h = Inches(4.4)
+    card_y = Inches(2.0)
+    card_xs = [MARGIN_X, MARGIN_X + card_w + Inches(0.6), MARGIN_X + (card_w + Inches(0.6)) * 2]
+    card_titles = ["Smart Routines", "Behavioral Insights", "Mindset Pills"]
+    card_subs = [
+        "Science-backed templates remove the blank slate.",
+        "Patterns that explain success or failure, generated from real data.",
+        "Daily wisdom that reinforces identity.",
+    ]
+    card_lists = [
+        ["Morning + evening routines ready from day one", "Evidence-based structure for sleep, fitness, focus", "Designed for real schedules, not perfection"],
+        ["Correlation, weekday patterns, and trend signals", "Sequence analysis for \"what works together\"", "Anomalies detection, strength scores and alerts"],
+        ["Daily quote prompts from thought leaders and top performers", "Reflection journaling", "Rating & archive history"],
+    ]
+    components = []
+    for i in range(3):
+        components += [
+            box(card_xs[i], card_y, card_w, card_h, line=ACCENT_PURPLE if i == 2 else TEXT_PRIMARY, fill=BG, line_width=2),
+            h3(card_titles[i], card_xs[i] + Inches(0.2), card_y + Inches(0.2), card_w - Inches(0.4)),
+            body(card_subs[i], card_xs[i] + Inches(0.2), card_y + Inches(0.7), card_w - Inches(0.4), Inches(0.5), size=12),
+            bullets(card_xs[i] + Inches(0.2), card_y + Inches(1.2), card_w - Inches(0.4), card_h - Inches(1.4), card_lists[i], size=12),
+        ]
+    return content_slide("Slide 4: Solution", "Solution", "Axiom Forge: A Habit System Built on Evidence, Reinforced by Mindset and Insight", components)
+
+
+def market_slide():
+    chart_x = MARGIN_X
+    chart_y = Inches(2.1)
+    chart_w = CONTENT_W * 0.6
+    chart_h = Inches(4.2)
+    components = [
+        box(chart_x, chart_y, chart_w, chart_h, line=TEXT_PRIMARY, fill=BG, line_width=2),
+        textbox(chart_x + Inches(0.2), chart_y + Inches(0.1), chart_w - Inches(0.4), Inches(0.3), "Global Habit Tracking App Market (USD Bn)",
+                size=12, bold=True, color=ACCENT_GREEN),
+    ]
+    # Bars
+    bars = [
+        ("2025", "13.1", 0.25),
+        ("2026", "14.9", 0.32),
+        ("2027", "17.1", 0.38),
+        ("2028", "", 0.44),
+        ("2029", "", 0.51),
+        ("2030", "", 0.57),
+        ("2031", "", 0.65),
+        ("2032", "", 0.74),
+        ("2033", "", 0.84),
+        ("2034", "", 0.94),
+        ("2035", "50.2", 1.08),
+    ]
+    bar_area_y = chart_y + Inches(0.6)
+    bar_area_h = chart_h - Inches(1.2)
+    bar_w = (chart_w - Inches(1.0)) / len(bars)
+    for i, (year, val, scale) in enumerate(bars):
+        bx = chart_x + Inches(0.5) + bar_w * i
+        bh = bar_area_h * scale
+        by = bar_area_y + (bar_area_h - bh)
+        if year in ("2025", "2026", "2027"):
+            components.append(box(bx, by, bar_w * 0.5, bh, fill=ACCENT_GREEN, line=NONE))
+        else:
+            components.append(box(bx, by, bar_w * 0.5, bh, fill=RGBColor(100, 120, 0), line=ACCENT_GREEN, line_width=1))
+        if val:
+            components.append(textbox(bx - Inches(0.05), by - Inches(0.25), bar_w, Inches(0.2), val,
+                                      size=10, bold=True, color=ACCENT_GREEN, align='center'))
+        components.append(textbox(bx - Inches(0.05), bar_area_y + bar_area_h + Inches(0.1), bar_w, Inches(0.2), year,
+                                  size=9, color=TEXT_SECONDARY, align='center'))
+    # Diagonal CAGR arrows
+    drivers_x = chart_x + chart_w + Inches(0.5)
+    drivers_w = CONTENT_W - chart_w - Inches(0.5)
+    components += [
+        connector(chart_x + Inches(1.0), chart_y + Inches(0.55), chart_x + Inches(2.6), chart_y + Inches(0.35), ACCENT_PURPLE, 2),
+        textbox(chart_x + Inches(0.9), chart_y + Inches(0.2), Inches(1.5), Inches(0.3), "CAGR 14.3%", size=10, bold=True, color=ACCENT_PURPLE),
+        connector(chart_x + Inches(2.6), chart_y + Inches(0.55), chart_x + Inches(5.6), chart_y + Inches(0.2), ACCENT_PURPLE, 2),
+        textbox(chart_x + Inches(2.7), chart_y + Inches(0.05), Inches(2.5), Inches(0.3), "CAGR 14.4%", size=10, bold=True, color=ACCENT_PURPLE),
+        # Drivers box
+        box(drivers_x, chart_y, drivers_w, chart_h, line=TEXT_PRIMARY, fill=BG, line_width=2),
+        h3("Market Growth Drivers", drivers_x + Inches(0.2), chart_y + Inches(0.2), drivers_w - Inches(0.4), color=ACCENT_GREEN),
+    ]
+    items = [
+        ("Rising consumer emphasis on self-improvement, mental well-being, and productivity enhancement", "68% of smartphone users engage with at least one productivity or wellness app"),
+        ("Higher willingness to pay", "Premium subscriptions account for 36% of overall habit tracking app downloads"),
+        ("Complementary to surge of wearables through integration", "Wearable integration improved user retention by 39%"),
+    ]
+    cur_y = chart_y + Inches(0.8)
+    for title, stat in items:
+        components += [
+            textbox(drivers_x + Inches(0.3), cur_y, drivers_w - Inches(0.6), Inches(0.5), title, size=14, bold=True),
+            textbox(drivers_x + Inches(0.3), cur_y + Inches(0.45), drivers_w - Inches(0.6), Inches(0.4), stat, size=12, bold=True, color=ACCENT_GREEN),
+        ]
+        cur_y += Inches(1.2)
+    components.append(textbox(MARGIN_X, Inches(6.75), CONTENT_W, Inches(0.3), "Source: Global Habit Tracking App Market Size - Global Growth Insights", size=12))
+    return content_slide("Slide 5: Market", "Market", "Axiom Forge taps into the rapidly growing Habit Tracking App Market, which is projected to triple within the next 10 years.", components)
+
+
+def competition_slide():
+    headers = ["App", "Science-Backed Templates", "Behavioral Insights", "Flexible Streaks", "Cross-Platform"]
+    entries = [
+        ["Streaks", "-", "-", "-", "iOS Only"],
+        ["Habitica", "Generic", "Basic Stats", "Rest Inn", "Yes"],
+        ["Loop", "-", "Good", "Yes", "Android"],
+        ["Habitify", "-", "Mood Only", "-", "Yes"],
+        ["Axiom Forge", "Evidence-Based", "Full Analysis", "Flexible", "PWA"],
+    ]
+    cells = [[cell(h, fill=TEXT_PRIMARY, font=FONT_BODY, size=11, bold=True, color=BG) for h in headers]]
+    for r, row in enumerate(entries, start=1):
+        cells.append([cell(value, fill=BG if r % 2 == 1 else BG_SECONDARY, font=FONT_BODY, size=11,
+                           color=ACCENT_PURPLE if r == len(entries) else TEXT_PRIMARY)
+                      for value in row])
+    components = [
+        table(MARGIN_X, Inches(2.1), CONTENT_W, Inches(3.0), cells),
+        # Positioning card
+        box(MARGIN_X, Inches(5.4), CONTENT_W, Inches(0.9), line=ACCENT_GREEN, fill=BG, line_width=2),
+        section_label("Positioning", MARGIN_X + Inches(0.2), Inches(5.45)),
+        textbox(MARGIN_X + Inches(0.2), Inches(5.75), CONTENT_W - Inches(0.4), Inches(0.4), "The only habit tracker that pairs science-backed routines with automated behavioral insight.",
+                size=16, bold=True),
+    ]
+    return content_slide("Slide 6: Competition table", "Competition", "Axiom Forge Is the Only App Combining Science + Mindset + Insights", components)
+
+
+def prototype_slide():
+    components = [
+        h3("Current State", MARGIN_X, Inches(2.0), COL_W),
+        bullets(MARGIN_X, Inches(2.5), COL_W, Inches(3.0), [
+            "PWA live with Firebase auth + sync",
+            "Morning & evening routines with daily check-ins",
+            "Dashboard with streaks, heatmap, and completion rates",
+            "Smart Insights engine (correlation, trends, anomalies)",
+            "Mindset journal with quotes + reflections",
+        ], size=14),
+        h3("Validation", RIGHT_X, Inches(2.0), COL_W),
+        box(RIGHT_X, Inches(2.5), COL_W, Inches(1.2), line=ACCENT_GREEN, fill=BG, line_width=2),
+        textbox(RIGHT_X + Inches(0.2), Inches(2.65), COL_W - Inches(0.4), Inches(0.4), "Validated with several early users", size=16, bold=True),
+        textbox(RIGHT_X + Inches(0.2), Inches(3.05), COL_W - Inches(0.4), Inches(0.4), "Qualitative feedback confirms clarity, motivation, and desire for deeper insights.",
+                size=12, color=TEXT_SECONDARY),
+        box(RIGHT_X, Inches(4.0), COL_W, Inches(1.1), line=TEXT_PRIMARY, fill=BG, line_width=2),
+        textbox(RIGHT_X + Inches(0.2), Inches(4.15), COL_W - Inches(0.4), Inches(0.4), "Next Validation Goal", size=14, bold=True),
+        textbox(RIGHT_X + Inches(0.2), Inches(4.55), COL_W - Inches(0.4), Inches(0.4), "Run 40-60 user interviews + beta cohort to confirm retention and pricing.",
+                size=12, color=TEXT_SECONDARY),
+    ]
+    return content_slide("Slide 7: Prototype", "Prototype", "A Working Product Validated by Early Users", components)
+
+
+def business_model_slide():
+    cards_left = [
+        ("FREEMIUM CORE", "Tracking, streaks, routines, basic analytics.", TEXT_PRIMARY),
+        ("INSIGHTS PRO", "Correlations, trends, sequences, advanced dashboards.", ACCENT_PURPLE),
+        ("COACH LAYER", "AI summaries + habit recommendations.", ACCENT_GREEN),
+    ]
+    cards_right = [
+        ("CONTENT PACKS", "Premium routine templates and expert programs.", TEXT_PRIMARY),
+        ("TEAMS / CAMPUS", "Group dashboards for student cohorts or clubs.", TEXT_PRIMARY),
+        ("LIFETIME LICENSE", "One-time fee for pro features.", TEXT_PRIMARY),
+    ]
+    components = []
+    for x, cards in [(MARGIN_X, cards_left), (RIGHT_X, cards_right)]:
+        for i, (title, desc, border) in enumerate(cards):
+            components += [
+                box(x, Inches(2.1) + Inches(1.2) * i, COL_W, Inches(1.0), line=border, fill=BG, line_width=2),
+                textbox(x + Inches(0.2), Inches(2.2) + Inches(1.2) * i, COL_W - Inches(0.4), Inches(0.4), title, size=16, bold=True),
+                textbox(x + Inches(0.2), Inches(2.6) + Inches(1.2) * i, COL_W - Inches(0.4), Inches(0.4), desc, size=12, color=TEXT_SECONDARY),
+            ]
+    return content_slide("Slide 8: Business Model", "Business Model", "Multiple Revenue Streams from Freemium to Enterprise", components)
+
+
+def budget_slide():
+    components = [
+        box(MARGIN_X, Inches(2.0), CONTENT_W, Inches(3.6), line=TEXT_PRIMARY, fill=BG, line_width=2),
+        textbox(MARGIN_X + Inches(0.2), Inches(2.15), Inches(2.0), Inches(0.6), "$4,500", font=FONT_SANS, size=40, bold=True, color=ACCENT_GREEN),
+        textbox(MARGIN_X + Inches(2.4), Inches(2.3), Inches(7.5), Inches(0.4), "Aligned with MIT Sandbox reimbursable categories", size=12, color=TEXT_SECONDARY),
+    ]
+    # Budget bars
+    items = [
+        ("User Research", 1200, ACCENT_GREEN),
+        ("Contractors", 1000, ACCENT_PURPLE),
+        ("Software & Tools", 900, ACCENT_PURPLE),
+        ("Marketing & Launch", 800, ACCENT_PURPLE),
+        ("Legal & Compliance", 600, ACCENT_PURPLE),
+    ]
+    for i, (label, amt, color) in enumerate(items):
+        y = Inches(3.0) + Inches(0.5) * i
+        components += [
+            textbox(MARGIN_X + Inches(0.2), y, Inches(1.8), Inches(0.3), label.upper(), size=11, bold=True),
+            box(MARGIN_X + Inches(2.2), y, Inches(6.5), Inches(0.25), line=TEXT_PRIMARY, fill=BG_SECONDARY, line_width=1),
+            box(MARGIN_X + Inches(2.2), y, Inches(6.5 * (amt / 4500)), Inches(0.25), fill=color, line=NONE),
+            textbox(MARGIN_X + Inches(9.0), y, Inches(1.0), Inches(0.3), f"${amt}", size=11, bold=True, align='right'),
+        ]
+    components += [
+        # Note card
+        box(MARGIN_X, Inches(5.8), CONTENT_W, Inches(0.7), line=TEXT_PRIMARY, fill=BG, line_width=1),
+        textbox(MARGIN_X + Inches(0.2), Inches(5.95), CONTENT_W - Inches(0.4), Inches(0.3), "Contractor spend is within the 25% cap. Research incentives and software licenses follow Sandbox reimbursement guidelines.",
+                size=12, color=TEXT_SECONDARY),
+    ]
+    return content_slide("Slide 9: Budget", "Funding Request", "$4,500 to Validate, Polish, and Launch to Market", components)
+
+
+def roadmap_slide():
+    phase_w = (CONTENT_W) / 3
+    phase_y = Inches(2.1)
+    phase_h = Inches(3.0)
+    phases = [
+        ("01", "Validate", ["40-60 user interviews", "Beta cohort with retention tracking", "Pricing tests for Insights Pro"], True),
+        ("02", "Polish", ["Refine insights UI", "Performance + onboarding improvements", "Brand + marketing assets"], False),
+        ("03", "Launch", ["App Store packaging", "Public release + press outreach", "Post-launch analytics + iteration"], False),
+    ]
+    components = []
+    for i, (num, title, items, active) in enumerate(phases):
+        px = MARGIN_X + phase_w * i
+        components += [
+            box(px, phase_y, phase_w, phase_h, line=ACCENT_GREEN if active else TEXT_PRIMARY, fill=BG, line_width=2),
+            textbox(px + Inches(0.2), phase_y + Inches(0.1), Inches(1.0), Inches(0.5), num, font=FONT_SANS, size=36, bold=True,
+                    color=ACCENT_GREEN if active else TEXT_MUTED),
+            textbox(px + Inches(0.2), phase_y + Inches(0.7), phase_w - Inches(0.4), Inches(0.3), title, size=14, bold=True),
+            bullets(px + Inches(0.2), phase_y + Inches(1.1), phase_w - Inches(0.4), Inches(1.8), items, size=12, color=TEXT_SECONDARY),
+        ]
+    components += [
+        # Launch target stat
+        box(MARGIN_X, Inches(5.5), Inches(3.5), Inches(0.9), line=ACCENT_GREEN, fill=BG, line_width=2),
+        textbox(MARGIN_X + Inches(0.2), Inches(5.6), Inches(3.1), Inches(0.4), "Q1 2026", font=FONT_SANS, size=24, bold=True, color=ACCENT_GREEN),
+        textbox(MARGIN_X + Inches(0.2), Inches(6.0), Inches(3.1), Inches(0.3), "App Store Launch Target", size=12, color=TEXT_SECONDARY),
+    ]
+    return content_slide("Slide 10: Roadmap", "Roadmap", "90-Day Sprint from Validation to App Store Launch", components)
+
+
+def team_slide():
+    return content_slide("Slide 11: Team", "Team", "The Team Behind Axiom Forge", [
+        box(MARGIN_X, Inches(2.2), CONTENT_W, Inches(3.5), line=TEXT_PRIMARY, fill=BG, line_width=2),
+        textbox(MARGIN_X, Inches(3.7), CONTENT_W, Inches(0.5), "Team information coming soon...", color=TEXT_MUTED, align='center'),
+    ])
+
+
+DECK = {
+    'name': 'pitch-deck-v3',
+    'output': 'axiom-forge-pitch-deck-v3.pptx',
+    'slides': [
+        title_slide(),
+        context_slide(),
+        problem_slide(),
+        solution_slide(),
+        market_slide(),
+        competition_slide(),
+        prototype_slide(),
+        business_model_slide(),
+        budget_slide(),
+        roadmap_slide(),
+        team_slide(),
+    ],
+}
@@ -0,0 +1,215 @@
+"""Slide options v3: slides 2, 3, 6 and 8 extracted from slide-options-v3.html."""
+
+from pptx.util import Inches
+
+from deck_engine import (
+    ACCENT_GREEN, ACCENT_PURPLE, BG, BG_SECONDARY, COL_W, CONTENT_W, FONT_BODY, FONT_SANS, GAP_COL,
+    MARGIN_X, NONE, SLIDE_W, TEXT_MUTED, TEXT_PRIMARY, TEXT_SECONDARY, body, box, h1, h3, logo, para,
+    section_label, slide, textbox,
+)
+
+CORNER_LOGO = logo(SLIDE_W - Inches(1.2), Inches(0.35), Inches(0.7))
+
+
+def grid_cell(x, y, w, h, text, fill=BG, color=TEXT_PRIMARY, bold=False, align='center', size=12):
+    return box(x, y, w, h, line=TEXT_PRIMARY, fill=fill, line_width=1, margin_x=6, paragraphs=[
+        para(text, font=FONT_BODY, size=size, bold=bold, color=color, align=align),
+    ])
+
+
+def option_label(text, x, y):
+    return box(x, y, Inches(7.2), Inches(0.3), line=ACCENT_PURPLE, fill=ACCENT_PURPLE, line_width=1, paragraphs=[
+        para(text.upper(), font=FONT_BODY, size=11, bold=True, color=BG, align='left'),
+    ])
+
+
+def phone_mockup(x, y, w, h, border_color, play_color):
+    play_size = w * 0.28
+    play_x = x + (w - play_size) / 2
+    play_y = y + (h - play_size) / 2
+    return [
+        box(x, y, w, h, shape='rounded_rectangle', fill=BG, line=border_color, line_width=2),
+        # Screen and notch
+        box(x + w * 0.08, y + h * 0.08, w * 0.84, h * 0.84, fill=BG_SECONDARY, line=NONE),
+        box(x + w * 0.35, y + h * 0.1, w * 0.3, h * 0.05, fill=BG, line=NONE),
+        # Play button
+        box(play_x, play_y, play_size, play_size, shape='oval', fill=BG, line=play_color, line_width=2),
+        box(play_x + play_size * 0.38, play_y + play_size * 0.28, play_size * 0.28, play_size * 0.32,
+            shape='isosceles_triangle', rotation=90, fill=play_color, line=NONE),
+    ]
+
+
+def option_slide(title, option, label, heading, components):
+    return slide(title, [
+        CORNER_LOGO,
+        option_label(option, MARGIN_X, Inches(0.35)),
+        section_label(label, MARGIN_X, Inches(0.8)),
+        h1(heading, MARGIN_X, Inches(1.3), CONTENT_W),
+        *components,
+    ])
+
+
+def tiered_layout_slide():
+    base_y = Inches(2.2)
+    base_h = Inches(1.35)
+    components = [
+        box(MARGIN_X, base_y, CONTENT_W, base_h, line=TEXT_PRIMARY, fill=BG, line_width=2),
+        textbox(MARGIN_X + Inches(0.2), base_y + Inches(0.1), CONTENT_W - Inches(0.4), Inches(0.3), "Freemium Core",
+                font=FONT_SANS, size=18, bold=True, color=ACCENT_GREEN),
+        body("Everything you need to build habits: Tracking, streaks, morning & evening routines, basic analytics, correlations, trends, sequences, and advanced dashboards.",
+             MARGIN_X + Inches(0.2), base_y + Inches(0.45), CONTENT_W - Inches(0.4), Inches(0.5), size=12),
+        textbox(MARGIN_X + Inches(0.2), base_y + Inches(0.95), CONTENT_W - Inches(0.4), Inches(0.3), "FREE FOREVER",
+                size=14, bold=True, color=ACCENT_GREEN),
+    ]
+    tier_y = base_y + base_h + Inches(0.35)
+    tier_gap = Inches(0.25)
+    tier_w = (CONTENT_W - tier_gap * 3) / 4
+    tier_h = Inches(2.2)
+    tiers = [
+        ("Coach Layer", "AI-powered summaries and personalized habit recommendations", "$4.99/mo", True),
+        ("Content Packs", "Premium templates from top routine influencers", "$2.99/pack", False),
+        ("Teams / Campus", "Group dashboards for cohorts and clubs", "$9.99/mo", False),
+        ("Lifetime License", "Permanent access to all pro features", "$49.99", False),
+    ]
+    for i, (title, desc, price, featured) in enumerate(tiers):
+        x = MARGIN_X + i * (tier_w + tier_gap)
+        components += [
+            box(x, tier_y, tier_w, tier_h, line=ACCENT_PURPLE if featured else TEXT_PRIMARY,
+                fill=BG_SECONDARY if featured else BG, line_width=2),
+            textbox(x + Inches(0.15), tier_y + Inches(0.12), tier_w - Inches(0.3), Inches(0.3), title,
+                    size=13, bold=True, color=ACCENT_PURPLE if featured else TEXT_PRIMARY),
+            body(desc, x + Inches(0.15), tier_y + Inches(0.45), tier_w - Inches(0.3), Inches(1.0), size=10),
+            textbox(x + Inches(0.15), tier_y + Inches(1.65), tier_w - Inches(0.3), Inches(0.3), price, size=14, bold=True),
+        ]
+    return option_slide("Slide 2: Option B - Tiered Layout", "Slide 8 - Option B: Tiered Layout", "Business Model",
+                        "Multiple Revenue Streams from Freemium to Enterprise", components)
+
+
+def pricing_grid_slide():
+    table_y = Inches(2.1)
+    row_h = Inches(0.35)
+    feature_w = Inches(3.6)
+    col_w = (CONTENT_W - feature_w) / 4
+    components = []
+
+    headers = ["Features", "Freemium", "Coach Layer", "Content Packs", "Teams"]
+    for i, header in enumerate(headers):
+        x = MARGIN_X + (feature_w if i > 0 else 0) + (col_w * (i - 1) if i > 1 else 0)
+        w = feature_w if i == 0 else col_w
+        fill = BG
+        color = TEXT_PRIMARY
+        if header == "Freemium":
+            fill = ACCENT_GREEN
+            color = BG
+        elif header == "Coach Layer":
+            fill = ACCENT_PURPLE
+        components.append(grid_cell(x, table_y, w, row_h, header, fill=fill, color=color, bold=True))
+
+    rows = [
+        ("Habit Tracking & Streaks", ["✓", "✓", "✓", "✓"]),
+        ("Morning & Evening Routines", ["✓", "✓", "✓", "✓"]),
+        ("Correlations & Trends", ["✓", "✓", "✓", "✓"]),
+        ("Advanced Dashboards", ["✓", "✓", "✓", "✓"]),
+        ("AI Habit Recommendations", ["-", "✓", "-", "-"]),
+        ("Premium Routine Templates", ["-", "-", "✓", "-"]),
+        ("Influencer Expert Programs", ["-", "-", "✓", "-"]),
+        ("Group Dashboards", ["-", "-", "-", "✓"]),
+    ]
+    for r_idx, (feature, values) in enumerate(rows, start=1):
+        y = table_y + row_h * r_idx
+        components.append(grid_cell(MARGIN_X, y, feature_w, row_h, feature, align='left', size=11))
+        for c_idx, value in enumerate(values):
+            components.append(grid_cell(MARGIN_X + feature_w + col_w * c_idx, y, col_w, row_h, value,
+                                        color=ACCENT_GREEN if value == "✓" else TEXT_MUTED, bold=True, size=14))
+
+    price_y = table_y + row_h * (len(rows) + 1)
+    components.append(grid_cell(MARGIN_X, price_y, feature_w, row_h, "PRICE", bold=True, align='left', size=11))
+    price_values = [("FREE", ACCENT_GREEN), ("$4.99/mo", ACCENT_PURPLE), ("$2.99/pack", TEXT_PRIMARY), ("$9.99/mo", TEXT_PRIMARY)]
+    for c_idx, (value, color) in enumerate(price_values):
+        components.append(grid_cell(MARGIN_X + feature_w + col_w * c_idx, price_y, col_w, row_h, value, color=color, bold=True))
+
+    card_y = price_y + Inches(0.45)
+    components += [
+        box(MARGIN_X, card_y, CONTENT_W, Inches(0.5), line=TEXT_PRIMARY, fill=BG, line_width=2),
+        textbox(MARGIN_X + Inches(0.2), card_y + Inches(0.1), CONTENT_W - Inches(0.4), Inches(0.3), "Lifetime License: $49.99 one-time for permanent access to all premium features",
+                size=12, bold=True, align='center'),
+    ]
+    return option_slide("Slide 3: Option C - Pricing Grid", "Slide 8 - Option C: Pricing Grid", "Business Model",
+                        "Multiple Revenue Streams from Freemium to Enterprise", components)
+
+
+def six_buckets_slide():
+    components = [
+        box(MARGIN_X, Inches(2.0), CONTENT_W, Inches(4.1), line=TEXT_PRIMARY, fill=BG, line_width=2),
+        textbox(MARGIN_X + Inches(0.2), Inches(2.1), Inches(2.0), Inches(0.6), "$4,500", font=FONT_SANS, size=38, bold=True, color=ACCENT_GREEN),
+        textbox(MARGIN_X + Inches(2.4), Inches(2.25), Inches(7.5), Inches(0.3), "Aligned with MIT Sandbox reimbursable categories", size=12, color=TEXT_SECONDARY),
+    ]
+    items = [
+        ("User Research", 1100, ACCENT_GREEN, "Run 40-60 customer discovery interviews with beta testers, including focus group sessions and small participation incentives."),
+        ("Contractors", 1000, ACCENT_PURPLE, "Hire UI/UX designer to polish onboarding flow and create professional marketing assets for App Store launch."),
+        ("Software & Tools", 800, ACCENT_PURPLE, "Subscribe to analytics tools (Mixpanel/Amplitude), design software (Figma), and cover Firebase scaling costs during beta."),
+        ("Marketing & Launch", 600, ACCENT_PURPLE, "Launch targeted social media campaigns on Instagram/TikTok and create promotional video content for App Store listing."),
+        ("Legal & Compliance", 500, ACCENT_PURPLE, "File for company incorporation, register as a legal entity, and secure registered agent services."),
+        ("Travel & Conferences", 500, ACCENT_GREEN, "Attend wellness/productivity conferences to conduct customer research and connect with potential partners and influencers."),
+    ]
+    bar_w = Inches(6.4)
+    for i, (label, amt, color, desc) in enumerate(items):
+        y = Inches(2.9) + Inches(0.55) * i
+        components += [
+            textbox(MARGIN_X + Inches(0.2), y, Inches(1.8), Inches(0.3), label, size=10, bold=True),
+            box(MARGIN_X + Inches(2.1), y + Inches(0.05), bar_w, Inches(0.2), line=TEXT_PRIMARY, fill=BG_SECONDARY, line_width=1),
+            box(MARGIN_X + Inches(2.1), y + Inches(0.05), bar_w * (amt / 4500), Inches(0.2), fill=color, line=NONE),
+            textbox(MARGIN_X + Inches(8.7), y, Inches(1.0), Inches(0.3), f"${amt}", size=10, bold=True, align='right'),
+            textbox(MARGIN_X + Inches(0.2), y + Inches(0.23), CONTENT_W - Inches(0.4), Inches(0.25), desc, size=9, color=TEXT_SECONDARY),
+        ]
+    components += [
+        box(MARGIN_X, Inches(6.25), CONTENT_W, Inches(0.6), line=TEXT_PRIMARY, fill=BG, line_width=1),
+        textbox(MARGIN_X + Inches(0.2), Inches(6.35), CONTENT_W - Inches(0.4), Inches(0.3), "Contractor spend within 25% cap. Legal within $1,000 cap. Conference fees within $500 cap. Travel requires pre-approved cost proposal per Sandbox guidelines.",
+                size=10, color=TEXT_SECONDARY),
+    ]
+    return option_slide("Slide 6: Option B - 6 Buckets (with Travel)", "Slide 9 - Option B: 6 Buckets (with Travel)",
+                        "Funding Request", "$4,500 to Validate, Polish, and Launch to Market", components)
+
+
+def device_frames_slide():
+    card_y = Inches(2.3)
+    components = []
+    for i, (title, border_color, play_color, label_text) in enumerate([
+        ("Onboarding Flow", ACCENT_GREEN, ACCENT_GREEN, "Watch: 45 sec"),
+        ("App Features", ACCENT_PURPLE, ACCENT_PURPLE, "Watch: 2 min"),
+    ]):
+        x = MARGIN_X + i * (COL_W + GAP_COL)
+        frame_w = Inches(3.4)
+        frame_h = Inches(3.0)
+        frame_x = x + (COL_W - frame_w) / 2
+        frame_y = card_y + Inches(0.4)
+        components += [
+            h3(title, x, card_y, COL_W),
+            box(frame_x, frame_y, frame_w, frame_h, line=TEXT_PRIMARY, fill=BG, line_width=2),
+            *phone_mockup(frame_x + Inches(0.4), frame_y + Inches(0.2), Inches(2.6), Inches(2.6), border_color, play_color),
+            textbox(frame_x + Inches(0.4), frame_y + Inches(2.3), Inches(2.6), Inches(0.3), label_text,
+                    size=10, color=TEXT_SECONDARY, align='center'),
+        ]
+    cta_y = Inches(6.1)
+    components += [
+        box(MARGIN_X, cta_y, CONTENT_W, Inches(0.9), line=TEXT_PRIMARY, fill=BG, line_width=2),
+        textbox(MARGIN_X + Inches(0.3), cta_y + Inches(0.1), Inches(3.0), Inches(0.3), "Try It Yourself", font=FONT_SANS, size=16, bold=True),
+        textbox(MARGIN_X + Inches(0.3), cta_y + Inches(0.45), Inches(6.0), Inches(0.3), "No download required - works in your browser",
+                size=11, color=TEXT_SECONDARY),
+        textbox(MARGIN_X + Inches(8.8), cta_y + Inches(0.25), Inches(2.0), Inches(0.3), "Launch App",
+                size=14, bold=True, color=ACCENT_GREEN, align='right', underline=True),
+    ]
+    return option_slide("Slide 8: Option B - Device Frames", "Demo Slide - Option B: Device Frames", "Product Demo",
+                        "Experience Axiom Forge in Action", components)
+
+
+DECK = {
+    'name': 'slide-options-v3',
+    'output': 'slide-options-v3.pptx',
+    'slides': [
+        tiered_layout_slide(),
+        pricing_grid_slide(),
+        six_buckets_slide(),
+        device_frames_slide(),
+    ],
+}
@@ -0,0 +1,84 @@
+"""Slide options v3: the product demo slide with phones in device frames."""
+
+from pptx.dml.color import RGBColor
+from pptx.util import Inches
+
+from deck_engine import (
+    ACCENT_GREEN, ACCENT_PURPLE, BG, BG_SECONDARY, COL_W, CONTENT_W, FONT_BODY, FONT_SANS, GAP_COL,
+    MARGIN_X, NONE, SLIDE_W, TEXT_SECONDARY, box, h1, h3, logo, para, section_label, slide, textbox,
+)
+
+
+def device_phone(x, y, frame_w, frame_h, border_color, play_color, label_text):
+    padding = Inches(0.12)
+    phone_x = x + padding
+    phone_y = y + padding
+    phone_w = frame_w - padding * 2
+    phone_h = frame_h - padding * 2
+    play_size = phone_w * 0.36
+    play_x = phone_x + (phone_w - play_size) / 2
+    play_y = phone_y + (phone_h - play_size) / 2
+    return [
+        # Shadow, then the device frame (a dark fill stands in for the gradient)
+        box(x + Inches(0.08), y + Inches(0.1), frame_w, frame_h, shape='rounded_rectangle', fill=BG, line=NONE, line_width=0.5),
+        box(x, y, frame_w, frame_h, shape='rounded_rectangle', fill=RGBColor(26, 26, 26), line=NONE, line_width=1),
+        # Phone and notch
+        box(phone_x, phone_y, phone_w, phone_h, shape='rounded_rectangle', fill=BG_SECONDARY, line=border_color, line_width=2.5),
+        box(phone_x + phone_w * 0.32, phone_y + phone_h * 0.03, phone_w * 0.36, phone_h * 0.06, shape='rounded_rectangle',
+            fill=BG, line=NONE, line_width=0.5),
+        # Play button
+        box(play_x, play_y, play_size, play_size, shape='oval', fill=BG_SECONDARY, line=play_color, line_width=2),
+        box(play_x + play_size * 0.38, play_y + play_size * 0.28, play_size * 0.28, play_size * 0.32,
+            shape='isosceles_triangle', rotation=90, fill=play_color, line=NONE),
+        textbox(phone_x, phone_y + phone_h - Inches(0.45), phone_w, Inches(0.3), label_text, size=11,
+                color=TEXT_SECONDARY, align='center'),
+    ]
+
+
+def device_frames_slide():
+    option = "DEMO SLIDE - OPTION B: DEVICE FRAMES"
+    components = [
+        logo(SLIDE_W - Inches(1.2), Inches(0.35), Inches(0.7)),
+        textbox(MARGIN_X, Inches(0.35), Inches(7.2), Inches(0.3), option, size=11, bold=True, color=BG),
+        box(MARGIN_X, Inches(0.35), Inches(7.2), Inches(0.3), line=ACCENT_PURPLE, line_width=1, fill=ACCENT_PURPLE, paragraphs=[
+            para(option, font=FONT_BODY, size=11, bold=True, color=BG, align='left'),
+        ]),
+        section_label("Product Demo", MARGIN_X, Inches(0.8)),
+        h1("Experience Axiom Forge in Action", MARGIN_X, Inches(1.3), CONTENT_W),
+    ]
+
+    card_y = Inches(2.35)
+    frame_w = Inches(3.0)
+    frame_h = Inches(5.0)
+    for i, (title, color, label_text) in enumerate([
+        ("Onboarding Flow", ACCENT_GREEN, "Watch: 45 sec"),
+        ("App Features", ACCENT_PURPLE, "Watch: 2 min"),
+    ]):
+        col_x = MARGIN_X + i * (COL_W + GAP_COL)
+        components += [
+            h3(title, col_x, card_y, COL_W, color=color, size=18, align='center'),
+            *device_phone(col_x + (COL_W - frame_w) / 2, card_y + Inches(0.45), frame_w, frame_h, color, color, label_text),
+        ]
+
+    cta_w = Inches(6.4)
+    cta_x = (SLIDE_W - cta_w) / 2
+    cta_y = Inches(6.2)
+    components += [
+        box(cta_x, cta_y, cta_w, Inches(0.95), line=ACCENT_GREEN, line_width=2, fill=RGBColor(20, 26, 0)),
+        textbox(cta_x, cta_y + Inches(0.1), cta_w, Inches(0.3), "Try It Yourself", font=FONT_SANS, size=16, bold=True,
+                color=ACCENT_GREEN, align='center'),
+        textbox(cta_x, cta_y + Inches(0.45), cta_w, Inches(0.25), "No download required - works in your browser",
+                size=11, color=TEXT_SECONDARY, align='center'),
+        box(cta_x + Inches(2.2), cta_y + Inches(0.62), Inches(2.0), Inches(0.3), line=ACCENT_GREEN, line_width=1,
+            fill=ACCENT_GREEN, paragraphs=[
+                para("LAUNCH APP", font=FONT_SANS, size=12, bold=True, color=BG, align='center'),
+            ]),
+    ]
+    return slide("Demo Slide: Option B - Device Frames", components)
+
+
+DECK = {
+    'name': 'slide-options-v3-device-frames',
+    'output': 'slide-options-v3-device-frames.pptx',
+    'slides': [device_frames_slide()],
+}
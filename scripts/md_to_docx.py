@@ -1,245 +1,1053 @@
 #!/usr/bin/env python3
 """
 Convert Markdown to Word Document with proper formatting
+
+The source is tokenized in a single pass into a small block/inline AST, which
+a renderer then walks once to build the document.
+
+Block nodes are tuples:
+    ('heading', level, inlines)      ('hr',)
+    ('table', header, rows)          ('bullet', inlines)
+    ('ordered', inlines)             ('quote', inlines)
+    ('code', lines)                  ('paragraph', inlines)
+    ('blank',)
+
+Inline nodes are tuples:
+    ('text', text)                   ('code', text)
+    ('strong', children)             ('em', children)
+    ('link', children, url)          ('image', alt, url)
 """
 
+import argparse
+import hashlib
+import io
+import json
+import os
 import re
+import shutil
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import unquote
 from docx import Document
-from docx.shared import Pt, RGBColor, Inches
+from docx.shared import Emu, Pt, RGBColor, Inches
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.shape import CT_Inline
+from docx.text.paragraph import Paragraph
+from lxml import etree
+from PIL import Image, ImageOps
 
-def add_hyperlink(paragraph, url, text):
-    """Add a hyperlink to a paragraph."""
-    part = paragraph.part
-    r_id = part.relate_to(url, 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink', is_external=True)
-
-    hyperlink = OxmlElement('w:hyperlink')
-    hyperlink.set(qn('r:id'), r_id)
-
-    new_run = OxmlElement('w:r')
-    rPr = OxmlElement('w:rPr')
-
-    # Set hyperlink style
-    color = OxmlElement('w:color')
-    color.set(qn('w:val'), '0563C1')
-    rPr.append(color)
-
-    u = OxmlElement('w:u')
-    u.set(qn('w:val'), 'single')
-    rPr.append(u)
-
-    new_run.append(rPr)
-    new_run.text = text
-    hyperlink.append(new_run)
-
-    paragraph._p.append(hyperlink)
-    return hyperlink
-
-def parse_inline_formatting(text, run):
-    """Parse and apply inline formatting like bold, italic, code."""
-    # Handle bold (**text** or __text__)
-    bold_pattern = r'\*\*(.+?)\*\*|__(.+?)__'
-    # Handle italic (*text* or _text_)
-    italic_pattern = r'\*(.+?)\*|_(.+?)_'
-    # Handle inline code (`code`)
-    code_pattern = r'`(.+?)`'
-
-    # Simple approach: detect the primary formatting
-    if re.match(r'^\*\*.*\*\*$', text) or re.match(r'^__.*__$', text):
-        run.bold = True
-        text = re.sub(r'^\*\*|\*\*$|^__|__$', '', text)
-    elif re.match(r'^\*.*\*$', text) or re.match(r'^_.*_$', text):
-        run.italic = True
-        text = re.sub(r'^\*|\*$|^_|_$', '', text)
-    elif re.match(r'^`.*`$', text):
-        run.font.name = 'Courier New'
-        run.font.size = Pt(10)
-        text = re.sub(r'^`|`$', '', text)
-
-    run.text = text
+# Bump when rendering changes so batch runs rebuild every document
+CONVERTER_VERSION = 7
+MANIFEST_NAME = 'md_to_docx_manifest.json'
+CACHE_DIR_NAME = '.md_to_docx_cache'
 
-def add_formatted_text(paragraph, text):
-    """Add text with inline formatting to a paragraph."""
-    # Split text by formatting markers while preserving them
-    parts = re.split(r'(\*\*[^*]+\*\*|__[^_]+__|`[^`]+`|\*[^*]+\*|_[^_]+_)', text)
+# Block-level patterns
+HEADER_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+HR_RE = re.compile(r'^(?:-{3,}|\*{3,}|_{3,})\s*$')
+TABLE_SEPARATOR_RE = re.compile(r'^\s*\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$')
+BULLET_RE = re.compile(r'^[\*\-\+]\s+')
+ORDERED_RE = re.compile(r'^\d+\.\s+')
+QUOTE_RE = re.compile(r'^>\s*')
+
+# Inline patterns
+INLINE_MARKER_RE = re.compile(r'`+|\*\*|__|\*|_|!\[|\[')
+BACKTICKS_RE = re.compile(r'`+')
+# Link targets may contain one level of balanced parentheses, as in CommonMark
+LINK_TARGET = r'<?((?:[^()\s>]|\([^()\s>]*\))+)>?'
+LINK_RE = re.compile(r'\[((?:[^\[\]]|\[[^\]]*\])*)\]\(\s*' + LINK_TARGET + r'(?:\s+"[^"]*")?\s*\)')
+IMAGE_RE = re.compile(r'!\[([^\]]*)\]\(\s*' + LINK_TARGET + r'(?:\s+"[^"]*")?\s*\)')
+
+# Namespace declarations on a serialized fragment's root tag
+NS_DECL_RE = re.compile(rb'\s+xmlns(?::\w+)?="[^"]*"')
+REL_ID_RE = re.compile(rb'(r:(?:id|embed))="([^"]+)"')
+DOCPR_ID_RE = re.compile(rb'(<wp:docPr id=")\d+"')
+HYPERLINK_RELTYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink'
 
-    for part in parts:
-        if not part:
+# Table symbols Word fonts render poorly
+SYMBOL_REPLACEMENTS = {'✅': '✓', '❌': '✗', '⚠️': '⚠'}
+
+# ---------------------------------------------------------------------------
+# Inline tokenizer
+# ---------------------------------------------------------------------------
+
+def _can_open(text, pos, delim):
+    """Whether an emphasis delimiter at pos can open a span."""
+    after = pos + len(delim)
+    if after >= len(text) or text[after].isspace():
+        return False
+    # Underscores inside words (snake_case) are literal
+    return not (delim[0] == '_' and pos > 0 and text[pos - 1].isalnum())
+
+def _can_close(text, pos, delim):
+    """Whether an emphasis delimiter at pos can close a span."""
+    if pos == 0 or text[pos - 1].isspace():
+        return False
+    after = pos + len(delim)
+    return not (delim[0] == '_' and after < len(text) and text[after].isalnum())
+
+def _find_closer(text, start, delim, dead=None):
+    """Find the closing delimiter for a span opened just before start.
+
+    Code spans are skipped, and when looking for a single delimiter a doubled
+    one is stepped over as a whole so '*a **b** c*' closes at the last '*'.
+
+    dead maps each delimiter to the positions an earlier search of the same
+    text walked without finding a closer. A search that reaches one of them
+    gives up, so a line of unmatched openers is scanned once, not once per
+    opener.
+    """
+    failed = (dead if dead is not None else {}).setdefault(delim, set())
+    walked = []
+    pos = start
+    length = len(text)
+    while pos < length:
+        if pos in failed:
+            break
+        walked.append(pos)
+        char = text[pos]
+        if char == '`':
+            ticks = BACKTICKS_RE.match(text, pos).group()
+            end = text.find(ticks, pos + len(ticks))
+            pos = end + len(ticks) if end != -1 else pos + len(ticks)
             continue
-        run = paragraph.add_run()
-
-        if re.match(r'^\*\*.*\*\*$|^__.*__$', part):
-            run.bold = True
-            run.text = re.sub(r'^\*\*|\*\*$|^__|__$', '', part)
-        elif re.match(r'^`.*`$', part):
-            run.font.name = 'Courier New'
-            run.font.size = Pt(10)
-            run.text = re.sub(r'^`|`$', '', part)
-        elif re.match(r'^\*.*\*$|^_.*_$', part):
-            run.italic = True
-            run.text = re.sub(r'^\*|\*$|^_|_$', '', part)
+        if char == delim[0]:
+            if len(delim) == 1 and text.startswith(delim * 2, pos):
+                inner_close = _find_closer(text, pos + 2, delim * 2, dead)
+                if inner_close != -1:
+                    pos = inner_close + 2
+                    continue
+                pos += 2
+                continue
+            if text.startswith(delim, pos) and _can_close(text, pos, delim):
+                return pos
+        pos += 1
+    failed.update(walked)
+    return -1
+
+def _parse_emphasis(text, start, marker, dead):
+    """Parse the emphasis span marker opens at start; return (node, end) or None.
+
+    A run of three delimiters closed by another run of three ('***both***')
+    is em inside strong. Otherwise it opens em when a single delimiter
+    closes it ('***a** b*'), and strong when a double one does.
+    """
+    char = marker[0]
+    if len(marker) == 2 and text.startswith(char * 3, start):
+        end = _find_closer(text, start + 3, char * 3, dead)
+        if end != -1:
+            return ('strong', [('em', parse_inlines(text[start + 3:end]))]), end + 3
+        end = _find_closer(text, start + 1, char, dead)
+        if end != -1:
+            return ('em', parse_inlines(text[start + 1:end])), end + 1
+    end = _find_closer(text, start + len(marker), marker, dead)
+    if end == -1:
+        return None
+    kind = 'strong' if len(marker) == 2 else 'em'
+    return (kind, parse_inlines(text[start + len(marker):end])), end + len(marker)
+
+def parse_inlines(text):
+    """Tokenize inline Markdown into a list of inline nodes."""
+    nodes = []
+    buffer = []
+    pos = 0
+    length = len(text)
+    dead = {}
+
+    def flush():
+        joined = ''.join(buffer)
+        if joined:
+            nodes.append(('text', joined))
+        buffer.clear()
+
+    while pos < length:
+        match = INLINE_MARKER_RE.search(text, pos)
+        if not match:
+            buffer.append(text[pos:])
+            break
+        start = match.start()
+        marker = match.group()
+        buffer.append(text[pos:start])
+
+        if marker[0] == '`':
+            end = text.find(marker, start + len(marker))
+            if end != -1:
+                flush()
+                code = text[start + len(marker):end]
+                nodes.append(('code', code.strip(' ') or code))
+                pos = end + len(marker)
+                continue
+        elif marker == '![':
+            image = IMAGE_RE.match(text, start)
+            if image:
+                flush()
+                nodes.append(('image', image.group(1), image.group(2)))
+                pos = image.end()
+                continue
+        elif marker == '[':
+            link = LINK_RE.match(text, start)
+            if link:
+                flush()
+                nodes.append(('link', parse_inlines(link.group(1)), link.group(2)))
+                pos = link.end()
+                continue
+        elif _can_open(text, start, marker):
+            span = _parse_emphasis(text, start, marker, dead)
+            if span:
+                flush()
+                nodes.append(span[0])
+                pos = span[1]
+                continue
+
+        buffer.append(marker)
+        pos = start + len(marker)
+
+    flush()
+    return nodes
+
+def inline_text(nodes):
+    """Flatten inline nodes back to their plain text."""
+    parts = []
+    for node in nodes:
+        kind = node[0]
+        if kind in ('text', 'code'):
+            parts.append(node[1])
+        elif kind in ('strong', 'em', 'link'):
+            parts.append(inline_text(node[1]))
+        elif kind == 'image':
+            parts.append(node[1])
+    return ''.join(parts)
+
+# ---------------------------------------------------------------------------
+# Block tokenizer
+# ---------------------------------------------------------------------------
+
+def _split_table_row(line):
+    """Split a Markdown table row into stripped cell strings."""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|'):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split('|')]
+
+def _replace_symbols(text):
+    for symbol, replacement in SYMBOL_REPLACEMENTS.items():
+        text = text.replace(symbol, replacement)
+    return text
+
+def _table_node(table_lines):
+    """Parse table lines; data cells get their symbol replacement here."""
+    header = [parse_inlines(cell) for cell in _split_table_row(table_lines[0])]
+    rows = []
+    for row in table_lines[2:]:
+        cells = _split_table_row(row)
+        if cells:
+            rows.append([parse_inlines(_replace_symbols(cell)) for cell in cells[:len(header)]])
+    return ('table', header, rows)
+
+def iter_blocks(lines):
+    """Tokenize Markdown lines into block nodes, yielding each as it closes.
+
+    Lines are consumed from any iterator with one line of lookahead, so only
+    the block being built (a code block or table at most) is held in memory.
+    """
+    stream = (line.rstrip() for line in lines)
+    line = next(stream, None)
+    first_line = True
+
+    while line is not None:
+        following = next(stream, None)
+
+        # Code blocks
+        if line.startswith('```'):
+            code_lines = []
+            line = following
+            while line is not None and not line.startswith('```'):
+                code_lines.append(line)
+                line = next(stream, None)
+            if code_lines:
+                yield ('code', code_lines)
+            line = next(stream, None) if line is not None else None
+            first_line = False
+            continue
+
+        # Tables: a row with pipes followed by a separator row
+        if '|' in line and following is not None and TABLE_SEPARATOR_RE.match(following):
+            table_lines = [line, following]
+            line = next(stream, None)
+            while line is not None and '|' in line:
+                table_lines.append(line)
+                line = next(stream, None)
+            yield _table_node(table_lines)
+            first_line = False
+            continue
+
+        header = HEADER_RE.match(line)
+        if header:
+            yield ('heading', len(header.group(1)), parse_inlines(header.group(2)))
+        elif HR_RE.match(line):
+            yield ('hr',)
+        elif BULLET_RE.match(line):
+            yield ('bullet', parse_inlines(BULLET_RE.sub('', line, count=1)))
+        elif ORDERED_RE.match(line):
+            yield ('ordered', parse_inlines(ORDERED_RE.sub('', line, count=1)))
+        elif line.startswith('>'):
+            yield ('quote', parse_inlines(QUOTE_RE.sub('', line, count=1)))
+        elif not line.strip():
+            if not first_line:  # Don't add space at the beginning
+                yield ('blank',)
+        else:
+            yield ('paragraph', parse_inlines(line))
+        first_line = False
+        line = following
+
+def parse_blocks(lines):
+    """Tokenize Markdown lines into a list of block nodes."""
+    return list(iter_blocks(lines))
+
+# ---------------------------------------------------------------------------
+# Images
+# ---------------------------------------------------------------------------
+
+IMAGE_DPI = 150
+DEFAULT_IMAGE_WIDTH = 6.0  # inches
+DEFAULT_IMAGE_QUALITY = 85
+
+# Prepared images by cache name, shared by every document converted in this
+# process: name -> (bytes, pixel width)
+_PREPARED_IMAGES = {}
+
+def prepare_image(data, max_width_px, quality):
+    """Downscale image bytes to max_width_px and recompress them.
+
+    JPEGs are re-encoded at quality; everything else becomes an optimized
+    PNG. Returns (bytes, extension, pixel width).
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        is_jpeg = img.format == 'JPEG'
+        # Phone photos are often stored sideways with an EXIF rotation
+        img = ImageOps.exif_transpose(img)
+        if img.width > max_width_px:
+            img = img.resize((max_width_px, round(img.height * max_width_px / img.width)), Image.LANCZOS)
+        out = io.BytesIO()
+        if is_jpeg:
+            img.convert('RGB').save(out, 'JPEG', quality=quality, optimize=True, progressive=True)
         else:
-            run.text = part
+            img.save(out, 'PNG', optimize=True)
+        return out.getvalue(), '.jpg' if is_jpeg else '.png', img.width
+
+def write_atomic(path, data):
+    """Write bytes to path via a temporary file and a rename, so that
+    concurrent workers never read a partial file."""
+    path = Path(path)
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+class ImageCache:
+    """Resized and recompressed images keyed by (source hash, width, quality).
+
+    Prepared bytes are kept in memory for the process and, with cache_dir
+    set, on disk so that other documents and worker processes in a batch
+    reuse them instead of recompressing.
+    """
 
-def convert_md_to_docx(md_file, docx_file):
-    """Convert markdown file to Word document."""
+    def __init__(self, cache_dir=None, width=DEFAULT_IMAGE_WIDTH, quality=DEFAULT_IMAGE_QUALITY):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.width = width
+        self.quality = quality
+
+    @property
+    def width_px(self):
+        return round(self.width * IMAGE_DPI)
+
+    def get(self, path):
+        """Return (cache name, bytes, pixel width) for the image at path."""
+        data = Path(path).read_bytes()
+        stem = f'{hashlib.sha256(data).hexdigest()[:32]}-{self.width_px}-{self.quality}'
+        for ext in ('.jpg', '.png'):
+            cached = self.load(stem + ext)
+            if cached:
+                return (stem + ext, *cached)
+        prepared, ext, width_px = prepare_image(data, self.width_px, self.quality)
+        name = stem + ext
+        _PREPARED_IMAGES[name] = (prepared, width_px)
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.cache_dir / name, prepared)
+        return name, prepared, width_px
+
+    def load(self, name):
+        """Return (bytes, pixel width) for a prepared image, or None if not cached."""
+        cached = _PREPARED_IMAGES.get(name)
+        if cached is None and self.cache_dir and (self.cache_dir / name).exists():
+            data = (self.cache_dir / name).read_bytes()
+            with Image.open(io.BytesIO(data)) as img:
+                cached = _PREPARED_IMAGES[name] = (data, img.width)
+        return cached
+
+# ---------------------------------------------------------------------------
+# Profiling
+# ---------------------------------------------------------------------------
+
+def record_time(profile, phase, seconds):
+    """Add one timed call of phase to a {phase: {'count', 'seconds'}} profile."""
+    entry = profile.setdefault(phase, {'count': 0, 'seconds': 0.0})
+    entry['count'] += 1
+    entry['seconds'] += seconds
+
+def timed_blocks(blocks, profile):
+    """Yield from a block iterator, charging the time spent tokenizing to 'parse'."""
+    blocks = iter(blocks)
+    while True:
+        started = time.perf_counter()
+        block = next(blocks, None)
+        elapsed = time.perf_counter() - started
+        if block is None:
+            return
+        record_time(profile, 'parse', elapsed)
+        yield block
+
+def print_profile(profile):
+    """Print a profile as a table, slowest phase first."""
+    total = sum(entry['seconds'] for entry in profile.values())
+    print(f"{'phase':<12} {'count':>8} {'seconds':>10} {'share':>7}")
+    for phase, entry in sorted(profile.items(), key=lambda item: -item[1]['seconds']):
+        share = entry['seconds'] / total if total else 0
+        print(f"{phase:<12} {entry['count']:>8} {entry['seconds']:>10.4f} {share:>7.1%}")
+    print(f"{'total':<12} {'':>8} {total:>10.4f}")
+
+# ---------------------------------------------------------------------------
+# Renderer
+# ---------------------------------------------------------------------------
+
+HEADING_SIZES = {1: Pt(20), 2: Pt(16), 3: Pt(14)}
+
+def ensure_styles(doc):
+    """Register the converter's named styles on doc unless it already has them."""
+    styles = doc.styles
+    if 'InlineCode' not in styles:
+        inline_code = styles.add_style('InlineCode', WD_STYLE_TYPE.CHARACTER)
+        inline_code.font.name = 'Courier New'
+        inline_code.font.size = Pt(10)
+    if 'CodeBlock' not in styles:
+        code_block = styles.add_style('CodeBlock', WD_STYLE_TYPE.PARAGRAPH)
+        code_block.base_style = styles['Normal']
+        code_block.font.name = 'Courier New'
+        code_block.font.size = Pt(9)
+    if 'Hyperlink' not in styles:
+        hyperlink = styles.add_style('Hyperlink', WD_STYLE_TYPE.CHARACTER)
+        hyperlink.font.color.rgb = RGBColor(0x05, 0x63, 0xC1)
+        hyperlink.font.underline = True
+
+def new_document():
+    """Create a document with the converter's base and named styles.
+
+    Code and heading formatting lives in styles registered here once, so runs
+    only carry a style reference instead of their own w:rPr.
+    """
     doc = Document()
+    styles = doc.styles
 
     # Set default font
-    style = doc.styles['Normal']
+    style = styles['Normal']
     font = style.font
     font.name = 'Calibri'
     font.size = Pt(11)
 
-    with open(md_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    ensure_styles(doc)
 
-    i = 0
-    in_table = False
-    table_rows = []
-    in_code_block = False
-    code_lines = []
+    for level, size in HEADING_SIZES.items():
+        heading = styles[f'Heading {level}']
+        heading.font.size = size
+        heading.font.color.rgb = RGBColor(0, 0, 0)
+    return doc
+
+class DocxRenderer:
+    """Walks block nodes once and appends them to a python-docx Document.
+
+    Style names are resolved to style ids, and hyperlink URLs and images to
+    relationship ids, once per document; python-docx otherwise rescans the
+    whole styles part for every styled paragraph, and a URL cited many times
+    would get a relationship per citation. Body elements are inserted in
+    front of a cached w:sectPr instead of through Document.add_paragraph(),
+    which searches the body for it on every call and makes long documents
+    quadratic.
 
-    while i < len(lines):
-        line = lines[i].rstrip()
+    Local images are resolved against base_dir and prepared through images,
+    an ImageCache.
+    """
 
-        # Handle code blocks
+    def __init__(self, doc, base_dir='.', images=None):
+        self.doc = doc
+        self.base_dir = Path(base_dir)
+        self.images = images or ImageCache()
+        self._style_ids = {}
+        self.rel_ids = {}
+        self._next_rel = None
+        # Image cache name -> (rId, cx, cy)
+        self.image_refs = {}
+        self.image_sources = {}
+        self._shape_id = 0
+        # Set to a dict to collect per-block-type counts and render times
+        self.profile = None
+        self._body = doc.element.body
+        self._sect_pr = self._body.sectPr
+        # Document._block_width looks up the sections with an XPath over the
+        # whole body, so read it once
+        self._block_width = doc._block_width
+        section = doc.sections[0]
+        self._block_height = section.page_height - section.top_margin - section.bottom_margin
+
+    def append_body_element(self, element):
+        """Append a block-level element to the end of the document body."""
+        if self._sect_pr is not None:
+            self._sect_pr.addprevious(element)
+        else:
+            self._body.append(element)
+        return element
+
+    def style_id(self, name):
+        style_id = self._style_ids.get(name)
+        if style_id is None:
+            if name not in self.doc.styles:
+                # A document not made by new_document(), e.g. via add_formatted_text()
+                ensure_styles(self.doc)
+            style_id = self._style_ids[name] = self.doc.styles[name].style_id
+        return style_id
+
+    def hyperlink_rel_id(self, url):
+        """Return the relationship id for an external URL, relating it once.
+
+        part.relate_to() scans every relationship to match the target and
+        again to pick the next rId, which is quadratic in distinct URLs, so
+        new ids are numbered here, above the ones the part already has.
+        """
+        r_id = self.rel_ids.get(url)
+        if r_id is None:
+            rels = self.doc.part.rels
+            if self._next_rel is None:
+                self._next_rel = 1 + max((int(r[3:]) for r in rels if r[3:].isdigit()), default=0)
+            # Image parts are related through python-docx, which may take an id first
+            while f'rId{self._next_rel}' in rels:
+                self._next_rel += 1
+            r_id = self.rel_ids[url] = f'rId{self._next_rel}'
+            rels.add_relationship(HYPERLINK_RELTYPE, url, r_id, is_external=True)
+            self._next_rel += 1
+        return r_id
+
+    def add_paragraph(self, style=None):
+        paragraph = Paragraph(self.append_body_element(OxmlElement('w:p')), self.doc._body)
+        if style:
+            paragraph._p.style = self.style_id(style)
+        return paragraph
+
+    def spool_body(self, spool):
+        """Serialize rendered body elements to spool and drop them from the tree.
+
+        lxml repeats every in-scope namespace declaration on a serialized
+        fragment; they are already declared on w:document, so they are
+        stripped from the fragment's root tag.
+        """
+        for element in list(self._body):
+            if element is self._sect_pr:
+                continue
+            xml = etree.tostring(element, encoding='utf-8')
+            head_end = xml.index(b'>') + 1
+            spool.write(NS_DECL_RE.sub(b'', xml[:head_end]) + xml[head_end:])
+            self._body.remove(element)
+
+    def render(self, blocks):
+        for block in blocks:
+            self.render_block(block)
+
+    def render_block(self, block):
+        """Append one block node to the document."""
+        if self.profile is None:
+            self._render_block(block)
+            return
+        started = time.perf_counter()
+        self._render_block(block)
+        record_time(self.profile, block[0], time.perf_counter() - started)
+
+    def _render_block(self, block):
+        kind = block[0]
+        if kind == 'paragraph':
+            self.render_inlines(self.add_paragraph(), block[1])
+        elif kind == 'blank':
+            self.add_paragraph()
+        elif kind == 'heading':
+            self.render_heading(block[1], block[2])
+        elif kind == 'bullet':
+            self.render_inlines(self.add_paragraph('List Bullet'), block[1])
+        elif kind == 'ordered':
+            self.render_inlines(self.add_paragraph('List Number'), block[1])
+        elif kind == 'quote':
+            self.render_inlines(self.add_paragraph('Intense Quote'), block[1])
+        elif kind == 'table':
+            self.render_table(block[1], block[2])
+        elif kind == 'code':
+            self.render_code(block[1])
+        elif kind == 'hr':
+            self.add_paragraph().add_run('_' * 50)
+
+    def render_inlines(self, paragraph, nodes, bold=False, italic=False):
+        """Append runs for inline nodes to a paragraph."""
+        for node in nodes:
+            kind = node[0]
+            if kind == 'text':
+                run = paragraph.add_run(node[1])
+                if bold:
+                    run.bold = True
+                if italic:
+                    run.italic = True
+            elif kind == 'code':
+                run = paragraph.add_run(node[1])
+                run._r.style = self.style_id('InlineCode')
+                if bold:
+                    run.bold = True
+            elif kind == 'strong':
+                self.render_inlines(paragraph, node[1], True, italic)
+            elif kind == 'em':
+                self.render_inlines(paragraph, node[1], bold, True)
+            elif kind == 'link':
+                self.render_link(paragraph, node[2], node[1], bold, italic)
+            elif kind == 'image':
+                if not self.render_image(paragraph, node[2]) and node[1]:
+                    run = paragraph.add_run(node[1])
+                    run.italic = True
+
+    def image_ref(self, name, data, width_px):
+        """Return (rId, cx, cy) for a prepared image, adding its part once."""
+        ref = self.image_refs.get(name)
+        if ref is None:
+            r_id, image = self.doc.part.get_or_add_image(io.BytesIO(data))
+            cx, cy = image.scaled_dimensions(Inches(width_px / IMAGE_DPI), None)
+            # Tall screenshots are scaled down to fit on one page
+            if cy > self._block_height:
+                cx, cy = Emu(cx * self._block_height // cy), Emu(self._block_height)
+            ref = self.image_refs[name] = (r_id, cx, cy)
+        return ref
+
+    def next_shape_id(self):
+        # StoryPart.next_id scans every id in the document and misses spooled
+        # elements, so drawing ids are numbered here
+        self._shape_id += 1
+        return self._shape_id
+
+    def render_image(self, paragraph, url):
+        """Embed a local image as an inline picture; return False if it can't be."""
+        if '://' in url or url.startswith('data:'):
+            return False
+        path = self.base_dir / unquote(url)
+        if not path.is_file():
+            print(f"⚠ Image not found: {path}")
+            return False
+        try:
+            name, data, width_px = self.images.get(path)
+        except OSError:  # includes PIL.UnidentifiedImageError, e.g. for SVG
+            print(f"⚠ Can't read image {path}, using its alt text")
+            return False
+        self.image_sources[name] = unquote(url)
+        r_id, cx, cy = self.image_ref(name, data, width_px)
+        inline = CT_Inline.new_pic_inline(self.next_shape_id(), r_id, name, cx, cy)
+        paragraph.add_run()._r.add_drawing(inline)
+        return True
+
+    def render_link(self, paragraph, url, nodes, bold=False, italic=False):
+        """Render link text inside a w:hyperlink and return that element.
+
+        In-document anchors stay plain text and return None.
+        """
+        p = paragraph._p
+        first_run = len(p)
+        self.render_inlines(paragraph, nodes, bold, italic)
+        if not url or url.startswith('#'):
+            return None
+        hyperlink = OxmlElement('w:hyperlink')
+        hyperlink.set(qn('r:id'), self.hyperlink_rel_id(url))
+        for r in p[first_run:]:
+            if r.style is None:
+                r.style = self.style_id('Hyperlink')
+            hyperlink.append(r)
+        p.append(hyperlink)
+        return hyperlink
+
+    def render_heading(self, level, inlines):
+        heading = self.add_paragraph('Title' if level == 0 else f'Heading {level}')
+        self.render_inlines(heading, inlines)
+
+    def render_table(self, header, rows):
+        """Build the whole w:tbl in one parse and fill its cell paragraphs in order.
+
+        Going through table.rows[i].cells[j] rebuilds the row and cell proxy
+        lists on every access, which is quadratic in the table size.
+        """
+        if rows:
+            cols = len(header)
+            col_twips = Emu(self._block_width // cols).twips
+            cell_xml = f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_twips}"/></w:tcPr><w:p/></w:tc>'
+            row_xml = f'<w:tr>{cell_xml * cols}</w:tr>'
+            grid_xml = f'<w:gridCol w:w="{col_twips}"/>' * cols
+            tbl = parse_xml(
+                f'<w:tbl {nsdecls("w")}>'
+                f'<w:tblPr><w:tblStyle w:val="{self.style_id("Light Grid Accent 1")}"/>'
+                f'<w:tblW w:type="auto" w:w="0"/>'
+                f'<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+                f' w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+                f'<w:tblGrid>{grid_xml}</w:tblGrid>'
+                f'{row_xml * (1 + len(rows))}'
+                f'</w:tbl>'
+            )
+            paragraphs = tbl.iter(qn('w:p'))
+
+            # Header cells are bold; data cells already had symbols replaced
+            for cell_inlines in header:
+                self.render_inlines(Paragraph(next(paragraphs), self.doc._body), cell_inlines, bold=True)
+            for row_data in rows:
+                for col_idx in range(cols):
+                    p = next(paragraphs)
+                    if col_idx < len(row_data):
+                        self.render_inlines(Paragraph(p, self.doc._body), row_data[col_idx])
+
+            self.append_body_element(tbl)
+
+        self.add_paragraph()  # Add spacing after table
+
+    def render_code(self, code_lines):
+        p = self.add_paragraph('CodeBlock')
+        p.add_run(''.join(code_line + '\n' for code_line in code_lines))
+
+def _document_renderer(paragraph):
+    """The DocxRenderer for a paragraph's document, kept on its part so that
+    repeated helper calls share its style and URL lookups."""
+    part = paragraph.part
+    renderer = getattr(part, '_md_to_docx_renderer', None)
+    if renderer is None:
+        renderer = part._md_to_docx_renderer = DocxRenderer(part.document)
+    return renderer
+
+def add_hyperlink(paragraph, url, text):
+    """Add a hyperlink to a paragraph and return its w:hyperlink element."""
+    return _document_renderer(paragraph).render_link(paragraph, url, [('text', text)])
+
+def add_formatted_text(paragraph, text):
+    """Add text with inline formatting to a paragraph."""
+    _document_renderer(paragraph).render_inlines(paragraph, parse_inlines(text))
+
+def _save_with_spooled_body(doc, docx_file, spool):
+    """Save doc, splicing the spooled body XML into word/document.xml.
+
+    The package is saved with an (almost) empty body, then copied entry by
+    entry into docx_file while the body fragments are streamed in from the
+    spool file in front of the final w:sectPr.
+    """
+    package = io.BytesIO()
+    doc.save(package)
+    with zipfile.ZipFile(package) as src, zipfile.ZipFile(docx_file, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            if item.filename != 'word/document.xml':
+                dst.writestr(item, src.read(item.filename))
+                continue
+            xml = src.read(item.filename)
+            if b'<w:body/>' in xml:
+                xml = xml.replace(b'<w:body/>', b'<w:body></w:body>')
+            cut = xml.find(b'<w:sectPr', xml.find(b'<w:body>'))
+            if cut == -1:
+                cut = xml.rfind(b'</w:body>')
+            info = zipfile.ZipInfo(item.filename, date_time=item.date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with dst.open(info, 'w', force_zip64=True) as out:
+                out.write(xml[:cut])
+                spool.seek(0)
+                shutil.copyfileobj(spool, out)
+                out.write(xml[cut:])
+
+def iter_sections(lines):
+    """Group lines into heading-delimited sections.
+
+    A new section starts at every heading line outside a code fence; lines
+    before the first heading form their own section.
+    """
+    section = []
+    in_code_block = False
+    for line in lines:
         if line.startswith('```'):
-            if in_code_block:
-                # End code block
-                if code_lines:
-                    p = doc.add_paragraph()
-                    for code_line in code_lines:
-                        run = p.add_run(code_line + '\n')
-                        run.font.name = 'Courier New'
-                        run.font.size = Pt(9)
-                    code_lines = []
-                in_code_block = False
+            in_code_block = not in_code_block
+        elif not in_code_block and section and HEADER_RE.match(line.rstrip()):
+            yield section
+            section = []
+        section.append(line)
+    if section:
+        yield section
+
+def _section_key(lines, first, images):
+    digest = hashlib.sha256(f'{CONVERTER_VERSION}\0{int(first)}\0{images.width_px}\0{images.quality}\0'.encode())
+    for line in lines:
+        digest.update(line.encode('utf-8'))
+    return digest.hexdigest()
+
+def _fragment_rels(renderer, fragment):
+    """Describe the relationships a rendered fragment uses, by rId."""
+    urls = {r_id: url for url, r_id in renderer.rel_ids.items()}
+    images = {ref[0]: name for name, ref in renderer.image_refs.items()}
+    rels = {}
+    for _, r_id in REL_ID_RE.findall(fragment):
+        r_id = r_id.decode()
+        if r_id in urls:
+            rels[r_id] = {'url': urls[r_id]}
+        else:
+            name = images[r_id]
+            rels[r_id] = {'image': name, 'source': renderer.image_sources[name]}
+    return rels
+
+def _restore_fragment(renderer, fragment, rels):
+    """Remap a cached fragment's ids onto this document.
+
+    Returns None when an image it embeds has changed on disk since it was
+    cached, so the section has to be rendered again.
+    """
+    prepared = {}
+    for entry in rels.values():
+        if 'image' in entry:
+            path = renderer.base_dir / entry['source']
+            if not path.is_file():
+                return None
+            try:
+                name, data, width_px = renderer.images.get(path)
+            except OSError:
+                # Render the section again so the image falls back to its alt text
+                return None
+            if name != entry['image']:
+                return None
+            prepared[name] = (data, width_px)
+            renderer.image_sources[name] = entry['source']
+
+    def remap(match):
+        entry = rels[match.group(2).decode()]
+        if 'url' in entry:
+            r_id = renderer.hyperlink_rel_id(entry['url'])
+        else:
+            r_id = renderer.image_ref(entry['image'], *prepared[entry['image']])[0]
+        return b'%s="%s"' % (match.group(1), r_id.encode())
+
+    # Relate in order of appearance so ids match a full render
+    fragment = REL_ID_RE.sub(remap, fragment)
+    return DOCPR_ID_RE.sub(lambda m: b'%s%d"' % (m.group(1), renderer.next_shape_id()), fragment)
+
+def _render_sections(renderer, lines, cache_dir, spool):
+    """Spool each section's body XML, reusing cached fragments by content hash.
+
+    Relationship and drawing ids are only meaningful within one document, so
+    a fragment that uses hyperlinks or images is cached with a
+    <hash>.rels.json describing each rId, and its ids are remapped to this
+    document when it is reused.
+
+    Returns (rendered, total) section counts.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    rendered = total = 0
+    for section in iter_sections(lines):
+        key = _section_key(section, total == 0, renderer.images)
+        cache_file = cache_dir / f'{key}.xml'
+        rels_file = cache_dir / f'{key}.rels.json'
+        fragment = None
+        if cache_file.exists():
+            fragment = cache_file.read_bytes()
+            if rels_file.exists():
+                fragment = _restore_fragment(renderer, fragment, json.loads(rels_file.read_text()))
+        if fragment is None:
+            buffer = io.BytesIO()
+            blocks = iter_blocks(section)
+            if renderer.profile is not None:
+                blocks = timed_blocks(blocks, renderer.profile)
+            for block in blocks:
+                renderer.render_block(block)
+            renderer.spool_body(buffer)
+            fragment = buffer.getvalue()
+            rels = _fragment_rels(renderer, fragment)
+            # The cache is shared by batch workers: the rels file goes first so
+            # a fragment is never visible without it
+            if rels:
+                write_atomic(rels_file, json.dumps(rels, sort_keys=True).encode())
             else:
-                # Start code block
-                in_code_block = True
-            i += 1
-            continue
+                rels_file.unlink(missing_ok=True)
+            write_atomic(cache_file, fragment)
+            rendered += 1
+        spool.write(fragment)
+        total += 1
+    return rendered, total
 
-        if in_code_block:
-            code_lines.append(line)
-            i += 1
-            continue
+def convert_md_to_docx(md_file, docx_file, streaming=False, cache_dir=None, profile=False, images=None,
+                       embedded=None):
+    """Convert markdown file to Word document.
 
-        # Handle headers
-        if line.startswith('#'):
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if header_match:
-                level = len(header_match.group(1))
-                text = header_match.group(2)
-
-                # Remove markdown links from headers
-                text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-
-                heading = doc.add_heading(text, level=level)
-                if level == 1:
-                    heading.runs[0].font.size = Pt(20)
-                    heading.runs[0].font.color.rgb = RGBColor(0, 0, 0)
-                elif level == 2:
-                    heading.runs[0].font.size = Pt(16)
-                    heading.runs[0].font.color.rgb = RGBColor(0, 0, 0)
-                elif level == 3:
-                    heading.runs[0].font.size = Pt(14)
-                    heading.runs[0].font.color.rgb = RGBColor(0, 0, 0)
-
-        # Handle horizontal rules
-        elif line.startswith('---') or line.startswith('***'):
-            doc.add_paragraph('_' * 50)
-
-        # Handle tables
-        elif '|' in line and not in_table:
-            # Start collecting table rows
-            table_rows = [line]
-            i += 1
-            # Collect all table rows
-            while i < len(lines) and '|' in lines[i]:
-                table_rows.append(lines[i].rstrip())
-                i += 1
-
-            # Parse and create table
-            if len(table_rows) >= 2:  # Header + separator at minimum
-                # Parse header
-                headers = [cell.strip() for cell in table_rows[0].split('|')[1:-1]]
-
-                # Parse data rows (skip separator row)
-                data_rows = []
-                for row in table_rows[2:]:
-                    cells = [cell.strip() for cell in row.split('|')[1:-1]]
-                    if cells:
-                        data_rows.append(cells)
-
-                # Create table
-                if data_rows:
-                    table = doc.add_table(rows=1 + len(data_rows), cols=len(headers))
-                    table.style = 'Light Grid Accent 1'
-
-                    # Add headers
-                    for j, header in enumerate(headers):
-                        cell = table.rows[0].cells[j]
-                        cell.text = header
-                        # Bold header text
-                        for paragraph in cell.paragraphs:
-                            for run in paragraph.runs:
-                                run.bold = True
-
-                    # Add data
-                    for row_idx, row_data in enumerate(data_rows):
-                        for col_idx, cell_data in enumerate(row_data):
-                            if col_idx < len(headers):
-                                # Handle checkmarks and symbols
-                                cell_data = cell_data.replace('✅', '✓')
-                                cell_data = cell_data.replace('❌', '✗')
-                                cell_data = cell_data.replace('⚠️', '⚠')
-                                table.rows[row_idx + 1].cells[col_idx].text = cell_data
-
-                doc.add_paragraph()  # Add spacing after table
-            continue
+    Blocks are rendered as soon as the tokenizer closes them. With
+    streaming=True each rendered block is also serialized to a temporary
+    spool file and dropped from the in-memory document, so peak memory is
+    bounded by the largest single block rather than the file size.
 
-        # Handle unordered lists
-        elif re.match(r'^[\*\-\+]\s+', line):
-            text = re.sub(r'^[\*\-\+]\s+', '', line)
-            p = doc.add_paragraph(style='List Bullet')
-            add_formatted_text(p, text)
+    With cache_dir set, the source is split into heading-delimited sections
+    and each section's rendered body XML is cached on disk under a hash of
+    its text. Only changed sections are rendered; the rest are spliced in
+    from the cache.
 
-        # Handle ordered lists
-        elif re.match(r'^\d+\.\s+', line):
-            text = re.sub(r'^\d+\.\s+', '', line)
-            p = doc.add_paragraph(style='List Number')
-            add_formatted_text(p, text)
+    With profile=True, tokenizing, rendering of each block type, spooling and
+    saving are timed separately; the profile is printed and returned.
 
-        # Handle blockquotes
-        elif line.startswith('>'):
-            text = re.sub(r'^>\s*', '', line)
-            p = doc.add_paragraph()
-            p.style = 'Intense Quote'
-            add_formatted_text(p, text)
+    Local images are embedded through images, an ImageCache; by default one
+    that only caches in memory. If embedded is a set, the path of each local
+    image the document embeds, relative to md_file, is added to it.
+    """
+    doc = new_document()
+    renderer = DocxRenderer(doc, Path(md_file).parent, images)
+    if profile:
+        renderer.profile = {}
+    summary = ''
 
-        # Handle empty lines
-        elif not line.strip():
-            if i > 0:  # Don't add space at the beginning
-                doc.add_paragraph()
+    with open(md_file, 'r', encoding='utf-8') as f:
+        with tempfile.TemporaryFile() as spool:
+            if cache_dir:
+                rendered, total = _render_sections(renderer, f, cache_dir, spool)
+                summary = f" ({rendered} of {total} sections rendered)"
+            else:
+                blocks = iter_blocks(f)
+                if profile:
+                    blocks = timed_blocks(blocks, renderer.profile)
+                for block in blocks:
+                    renderer.render_block(block)
+                    if streaming:
+                        started = time.perf_counter()
+                        renderer.spool_body(spool)
+                        if profile:
+                            record_time(renderer.profile, 'spool', time.perf_counter() - started)
 
-        # Handle regular paragraphs
-        else:
-            if line.strip():
-                p = doc.add_paragraph()
-                add_formatted_text(p, line)
+            # Save the document
+            started = time.perf_counter()
+            if cache_dir or streaming:
+                _save_with_spooled_body(doc, docx_file, spool)
+            else:
+                doc.save(docx_file)
+            if profile:
+                record_time(renderer.profile, 'save', time.perf_counter() - started)
+    if embedded is not None:
+        embedded.update(renderer.image_sources.values())
+    print(f"✓ Successfully created {docx_file}{summary}")
+    if profile:
+        print_profile(renderer.profile)
+        return renderer.profile
+
+def file_sha256(path):
+    """Return the hex SHA-256 of a file."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+def _convert_one(md_file, docx_file, streaming=False, cache_dir=None, images=None):
+    """Batch worker: convert one file; return the hashes of the local images it embeds."""
+    Path(docx_file).parent.mkdir(parents=True, exist_ok=True)
+    embedded = set()
+    convert_md_to_docx(md_file, docx_file, streaming, cache_dir, images=images, embedded=embedded)
+    base_dir = Path(md_file).parent
+    return {source: file_sha256(base_dir / source) for source in sorted(embedded)}
+
+def _images_unchanged(md_file, image_hashes):
+    """Whether every image recorded for md_file still has its recorded hash."""
+    base_dir = Path(md_file).parent
+    return all((base_dir / source).is_file() and file_sha256(base_dir / source) == digest
+               for source, digest in image_hashes.items())
+
+def convert_tree(src_dir, dst_dir, workers=1, force=False, streaming=False, incremental=False,
+                 image_width=DEFAULT_IMAGE_WIDTH, image_quality=DEFAULT_IMAGE_QUALITY):
+    """Convert every .md under src_dir to a .docx under dst_dir.
+
+    A manifest in dst_dir records each source's hash, the converter version
+    and the hashes of the local images it embeds; sources where all of these
+    are unchanged, and whose output still exists, are skipped. Conversions run in a process pool. With
+    incremental=True, section fragments are cached in dst_dir/CACHE_DIR_NAME.
+    Prepared images are always cached there, so an image referenced by
+    several documents is resized and recompressed once per batch. The
+    manifest is rewritten as each file finishes, so a failed or interrupted
+    batch resumes where it stopped.
+    """
+    src_dir = Path(src_dir)
+    dst_dir = Path(dst_dir)
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = dst_dir / MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    cache_dir = dst_dir / CACHE_DIR_NAME if incremental else None
+    images = ImageCache(dst_dir / CACHE_DIR_NAME / 'images', image_width, image_quality)
+
+    jobs = {}
+    skipped = 0
+    for md_file in sorted(src_dir.rglob('*.md')):
+        rel = md_file.relative_to(src_dir).as_posix()
+        docx_file = dst_dir / Path(rel).with_suffix('.docx')
+        entry = {'sha256': file_sha256(md_file), 'version': CONVERTER_VERSION,
+                 'images': [images.width_px, images.quality]}
+        previous = dict(manifest.get(rel, {}))
+        image_hashes = previous.pop('embedded', None)
+        if (not force and previous == entry and image_hashes is not None
+                and docx_file.exists() and _images_unchanged(md_file, image_hashes)):
+            skipped += 1
+            continue
+        jobs[rel] = (md_file, docx_file, entry)
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(_convert_one, md_file, docx_file, streaming, cache_dir, images): rel
+                   for rel, (md_file, docx_file, _) in jobs.items()}
+        for future in as_completed(futures):
+            rel = futures[future]
+            try:
+                manifest[rel] = {**jobs[rel][2], 'embedded': future.result()}
+            except Exception as e:
+                print(f"❌ Failed to convert {rel}: {e}")
+                failed.append(rel)
+                continue
+            write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode())
 
-        i += 1
+    print(f"✓ Converted {len(jobs) - len(failed)} files, skipped {skipped} unchanged ({src_dir} → {dst_dir})")
+    if failed:
+        raise SystemExit(f"Failed to convert: {', '.join(sorted(failed))}")
+    return list(jobs)
 
-    # Save the document
-    doc.save(docx_file)
-    print(f"✓ Successfully created {docx_file}")
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Convert Markdown to Word documents.')
+    parser.add_argument('source', help='Markdown file, or a directory of Markdown files')
+    parser.add_argument('destination', nargs='?',
+                        help='output .docx file or directory (default: next to the source)')
+    parser.add_argument('--workers', type=int, default=1, help='convert files in N processes (directory mode)')
+    parser.add_argument('--stream', action='store_true',
+                        help='bounded-memory mode: spool rendered blocks to disk instead of keeping the document tree')
+    parser.add_argument('--incremental', action='store_true',
+                        help=f'cache rendered sections in {CACHE_DIR_NAME}/ next to the output and '
+                             'only re-render sections whose text changed')
+    parser.add_argument('--image-width', type=float, default=DEFAULT_IMAGE_WIDTH,
+                        help='display width of embedded images in inches (default: %(default)s)')
+    parser.add_argument('--image-quality', type=int, default=DEFAULT_IMAGE_QUALITY,
+                        help='JPEG quality for recompressed images (default: %(default)s)')
+    parser.add_argument('--profile', action='store_true',
+                        help='print per-block-type counts and times, and the save time (single file)')
+    parser.add_argument('--force', action='store_true', help='rebuild every file, ignoring the manifest')
+    return parser.parse_args(argv)
 
 if __name__ == '__main__':
-    md_file = '/workspaces/DMDHW/habit-tracker-analysis.md'
-    docx_file = '/workspaces/DMDHW/habit-tracker-analysis.docx'
+    args = parse_args()
+    source = Path(args.source)
 
-    convert_md_to_docx(md_file, docx_file)
+    if source.is_dir():
+        convert_tree(source, args.destination or source, workers=args.workers, force=args.force,
+                     streaming=args.stream, incremental=args.incremental,
+                     image_width=args.image_width, image_quality=args.image_quality)
+    else:
+        docx_file = Path(args.destination or source.with_suffix('.docx'))
+        cache_dir = docx_file.parent / CACHE_DIR_NAME if args.incremental else None
+        images = ImageCache(cache_dir / 'images' if cache_dir else None, args.image_width, args.image_quality)
+        convert_md_to_docx(source, docx_file, streaming=args.stream, cache_dir=cache_dir,
+                           profile=args.profile, images=images)
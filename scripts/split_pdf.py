@@ -1,12 +1,338 @@
 #!/usr/bin/env python3
 """Split PDF files into smaller chunks for processing."""
 
-import sys
-from pypdf import PdfReader, PdfWriter
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, StreamObject
 from pathlib import Path
 
-def split_pdf(input_path, pages_per_chunk=20):
-    """Split a PDF into smaller chunks."""
+# Keys that point back into the page tree; following them would pull the whole
+# document into every page's cost. /Dest is followed on purpose: PdfWriter
+# copies link targets along with the annotation, so they do end up in the chunk.
+SKIP_KEYS = {"/Parent", "/P", "/B", "/Thumb"}
+# Rough per-object overhead in the written file (header, dictionary, xref entry).
+OBJECT_OVERHEAD = 40
+PAGE_INDEX_VERSION = 1
+OUTLINE_INDEX_VERSION = 1
+PAGE_REFS_VERSION = 1
+# Page attributes that may be inherited from an ancestor node of the page tree
+INHERITABLE_KEYS = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+MANIFEST_NAME = "split_manifest.json"
+
+# Per-process reader cache for text extraction workers
+_WORKER_READERS = {}
+
+def chunk_ranges(total_pages, pages_per_chunk):
+    """Return (start, end) page ranges, 0-based and end-exclusive."""
+    return [
+        (start_page, min(start_page + pages_per_chunk, total_pages))
+        for start_page in range(0, total_pages, pages_per_chunk)
+    ]
+
+def _slugify(title, max_length=40):
+    """Make a chapter title safe to use in a file name."""
+    slug = re.sub(r'\W+', '-', title).strip('-')
+    return slug[:max_length].rstrip('-') or "untitled"
+
+def chunk_output_path(output_dir, stem, chunk_num, start_page, end_page, title=None):
+    """Return the output path for one chunk."""
+    if title:
+        return output_dir / f"{stem}_part{chunk_num}_{_slugify(title)}_pages{start_page+1}-{end_page}.pdf"
+    return output_dir / f"{stem}_part{chunk_num}_pages{start_page+1}-{end_page}.pdf"
+
+def _sidecar_key(input_path, version):
+    """Cache key for sidecar indexes: format version plus file size and mtime."""
+    stat = Path(input_path).stat()
+    return {"version": version, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def _load_sidecar(cache_path, key):
+    """Return the cached payload if the sidecar exists and its key matches."""
+    if not cache_path.exists():
+        return None
+    try:
+        cached = json.loads(cache_path.read_text())
+    except ValueError:
+        return None
+    if cached.get("key") != key:
+        return None
+    return cached
+
+def _save_sidecar(cache_path, key, payload):
+    cache_path.write_text(json.dumps({"key": key, **payload}))
+
+def _object_cost(obj):
+    """Approximate serialized size of a resolved PDF object."""
+    if isinstance(obj, StreamObject):
+        return len(getattr(obj, "_data", b"") or b"") + OBJECT_OVERHEAD
+    return len(str(obj)) + OBJECT_OVERHEAD
+
+def _page_objects(page, costs):
+    """Collect the indirect objects a page references, filling costs as we go.
+
+    Returns the list of object numbers reachable from the page's content
+    streams and resources (XObjects, fonts, images, ICC profiles, ...).
+    """
+    seen = set()
+    pending = [page]
+    while pending:
+        obj = pending.pop()
+        if isinstance(obj, IndirectObject):
+            if obj.idnum in seen:
+                continue
+            seen.add(obj.idnum)
+            resolved = obj.get_object()
+            if obj.idnum not in costs:
+                costs[obj.idnum] = _object_cost(resolved)
+            obj = resolved
+        if isinstance(obj, DictionaryObject):
+            for key, value in obj.items():
+                if key not in SKIP_KEYS:
+                    pending.append(value)
+        elif isinstance(obj, ArrayObject):
+            pending.extend(obj)
+    return sorted(seen)
+
+def page_index_path(input_path):
+    """Return the sidecar path that caches the per-page cost index."""
+    input_path = Path(input_path)
+    return input_path.with_name(f"{input_path.stem}.pageindex.json")
+
+def build_page_index(input_path, reader=None):
+    """Build (or load from the sidecar cache) the per-page byte-cost index.
+
+    The index maps every referenced object number to its approximate cost and
+    lists, per page, the objects that page needs. Shared fonts and images are
+    therefore only counted once per chunk when packing.
+    """
+    input_path = Path(input_path)
+    key = _sidecar_key(input_path, PAGE_INDEX_VERSION)
+    cache_path = page_index_path(input_path)
+
+    cached = _load_sidecar(cache_path, key)
+    if cached is not None:
+        return {
+            "objects": {int(num): cost for num, cost in cached["objects"].items()},
+            "pages": cached["pages"],
+        }
+
+    reader = reader or PdfReader(input_path)
+    costs = {}
+    pages = []
+    for page in reader.pages:
+        pages.append(_page_objects(page.indirect_reference or page, costs))
+    index = {"objects": costs, "pages": pages}
+
+    _save_sidecar(cache_path, key, index)
+    return index
+
+def size_ranges(index, max_chunk_bytes):
+    """Greedily pack consecutive pages into chunks under a byte budget.
+
+    A page's cost only counts objects not already in the current chunk. A
+    single page larger than the budget gets a chunk of its own.
+    """
+    costs = index["objects"]
+    ranges = []
+    start_page = 0
+    chunk_objects = set()
+    chunk_bytes = 0
+    for page_num, objects in enumerate(index["pages"]):
+        new_objects = [num for num in objects if num not in chunk_objects]
+        added = sum(costs[num] for num in new_objects)
+        if page_num > start_page and chunk_bytes + added > max_chunk_bytes:
+            ranges.append((start_page, page_num))
+            start_page = page_num
+            chunk_objects = set()
+            new_objects = objects
+            added = sum(costs[num] for num in objects)
+            chunk_bytes = 0
+        chunk_objects.update(new_objects)
+        chunk_bytes += added
+    if index["pages"]:
+        ranges.append((start_page, len(index["pages"])))
+    return ranges
+
+def outline_index_path(input_path):
+    """Return the sidecar path that caches the outline index."""
+    input_path = Path(input_path)
+    return input_path.with_name(f"{input_path.stem}.outline.json")
+
+def build_outline_index(input_path, reader=None):
+    """Build (or load from the sidecar cache) the document's outline index.
+
+    The bookmark tree is walked once and flattened into a list of
+    {"level", "title", "page"} entries sorted by page, with level 1 for
+    top-level bookmarks. Every level is kept, so splitting at a different
+    level reuses the same index.
+    """
+    input_path = Path(input_path)
+    key = _sidecar_key(input_path, OUTLINE_INDEX_VERSION)
+    cache_path = outline_index_path(input_path)
+
+    cached = _load_sidecar(cache_path, key)
+    if cached is not None:
+        return cached["entries"]
+
+    reader = reader or PdfReader(input_path)
+    entries = []
+
+    def walk(items, level):
+        for item in items:
+            if isinstance(item, list):
+                walk(item, level + 1)
+                continue
+            page_num = reader.get_destination_page_number(item)
+            if page_num is None or page_num < 0:
+                continue
+            entries.append({"level": level, "title": str(item.title).strip(), "page": page_num})
+
+    walk(reader.outline, 1)
+    entries.sort(key=lambda entry: (entry["page"], entry["level"]))
+
+    _save_sidecar(cache_path, key, {"entries": entries})
+    return entries
+
+def _outline_starts(entries, level, start_page, end_page):
+    """(page, title) of each entry at or above level inside [start_page, end_page)."""
+    starts = []
+    for entry in entries:
+        if entry["level"] > level or not start_page <= entry["page"] < end_page:
+            continue
+        if starts and starts[-1][0] == entry["page"]:
+            continue  # several bookmarks on one page: keep the first title
+        starts.append((entry["page"], entry["title"]))
+    return starts
+
+def _section_ranges(entries, start_page, end_page, title, level, max_pages):
+    """Split one outline section into (start, end, title) ranges under max_pages.
+
+    An oversized section is cut at its entries one outline level deeper, and
+    only a section with no deeper entries falls back to fixed page counts.
+    """
+    if not max_pages or end_page - start_page <= max_pages:
+        return [(start_page, end_page, title)]
+    if not any(entry["level"] > level and start_page < entry["page"] < end_page for entry in entries):
+        return [(start_page + sub_start, start_page + sub_end, title)
+                for sub_start, sub_end in chunk_ranges(end_page - start_page, max_pages)]
+
+    # Pages before the first subsection keep the section's title
+    starts = [(start_page, title)] + _outline_starts(entries, level + 1, start_page + 1, end_page)
+    ranges = []
+    for idx, (sub_start, sub_title) in enumerate(starts):
+        sub_end = starts[idx + 1][0] if idx + 1 < len(starts) else end_page
+        ranges += _section_ranges(entries, sub_start, sub_end, sub_title, level + 1, max_pages)
+    return ranges
+
+def outline_ranges(entries, total_pages, level=1, max_pages=None):
+    """Turn outline entries into (start, end, title) chunk ranges.
+
+    A chunk starts at every entry at or above the requested level. Pages
+    before the first entry become a "Front matter" chunk. With max_pages set,
+    longer chapters are split at their subsections, or into parts under that
+    cap when they have none.
+    """
+    starts = _outline_starts(entries, level, 0, total_pages)
+    if not starts or starts[0][0] > 0:
+        starts.insert(0, (0, "Front matter"))
+
+    ranges = []
+    for idx, (start_page, title) in enumerate(starts):
+        end_page = starts[idx + 1][0] if idx + 1 < len(starts) else total_pages
+        if end_page > start_page:
+            ranges += _section_ranges(entries, start_page, end_page, title, level, max_pages)
+    return ranges
+
+def write_chunk(reader, output_path, start_page, end_page, compact=False):
+    """Write pages [start_page, end_page) of an open reader to output_path.
+
+    With compact=True, identical objects inside the chunk are merged and the
+    page content streams are recompressed before writing.
+    """
+    writer = PdfWriter()
+    for page_num in range(start_page, end_page):
+        writer.add_page(reader.pages[page_num])
+
+    if compact:
+        for page in writer.pages:
+            page.compress_content_streams(level=9)
+        writer.compress_identical_objects()
+
+    with open(output_path, 'wb') as output_file:
+        writer.write(output_file)
+
+def _write_chunk_batch(input_path, jobs, compact=False):
+    """Worker entry point: open a private reader and write a batch of chunks."""
+    reader = PdfReader(input_path)
+    for output_path, start_page, end_page in jobs:
+        write_chunk(reader, output_path, start_page, end_page, compact)
+    return jobs
+
+def _batch_jobs(jobs, workers):
+    """Group jobs into contiguous batches, one per worker."""
+    batch_size = -(-len(jobs) // workers)
+    return [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+
+def print_size_report(input_path, output_paths):
+    """Print input bytes against the total bytes written across all chunks."""
+    input_bytes = Path(input_path).stat().st_size
+    output_bytes = sum(Path(path).stat().st_size for path in output_paths)
+    ratio = output_bytes / input_bytes if input_bytes else 0
+    print(f"Size: input {input_bytes:,} bytes, output {output_bytes:,} bytes ({ratio:.2f}x)")
+
+def plan_chunks(input_path, reader, output_dir, pages_per_chunk=20, max_chunk_mb=None, outline_level=None,
+                max_pages=None):
+    """Return the (output_path, start_page, end_page) jobs for one PDF."""
+    total_pages = len(reader.pages)
+
+    titles = None
+    if outline_level:
+        entries = build_outline_index(input_path, reader)
+        if not entries:
+            print("No outline found; falling back to page-count chunks")
+            ranges = chunk_ranges(total_pages, pages_per_chunk)
+        else:
+            outline = outline_ranges(entries, total_pages, outline_level, max_pages)
+            ranges = [(start_page, end_page) for start_page, end_page, _ in outline]
+            titles = [title for _, _, title in outline]
+    elif max_chunk_mb:
+        index = build_page_index(input_path, reader)
+        ranges = size_ranges(index, max_chunk_mb * 1024 * 1024)
+    else:
+        ranges = chunk_ranges(total_pages, pages_per_chunk)
+
+    return [
+        (chunk_output_path(output_dir, input_path.stem, chunk_num, start_page, end_page,
+                           titles[chunk_num - 1] if titles else None), start_page, end_page)
+        for chunk_num, (start_page, end_page) in enumerate(ranges, start=1)
+    ]
+
+def split_pdf(input_path, pages_per_chunk=20, workers=1, timing=False, max_chunk_mb=None, compact=False,
+              outline_level=None, max_pages=None):
+    """Split a PDF into smaller chunks.
+
+    With workers > 1 the page ranges are handed to a process pool; each worker
+    opens its own PdfReader. Output names are the same as the serial path.
+
+    With max_chunk_mb set, pages_per_chunk is ignored and consecutive pages are
+    packed into chunks whose estimated size stays under the budget.
+
+    With compact=True each chunk merges duplicate objects and recompresses its
+    content streams, and an input-vs-output byte report is printed.
+
+    With outline_level set, chunks follow the bookmark tree: one chunk per
+    outline entry at that level (1 = top level). Chunk names carry the chapter
+    title. With max_pages also set, chapters longer than that are split at
+    their subsections, and at fixed page counts only when they have none.
+    """
+    started = time.perf_counter()
     input_path = Path(input_path)
     reader = PdfReader(input_path)
     total_pages = len(reader.pages)
@@ -18,31 +344,344 @@ def split_pdf(input_path, pages_per_chunk=20):
     output_dir = input_path.parent / f"{input_path.stem}_split"
     output_dir.mkdir(exist_ok=True)
 
+    jobs = plan_chunks(input_path, reader, output_dir, pages_per_chunk, max_chunk_mb, outline_level, max_pages)
+
     # Split into chunks
-    chunk_num = 1
-    for start_page in range(0, total_pages, pages_per_chunk):
-        end_page = min(start_page + pages_per_chunk, total_pages)
+    if workers > 1 and len(jobs) > 1:
+        batches = _batch_jobs(jobs, workers)
+        with ProcessPoolExecutor(max_workers=min(workers, len(batches))) as pool:
+            for done in pool.map(_write_chunk_batch, [input_path] * len(batches), batches,
+                                 [compact] * len(batches)):
+                for output_path, start_page, end_page in done:
+                    print(f"  Created: {output_path.name} (pages {start_page+1}-{end_page})")
+    else:
+        for output_path, start_page, end_page in jobs:
+            write_chunk(reader, output_path, start_page, end_page, compact)
+            print(f"  Created: {output_path.name} (pages {start_page+1}-{end_page})")
 
-        writer = PdfWriter()
-        for page_num in range(start_page, end_page):
-            writer.add_page(reader.pages[page_num])
+    print(f"Split complete! {len(jobs)} chunks created in {output_dir}")
+
+    if compact:
+        print_size_report(input_path, [output_path for output_path, _, _ in jobs])
+
+    if timing:
+        elapsed = time.perf_counter() - started
+        rate = total_pages / elapsed if elapsed > 0 else float('inf')
+        print(f"Wall time: {elapsed:.2f}s ({rate:.1f} pages/sec, workers={workers})")
+
+    return output_dir
+
+def page_refs_path(input_path):
+    """Return the sidecar path that caches page object locations."""
+    input_path = Path(input_path)
+    return input_path.with_name(f"{input_path.stem}.pagerefs.json")
+
+def load_page_refs(input_path):
+    """Return [(object number, generation), ...] for every page, cached on disk.
+
+    The sidecar is keyed by file size, mtime and SHA-256. The common case only
+    compares size and mtime; the hash is checked when the mtime moved but the
+    size did not (a touched or copied file), so the index survives that
+    without a page-tree walk.
+    """
+    input_path = Path(input_path)
+    key = _sidecar_key(input_path, PAGE_REFS_VERSION)
+    cache_path = page_refs_path(input_path)
 
-        output_path = output_dir / f"{input_path.stem}_part{chunk_num}_pages{start_page+1}-{end_page}.pdf"
+    cached = _load_sidecar(cache_path, key)
+    if cached is not None:
+        return [tuple(ref) for ref in cached["pages"]]
+
+    sha256 = file_sha256(input_path)
+    if cache_path.exists():
+        try:
+            stale = json.loads(cache_path.read_text())
+        except ValueError:
+            stale = {}
+        stale_key = stale.get("key", {})
+        if (stale_key.get("version") == key["version"] and stale_key.get("size") == key["size"]
+                and stale.get("sha256") == sha256):
+            _save_sidecar(cache_path, key, {"sha256": sha256, "pages": stale["pages"]})
+            return [tuple(ref) for ref in stale["pages"]]
+
+    reader = PdfReader(input_path)
+    pages = [(page.indirect_reference.idnum, page.indirect_reference.generation) for page in reader.pages]
+    _save_sidecar(cache_path, key, {"sha256": sha256, "pages": pages})
+    return pages
+
+def _load_page(reader, idnum, generation):
+    """Resolve a single page object, pulling inherited attributes from its ancestors."""
+    page = PageObject(reader, IndirectObject(idnum, generation, reader))
+    node = page
+    while any(key not in page for key in INHERITABLE_KEYS) and "/Parent" in node:
+        node = node["/Parent"].get_object()
+        for key in INHERITABLE_KEYS:
+            if key not in page and key in node:
+                page[NameObject(key)] = node[key]
+    return page
+
+def _parse_page_ranges(ranges):
+    """Normalise 1-based page numbers or inclusive (first, last) pairs to 0-based indexes."""
+    page_nums = []
+    for item in ranges:
+        if isinstance(item, int):
+            page_nums.append(item - 1)
+        else:
+            first, last = item
+            page_nums.extend(range(first - 1, last))
+    return page_nums
+
+def extract_pages(input_path, ranges, output_path=None):
+    """Copy selected pages into a new PDF without walking the whole document.
+
+    ranges holds 1-based page numbers or inclusive (first, last) pairs, e.g.
+    [(10, 12), 40]. Page object locations come from the .pagerefs.json sidecar
+    and the file is opened through mmap, so only the objects the requested
+    pages need are parsed.
+    """
+    input_path = Path(input_path)
+    page_refs = load_page_refs(input_path)
+    page_nums = _parse_page_ranges(ranges)
+    for page_num in page_nums:
+        if not 0 <= page_num < len(page_refs):
+            raise ValueError(f"Page {page_num + 1} out of range (1-{len(page_refs)})")
+
+    if output_path is None:
+        spec = "_".join(
+            f"{item}" if isinstance(item, int) else f"{item[0]}-{item[1]}" for item in ranges
+        )
+        output_path = input_path.parent / f"{input_path.stem}_pages{spec}.pdf"
+
+    with open(input_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        reader = PdfReader(data)
+        writer = PdfWriter()
+        for page_num in page_nums:
+            writer.add_page(_load_page(reader, *page_refs[page_num]))
         with open(output_path, 'wb') as output_file:
             writer.write(output_file)
 
-        print(f"  Created: {output_path.name} (pages {start_page+1}-{end_page})")
-        chunk_num += 1
+    print(f"Extracted {len(page_nums)} pages into {output_path}")
+    return Path(output_path)
 
-    print(f"Split complete! {chunk_num-1} chunks created in {output_dir}")
-    return output_dir
+def _extract_text(reader, start_page, end_page):
+    """Extract and join the text of pages [start_page, end_page)."""
+    return "\n".join(reader.pages[page_num].extract_text() or "" for page_num in range(start_page, end_page))
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python split_pdf.py <pdf_file> [pages_per_chunk]")
-        sys.exit(1)
+def _extract_text_worker(input_path, start_page, end_page):
+    """Worker entry point: extract one chunk's text with a per-process reader."""
+    reader = _WORKER_READERS.get(input_path)
+    if reader is None:
+        reader = _WORKER_READERS[input_path] = PdfReader(input_path)
+    return _extract_text(reader, start_page, end_page)
 
-    input_file = sys.argv[1]
-    pages_per_chunk = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+def iter_chunk_text(input_path, pages_per_chunk=20, workers=1):
+    """Yield ((start_page, end_page), text) for each chunk, in page order.
+
+    No intermediate PDFs are written. With workers > 1 chunks are extracted in
+    a process pool; at most one chunk per worker is in flight, so memory stays
+    bounded however long the book is.
+    """
+    input_path = Path(input_path)
+    reader = PdfReader(input_path)
+    ranges = chunk_ranges(len(reader.pages), pages_per_chunk)
 
-    split_pdf(input_file, pages_per_chunk)
+    if workers <= 1:
+        for start_page, end_page in ranges:
+            yield (start_page, end_page), _extract_text(reader, start_page, end_page)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start_page, end_page in ranges:
+            pending.append(((start_page, end_page), pool.submit(_extract_text_worker, input_path, start_page, end_page)))
+            if len(pending) >= workers:
+                chunk_range, future = pending.popleft()
+                yield chunk_range, future.result()
+        while pending:
+            chunk_range, future = pending.popleft()
+            yield chunk_range, future.result()
+
+def write_text_jsonl(input_path, output_path, pages_per_chunk=20, workers=1):
+    """Stream chunk text to a JSONL file, one {"source", "pages", "text"} record per chunk."""
+    input_path = Path(input_path)
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for (start_page, end_page), text in iter_chunk_text(input_path, pages_per_chunk, workers):
+            record = {"source": input_path.name, "pages": [start_page + 1, end_page], "text": text}
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    print(f"Extracted text from {count} chunks into {output_path}")
+    return output_path
+
+def file_sha256(path):
+    """Return the hex SHA-256 of a file, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _split_for_manifest(input_path, settings, chunks=None):
+    """Batch worker: split one PDF and return its chunk records.
+
+    With chunks given (records from a previous manifest), only those chunks
+    are rewritten; otherwise the PDF is planned and split from scratch.
+    """
+    input_path = Path(input_path)
+    reader = PdfReader(input_path)
+    output_dir = input_path.parent / f"{input_path.stem}_split"
+    output_dir.mkdir(exist_ok=True)
+
+    if chunks is None:
+        jobs = plan_chunks(input_path, reader, output_dir, settings["pages_per_chunk"],
+                           settings["max_chunk_mb"], settings["outline_level"], settings["max_pages"])
+    else:
+        jobs = [(input_path.parent / chunk["file"], chunk["start"], chunk["end"]) for chunk in chunks]
+
+    records = []
+    for output_path, start_page, end_page in jobs:
+        write_chunk(reader, output_path, start_page, end_page, settings["compact"])
+        records.append({
+            "file": output_path.relative_to(input_path.parent).as_posix(),
+            "start": start_page,
+            "end": end_page,
+            "sha256": file_sha256(output_path),
+        })
+    return records
+
+def _write_manifest(manifest_path, manifest):
+    """Write the manifest to a temporary file and rename it into place."""
+    tmp = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    tmp.replace(manifest_path)
+
+def _stale_chunks(input_dir, chunks):
+    """Return the manifest chunk records whose file is missing or corrupt."""
+    stale = []
+    for chunk in chunks:
+        path = input_dir / chunk["file"]
+        if not path.exists() or file_sha256(path) != chunk["sha256"]:
+            stale.append(chunk)
+    return stale
+
+def split_directory(input_dir, pages_per_chunk=20, workers=1, timing=False, max_chunk_mb=None,
+                    compact=False, outline_level=None, max_pages=None):
+    """Split every PDF in a directory, one PDF per worker process.
+
+    A split_manifest.json in the directory records each input's content hash,
+    the settings used, and every chunk's page range and output hash. On re-run
+    PDFs whose hash and settings are unchanged are skipped, and only their
+    missing or corrupt chunks are regenerated. The manifest is rewritten as
+    each PDF finishes, so an interrupted or failed batch resumes where it
+    stopped.
+    """
+    started = time.perf_counter()
+    input_dir = Path(input_dir)
+    manifest_path = input_dir / MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    settings = {
+        "pages_per_chunk": pages_per_chunk,
+        "max_chunk_mb": max_chunk_mb,
+        "outline_level": outline_level,
+        "max_pages": max_pages,
+        "compact": compact,
+    }
+
+    pdfs = sorted(input_dir.glob("*.pdf"))
+    print(f"Processing: {input_dir} ({len(pdfs)} PDFs)")
+
+    tasks = {}
+    hashes = {}
+    for pdf in pdfs:
+        hashes[pdf.name] = file_sha256(pdf)
+        entry = manifest.get(pdf.name)
+        if entry and entry["sha256"] == hashes[pdf.name] and entry["settings"] == settings:
+            stale = _stale_chunks(input_dir, entry["chunks"])
+            if not stale:
+                print(f"  Skipped: {pdf.name} (unchanged)")
+                continue
+            print(f"  Repairing: {pdf.name} ({len(stale)} missing or corrupt chunks)")
+            tasks[pdf.name] = stale
+        else:
+            tasks[pdf.name] = None
+
+    # Drop entries for PDFs that were removed from the directory
+    manifest = {name: entry for name, entry in manifest.items() if name in hashes}
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(_split_for_manifest, input_dir / name, settings, chunks): name
+            for name, chunks in tasks.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                records = future.result()
+            except Exception as e:
+                print(f"  Failed: {name} ({e})")
+                failed.append(name)
+                continue
+            if tasks[name] is None:
+                old_chunks = manifest.get(name, {}).get("chunks", [])
+                new_files = {record["file"] for record in records}
+                for chunk in old_chunks:
+                    if chunk["file"] not in new_files:
+                        (input_dir / chunk["file"]).unlink(missing_ok=True)
+                manifest[name] = {"sha256": hashes[name], "settings": settings, "chunks": records}
+            else:
+                rewritten = {record["file"]: record for record in records}
+                manifest[name]["chunks"] = [rewritten.get(chunk["file"], chunk) for chunk in manifest[name]["chunks"]]
+            _write_manifest(manifest_path, manifest)
+            print(f"  Split: {name} ({len(records)} chunks written)")
+
+    _write_manifest(manifest_path, manifest)
+    print(f"Batch complete! {len(tasks) - len(failed)} of {len(pdfs)} PDFs split, manifest in {manifest_path}")
+
+    if timing:
+        elapsed = time.perf_counter() - started
+        print(f"Wall time: {elapsed:.2f}s (workers={workers})")
+
+    if failed:
+        raise SystemExit(f"Failed to split: {', '.join(sorted(failed))}")
+    return manifest_path
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Split a PDF into smaller chunks.")
+    parser.add_argument("pdf_file", help="PDF file to split, or a directory to split every PDF in it")
+    parser.add_argument("pages_per_chunk", nargs="?", type=int, default=20,
+                        help="pages per chunk (default: 20)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="write chunks (or, for a directory, PDFs) in N worker processes (default: 1)")
+    parser.add_argument("--timing", action="store_true",
+                        help="report wall time and pages/sec")
+    parser.add_argument("--max-chunk-mb", type=float, default=None,
+                        help="pack pages into chunks under this estimated size instead of a page count")
+    parser.add_argument("--by-outline", nargs="?", type=int, const=1, default=None, metavar="LEVEL",
+                        help="one chunk per outline entry at LEVEL (default: 1)")
+    parser.add_argument("--max-pages", type=int, default=None,
+                        help="with --by-outline, split chapters longer than this at their subsections")
+    parser.add_argument("--text-jsonl", metavar="OUT",
+                        help="write chunk text to OUT as JSONL instead of writing PDF chunks")
+    parser.add_argument("--extract", metavar="PAGES",
+                        help="copy only these pages (e.g. 10-12,40) into a new PDF using the cached page index")
+    parser.add_argument("--compact", action="store_true",
+                        help="merge duplicate objects, recompress content streams and report sizes")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.extract:
+        ranges = [
+            tuple(int(n) for n in part.split("-")) if "-" in part else int(part)
+            for part in args.extract.split(",")
+        ]
+        extract_pages(args.pdf_file, ranges)
+        raise SystemExit(0)
+    if args.text_jsonl:
+        write_text_jsonl(args.pdf_file, args.text_jsonl, args.pages_per_chunk, workers=args.workers)
+        raise SystemExit(0)
+    split = split_directory if Path(args.pdf_file).is_dir() else split_pdf
+    split(args.pdf_file, args.pages_per_chunk, workers=args.workers, timing=args.timing,
+          max_chunk_mb=args.max_chunk_mb, compact=args.compact, outline_level=args.by_outline,
+          max_pages=args.max_pages)